@@ -24,3 +24,4 @@ ANNOTATION_OWNER_UID = f"{API_GROUP}/owner-uid"
 
 # Configuration constants
 EXECUTOR_SERVICE_ACCOUNT_ENV = "EXECUTOR_SERVICE_ACCOUNT"
+SCHEDULE_PERIODIC_REQUEUE_ENV = "SCHEDULE_PERIODIC_REQUEUE"
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import os
+from collections.abc import Callable
 from contextlib import suppress
 from datetime import UTC, datetime
 from time import monotonic
-from typing import Any
+from typing import Any, cast
 
 import kopf
 from kubernetes import client, config
 from prometheus_client import start_http_server
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
 
 from . import logging as structured_logging
 from . import metrics
@@ -25,20 +31,57 @@ from .constants import (
     LABEL_OWNER_NAME,
     LABEL_OWNER_UID,
     LABEL_RUN_ID,
+    SCHEDULE_PERIODIC_REQUEUE_ENV,
 )
+from .services.cronjob_cache import cronjob_cache
 from .services.dependencies import dependency_service
 from .services.git import GitService
 from .services.manual_run import manual_run_service
+from .services.status_patches import status_patch_service
 from .utils.schedule import compute_computed_schedule
 
 FINALIZER_REPOSITORY = f"{API_GROUP}/finalizer"
 
+_status_flush_task: asyncio.Task[None] | None = None
+
+_PERIODIC_REQUEUE_INTERVAL = 900  # 15 minutes
+_REQUEUE_BACKOFF_MAX = 4 * 3600
+# Schedule UID -> (monotonic time before which reads are skipped, consecutive failures)
+_REQUEUE_BACKOFF: dict[str, tuple[float, int]] = {}
+
+# CronJob UID -> (lastScheduleTime, nextScheduleTime) last copied into its Schedule
+_CRONJOB_SCHEDULE_TIMES: dict[str, tuple[str | None, str | None]] = {}
+
+# Schedule UID -> status fields last written for it from CronJob/Job events
+_LAST_STATUS_SENT: dict[str, dict[str, Any]] = {}
+
 
 def _get_executor_service_account() -> str | None:
     """Get the executor ServiceAccount name from environment variable."""
     return os.getenv(EXECUTOR_SERVICE_ACCOUNT_ENV)
 
 
+@functools.lru_cache(maxsize=1)
+def _batch_api() -> client.BatchV1Api:
+    """Shared BatchV1Api so hot paths reuse one connection pool."""
+    return client.BatchV1Api()
+
+
+@functools.lru_cache(maxsize=1)
+def _custom_api() -> client.CustomObjectsApi:
+    """Shared CustomObjectsApi so hot paths reuse one connection pool."""
+    return client.CustomObjectsApi()
+
+
+def _periodic_requeue_enabled(**_: Any) -> bool:
+    """Whether the polling fallback for Schedule nextRunTime is enabled.
+
+    nextRunTime is normally propagated by the CronJob watch in
+    ``handle_cronjob_event``; the periodic requeue is opt-in.
+    """
+    return os.getenv(SCHEDULE_PERIODIC_REQUEUE_ENV, "false").lower() in ("1", "true", "yes")
+
+
 def _can_safely_adopt_cronjob(
     existing_cj: Any, owner_uid: str, owner_name: str, namespace: str
 ) -> tuple[bool, str]:
@@ -107,6 +150,22 @@ def configure(settings: kopf.OperatorSettings, **_: Any) -> None:
             return
 
 
+@kopf.on.startup()
+async def start_status_patch_flusher(**_: Any) -> None:
+    """Start the background task that writes coalesced status patches."""
+    global _status_flush_task
+    _status_flush_task = asyncio.create_task(status_patch_service.run(_custom_api))
+
+
+@kopf.on.cleanup()
+async def stop_status_patch_flusher(**_: Any) -> None:
+    """Stop the status flusher, writing any patches still queued."""
+    if _status_flush_task is not None:
+        _status_flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await _status_flush_task
+
+
 @kopf.on.startup()
 def rebuild_dependency_indices(**_: Any) -> None:
     """Rebuild dependency indices on operator startup to ensure cross-resource triggers work."""
@@ -1107,9 +1166,9 @@ def handle_manual_run_job_completion(event: dict[str, Any], **_: Any) -> None:
         return
 
     # Parse owner name (format: namespace.playbook-name)
-    if "." not in owner_name:
+    owner_namespace, sep, playbook_name = owner_name.partition(".")
+    if not sep:
         return
-    owner_namespace, playbook_name = owner_name.split(".", 1)
 
     # Only process if in the same namespace
     if owner_namespace != namespace:
@@ -1574,6 +1633,9 @@ def reconcile_schedule(
         schedule_expr = (spec or {}).get("schedule") or ""
         computed, used_macro = compute_computed_schedule(schedule_expr, uid)
         patch.status["computedSchedule"] = computed
+        # Kopf writes this handler's status itself, so what CronJob/Job events
+        # last sent may no longer match the stored status
+        _LAST_STATUS_SENT.pop(uid, None)
 
         # Validate playbook reference
         playbook_ref = (spec or {}).get("playbookRef") or {}
@@ -2004,21 +2066,84 @@ def reconcile_schedule(
         raise
 
 
-@kopf.timer(API_GROUP_VERSION, "schedules", interval=900)  # 15 minutes
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp, memoised since stored values rarely change."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _compute_next_run_patch(
+    current_next_run: str | None, next_schedule_time: datetime | None
+) -> dict[str, Any] | None:
+    """Return the Schedule status patch for a CronJob nextScheduleTime, or None.
+
+    None means there is nothing to write: the CronJob has no next schedule yet,
+    or the Schedule already records the same nextRunTime.
+    """
+    if not next_schedule_time:
+        return None
+
+    # Kubernetes serialises timestamps as RFC 3339 in UTC with a "Z" suffix; write
+    # the same canonical form so the value compares equal to what we stored.
+    if next_schedule_time.tzinfo is None:
+        next_schedule_time = next_schedule_time.replace(tzinfo=UTC)
+    if current_next_run:
+        try:
+            if _parse_iso(current_next_run) == next_schedule_time:
+                return None
+        except ValueError:
+            pass  # Unparseable value; overwrite it with the canonical form
+
+    next_schedule_iso = next_schedule_time.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {"status": {"nextRunTime": next_schedule_iso}}
+
+
+def _read_next_schedule_time(name: str, namespace: str) -> datetime | None:
+    """Read a CronJob's status.nextScheduleTime, preferring the watch cache.
+
+    Only CronJobs the watch has not delivered yet are fetched from the API. The
+    raw JSON response is decoded directly instead of being converted into the
+    full ``V1CronJob`` model tree, which is only needed for one field here.
+    """
+    cronjob_status = cronjob_cache.get(namespace, name)
+    if cronjob_status is None:
+        response = cast(
+            HTTPResponse,
+            _batch_api().read_namespaced_cron_job(name, namespace, _preload_content=False),
+        )
+        cronjob_status = json.loads(response.data).get("status", {})
+    next_schedule_time = cronjob_status.get("nextScheduleTime")
+    return _parse_iso(next_schedule_time) if next_schedule_time else None
+
+
+@kopf.timer(
+    API_GROUP_VERSION,
+    "schedules",
+    interval=_PERIODIC_REQUEUE_INTERVAL,
+    when=_periodic_requeue_enabled,
+)
 def periodic_schedule_requeue(
     name: str,
     namespace: str,
     uid: str,
     spec: dict[str, Any],
     status: dict[str, Any],
+    meta: kopf.Meta | None = None,
     **_: Any,
 ) -> None:
     """
     Periodic soft requeue for Schedule to refresh nextRunTime if needed.
 
-    This timer runs every 15 minutes to ensure Schedule resources have up-to-date
-    nextRunTime values without causing busy loops. The requeue is "soft" because
-    it only triggers reconciliation if the nextRunTime needs refreshing.
+    The CronJob watch (``handle_cronjob_event``) already copies
+    ``status.nextScheduleTime`` into the Schedule whenever the CronJob controller
+    advances it, so this timer is a polling fallback that only runs when
+    ``SCHEDULE_PERIODIC_REQUEUE`` is enabled. The requeue is "soft" because it
+    only patches the Schedule if the nextRunTime needs refreshing.
+
+    Failed CronJob reads back off exponentially per Schedule; unexpected errors
+    propagate so Kopf reports and retries them.
     """
     structured_logging.logger.debug(
         "Periodic Schedule requeue triggered",
@@ -2029,74 +2154,27 @@ def periodic_schedule_requeue(
         reason="TimerExpired",
     )
 
-    # Get current CronJob to check if nextRunTime needs updating
-    try:
-        batch_api = client.BatchV1Api()
-        cronjob_name = f"schedule-{name}"
-
-        # Try to get the CronJob
-        cronjob = batch_api.read_namespaced_cron_job(cronjob_name, namespace)
-        cronjob_status = cronjob.status
-
-        # Check if we have a nextScheduleTime from the CronJob
-        next_schedule_time = cronjob_status.next_schedule_time
-        if next_schedule_time:
-            # Convert to ISO format for comparison
-            next_schedule_iso = next_schedule_time.isoformat() + "Z"
-
-            # Check if the Schedule's nextRunTime needs updating
-            current_next_run_time = status.get("nextRunTime")
-
-            if current_next_run_time != next_schedule_iso:
-                # Update the Schedule's nextRunTime
-                api = client.CustomObjectsApi()
-                patch_body = {
-                    "status": {
-                        "nextRunTime": next_schedule_iso,
-                    }
-                }
-
-                api.patch_namespaced_custom_object_status(
-                    group=API_GROUP,
-                    version="v1alpha1",
-                    namespace=namespace,
-                    plural="schedules",
-                    name=name,
-                    body=patch_body,
-                    field_manager="ansible-operator",
-                )
-
-                structured_logging.logger.info(
-                    "Schedule nextRunTime updated via periodic requeue",
-                    controller="Schedule",
-                    resource=f"{namespace}/{name}",
-                    uid=uid,
-                    event="periodic-requeue",
-                    reason="NextRunTimeUpdated",
-                    next_run_time=next_schedule_iso,
-                )
-            else:
-                structured_logging.logger.debug(
-                    "Schedule nextRunTime is up-to-date, no update needed",
-                    controller="Schedule",
-                    resource=f"{namespace}/{name}",
-                    uid=uid,
-                    event="periodic-requeue",
-                    reason="NoUpdateNeeded",
-                )
-        else:
-            structured_logging.logger.debug(
-                "CronJob has no nextScheduleTime, skipping update",
-                controller="Schedule",
-                resource=f"{namespace}/{name}",
-                uid=uid,
-                event="periodic-requeue",
-                reason="NoNextScheduleTime",
-            )
+    # Back off after apiserver errors instead of retrying on every tick
+    retry_at, failures = _REQUEUE_BACKOFF.get(uid, (0.0, 0))
+    if monotonic() < retry_at:
+        structured_logging.logger.debug(
+            "Periodic requeue backing off after CronJob read failures",
+            controller="Schedule",
+            resource=f"{namespace}/{name}",
+            uid=uid,
+            event="periodic-requeue",
+            reason="BackingOff",
+            failures=failures,
+        )
+        return
 
-    except client.exceptions.ApiException as e:
-        if e.status == 404:
+    # Look up the CronJob (watch cache first) to check if nextRunTime needs updating
+    try:
+        next_schedule_time = _read_next_schedule_time(f"schedule-{name}", namespace)
+    except (client.exceptions.ApiException, MaxRetryError) as e:
+        if getattr(e, "status", None) == 404:
             # CronJob doesn't exist yet, which is normal for new Schedules
+            _REQUEUE_BACKOFF.pop(uid, None)
             structured_logging.logger.debug(
                 "CronJob not found during periodic requeue, skipping",
                 controller="Schedule",
@@ -2106,6 +2184,9 @@ def periodic_schedule_requeue(
                 reason="CronJobNotFound",
             )
         else:
+            failures += 1
+            delay = min(_PERIODIC_REQUEUE_INTERVAL * 2 ** (failures - 1), _REQUEUE_BACKOFF_MAX)
+            _REQUEUE_BACKOFF[uid] = (monotonic() + delay, failures)
             structured_logging.logger.warning(
                 f"Failed to get CronJob during periodic requeue: {e}",
                 controller="Schedule",
@@ -2114,29 +2195,89 @@ def periodic_schedule_requeue(
                 event="periodic-requeue",
                 reason="CronJobGetFailed",
                 error=str(e),
+                retry_in_seconds=delay,
             )
-    except Exception as e:
-        structured_logging.logger.warning(
-            f"Periodic requeue failed: {e}",
+        return
+
+    _REQUEUE_BACKOFF.pop(uid, None)
+
+    # Check if we have a nextScheduleTime from the CronJob
+    if not next_schedule_time:
+        structured_logging.logger.debug(
+            "CronJob has no nextScheduleTime, skipping update",
             controller="Schedule",
             resource=f"{namespace}/{name}",
             uid=uid,
             event="periodic-requeue",
-            reason="RequeueFailed",
-            error=str(e),
+            reason="NoNextScheduleTime",
         )
+        return
 
+    # Check if the Schedule's nextRunTime needs updating
+    patch_body = _compute_next_run_patch(status.get("nextRunTime"), next_schedule_time)
+    if patch_body is None:
+        structured_logging.logger.debug(
+            "Schedule nextRunTime is up-to-date, no update needed",
+            controller="Schedule",
+            resource=f"{namespace}/{name}",
+            uid=uid,
+            event="periodic-requeue",
+            reason="NoUpdateNeeded",
+        )
+        return
+
+    # Queue the nextRunTime update; concurrent ticks are coalesced. The write is
+    # conditional on the Schedule version this tick saw: on conflict it is
+    # dropped, and the next watch event or tick re-examines the Schedule.
+    status_patch_service.enqueue(
+        "schedules",
+        namespace,
+        name,
+        patch_body["status"],
+        resource_version=meta.get("resourceVersion") if meta else None,
+    )
+
+    structured_logging.logger.info(
+        "Schedule nextRunTime update queued via periodic requeue",
+        controller="Schedule",
+        resource=f"{namespace}/{name}",
+        uid=uid,
+        event="periodic-requeue",
+        reason="NextRunTimeUpdated",
+        next_run_time=patch_body["status"]["nextRunTime"],
+    )
+
+
+def _status_already_sent(owner_uid: str, status: dict[str, Any]) -> bool:
+    """Whether every field in ``status`` equals what was last written for the Schedule."""
+    sent = _LAST_STATUS_SENT.get(owner_uid, {})
+    return all(sent.get(key) == value for key, value in status.items())
+
+
+def _record_status_sent(owner_uid: str, status: dict[str, Any]) -> Callable[[], None]:
+    """Return a flush callback recording ``status`` as written for the Schedule.
+
+    Fields only count as sent once the patch succeeded, so a failed or dropped
+    write does not suppress the next identical update.
+    """
+    sent = dict(status)
+
+    def record() -> None:
+        _LAST_STATUS_SENT.setdefault(owner_uid, {}).update(sent)
+
+    return record
 
-@kopf.on.event("batch", "v1", "cronjobs")
+
+# Only CronJobs managed by ansible-operator are dispatched here
+@kopf.on.event("batch", "v1", "cronjobs", labels={LABEL_MANAGED_BY: "ansible-operator"})
 def handle_cronjob_event(event: dict[str, Any], **_: Any) -> None:
     """Handle CronJob events to update Schedule status fields."""
     cronjob = event.get("object", {})
     metadata = cronjob.get("metadata", {})
     labels = metadata.get("labels", {})
 
-    # Only handle CronJobs managed by ansible-operator
-    if labels.get(LABEL_MANAGED_BY) != "ansible-operator":
-        return
+    # Keep the watch cache current for periodic_schedule_requeue
+    cronjob_cache.observe(event)
 
     # Extract Schedule information from labels
     owner_uid = labels.get(LABEL_OWNER_UID)
@@ -2145,15 +2286,24 @@ def handle_cronjob_event(event: dict[str, Any], **_: Any) -> None:
         return
 
     # Parse owner name (format: namespace.schedule-name)
-    if "." not in owner_name:
+    namespace, sep, schedule_name = owner_name.partition(".")
+    if not sep:
         return
-    namespace, schedule_name = owner_name.split(".", 1)
 
     # Get CronJob status
     status = cronjob.get("status", {})
     last_schedule_time = status.get("lastScheduleTime")
     next_schedule_time = status.get("nextScheduleTime")
 
+    # Most CronJob events (active Job list churn, resyncs) leave the schedule
+    # times untouched; skip the Schedule GET and PATCH unless they moved.
+    cronjob_uid = metadata.get("uid")
+    schedule_times = (last_schedule_time, next_schedule_time)
+    if event.get("type") == "DELETED":
+        _CRONJOB_SCHEDULE_TIMES.pop(cronjob_uid, None)
+    elif cronjob_uid and _CRONJOB_SCHEDULE_TIMES.get(cronjob_uid) == schedule_times:
+        return
+
     # Update Schedule status
     patch_body: dict[str, Any] = {"status": {}}
 
@@ -2164,7 +2314,7 @@ def handle_cronjob_event(event: dict[str, Any], **_: Any) -> None:
         patch_body["status"]["nextRunTime"] = next_schedule_time
 
     # Get Schedule spec to update conditions
-    api = client.CustomObjectsApi()
+    api = _custom_api()
     try:
         schedule_obj = api.get_namespaced_custom_object(
             group=API_GROUP,
@@ -2190,44 +2340,47 @@ def handle_cronjob_event(event: dict[str, Any], **_: Any) -> None:
         # If we can't get the Schedule, just update the time fields
         pass
 
-    # Apply the status update
-    if patch_body["status"]:
-        with suppress(Exception):
-            api.patch_namespaced_custom_object_status(
-                group=API_GROUP,
-                version="v1alpha1",
-                namespace=namespace,
-                plural="schedules",
-                name=schedule_name,
-                body=patch_body,
-                field_manager="ansible-operator",
-            )
-            structured_logging.logger.info(
-                "Schedule status updated from CronJob",
-                controller="Schedule",
-                resource=f"{namespace}/{schedule_name}",
-                uid=owner_uid,
-                event="cronjob",
-                reason="StatusUpdated",
-                last_schedule_time=last_schedule_time,
-                next_schedule_time=next_schedule_time,
-            )
+    # Queue the status update unless it repeats the last one; bursts for the
+    # same Schedule are coalesced
+    if not patch_body["status"] or _status_already_sent(owner_uid, patch_body["status"]):
+        return
+    record_status_sent = _record_status_sent(owner_uid, patch_body["status"])
+    record_times = cronjob_uid and event.get("type") != "DELETED"
+
+    def on_patched() -> None:
+        record_status_sent()
+        # Only record the times once they reached the Schedule, so a failed
+        # write is retried by the next event carrying them
+        if record_times:
+            _CRONJOB_SCHEDULE_TIMES[cronjob_uid] = schedule_times
+
+    status_patch_service.enqueue(
+        "schedules", namespace, schedule_name, patch_body["status"], on_success=on_patched
+    )
+    structured_logging.logger.info(
+        "Schedule status update queued from CronJob",
+        controller="Schedule",
+        resource=f"{namespace}/{schedule_name}",
+        uid=owner_uid,
+        event="cronjob",
+        reason="StatusUpdated",
+        last_schedule_time=last_schedule_time,
+        next_schedule_time=next_schedule_time,
+    )
 
 
-@kopf.on.event("batch", "v1", "jobs")
+# Only Jobs managed by ansible-operator, and not probe Jobs of any type, are dispatched here
+@kopf.on.event(
+    "batch",
+    "v1",
+    "jobs",
+    labels={LABEL_MANAGED_BY: "ansible-operator", "ansible.cloud37.dev/probe-type": kopf.ABSENT},
+)
 def handle_schedule_job_event(event: dict[str, Any], **_: Any) -> None:
     """Handle Job events to update Schedule status fields."""
     job = event.get("object", {})
     metadata = job.get("metadata", {})
-    labels = metadata.get("labels", {})
-
-    # Only handle Jobs managed by ansible-operator (not connectivity probe jobs)
-    if labels.get(LABEL_MANAGED_BY) != "ansible-operator":
-        return
-
-    # Skip connectivity probe jobs
-    if labels.get("ansible.cloud37.dev/probe-type") == "connectivity":
-        return
+    labels = metadata.get("labels") or {}
 
     # Extract Schedule information from labels
     owner_uid = labels.get(LABEL_OWNER_UID)
@@ -2236,9 +2389,9 @@ def handle_schedule_job_event(event: dict[str, Any], **_: Any) -> None:
         return
 
     # Parse owner name (format: namespace.schedule-name)
-    if "." not in owner_name:
+    namespace, sep, schedule_name = owner_name.partition(".")
+    if not sep:
         return
-    namespace, schedule_name = owner_name.split(".", 1)
 
     # Get Job status
     status = job.get("status", {})
@@ -2246,9 +2399,6 @@ def handle_schedule_job_event(event: dict[str, Any], **_: Any) -> None:
     succeeded = status.get("succeeded", 0)
     failed = status.get("failed", 0)
 
-    # Update Schedule status with Job reference
-    patch_body: dict[str, Any] = {"status": {}}
-
     # Record job run metrics
     if succeeded > 0:
         metrics.JOB_RUNS_TOTAL.labels(kind="Schedule", result="success").inc()
@@ -2277,23 +2427,21 @@ def handle_schedule_job_event(event: dict[str, Any], **_: Any) -> None:
             except Exception:
                 pass  # Ignore parsing errors
 
-    # Update lastJobRef
+    # Update Schedule status with the Job reference, lastRunTime from the Job
+    # creation time and the revision from Job annotations, where available
+    patch_status: dict[str, Any] = {}
+    patch_body: dict[str, Any] = {"status": patch_status}
     if job_name:
-        patch_body["status"]["lastJobRef"] = f"{namespace}/{job_name}"
-
-    # Update lastRunTime from Job creation time
+        patch_status["lastJobRef"] = f"{namespace}/{job_name}"
     creation_timestamp = metadata.get("creationTimestamp")
     if creation_timestamp:
-        patch_body["status"]["lastRunTime"] = creation_timestamp
-
-    # Extract revision from Job annotations if available
-    annotations = metadata.get("annotations", {})
-    revision = annotations.get("ansible.cloud37.dev/revision")
+        patch_status["lastRunTime"] = creation_timestamp
+    revision = metadata.get("annotations", {}).get("ansible.cloud37.dev/revision")
     if revision:
-        patch_body["status"]["lastRunRevision"] = revision
+        patch_status["lastRunRevision"] = revision
 
     # Get Schedule spec to update conditions
-    api = client.CustomObjectsApi()
+    api = _custom_api()
     try:
         schedule_obj = api.get_namespaced_custom_object(
             group=API_GROUP,
@@ -2319,28 +2467,27 @@ def handle_schedule_job_event(event: dict[str, Any], **_: Any) -> None:
         # If we can't get the Schedule, just update the time fields
         pass
 
-    # Apply the status update
-    if patch_body["status"]:
-        with suppress(Exception):
-            api.patch_namespaced_custom_object_status(
-                group=API_GROUP,
-                version="v1alpha1",
-                namespace=namespace,
-                plural="schedules",
-                name=schedule_name,
-                body=patch_body,
-                field_manager="ansible-operator",
-            )
-            structured_logging.logger.info(
-                "Schedule status updated from Job",
-                controller="Schedule",
-                resource=f"{namespace}/{schedule_name}",
-                uid=owner_uid,
-                event="job",
-                reason="StatusUpdated",
-                job_name=job_name,
-                revision=revision,
-            )
+    # Queue the status update unless it repeats the last one; bursts for the
+    # same Schedule are coalesced
+    if not patch_body["status"] or _status_already_sent(owner_uid, patch_body["status"]):
+        return
+    status_patch_service.enqueue(
+        "schedules",
+        namespace,
+        schedule_name,
+        patch_body["status"],
+        on_success=_record_status_sent(owner_uid, patch_body["status"]),
+    )
+    structured_logging.logger.info(
+        "Schedule status update queued from Job",
+        controller="Schedule",
+        resource=f"{namespace}/{schedule_name}",
+        uid=owner_uid,
+        event="job",
+        reason="StatusUpdated",
+        job_name=job_name,
+        revision=revision,
+    )
 
 
 # Finalizers and cleanup handlers
@@ -2357,7 +2504,8 @@ def on_delete_playbook(name: str, namespace: str, **_: Any) -> None:
 
 
 @kopf.on.delete(API_GROUP_VERSION, "schedules")
-def on_delete_schedule(name: str, namespace: str, **_: Any) -> None:
+def on_delete_schedule(name: str, namespace: str, uid: str, **_: Any) -> None:
     """Clean up dependencies when Schedule is deleted."""
-    # Schedules don't have dependents, but we could clean up any references
-    pass
+    # Schedules don't have dependents; only forget the per-Schedule state kept for it
+    _LAST_STATUS_SENT.pop(uid, None)
+    _REQUEUE_BACKOFF.pop(uid, None)
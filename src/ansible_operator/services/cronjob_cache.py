@@ -0,0 +1,50 @@
+"""In-memory cache of managed CronJob status fed by the CronJob watch."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+
+class CronJobCache:
+    """Keep the latest observed status of each managed CronJob.
+
+    Kopf already watches CronJobs for ``handle_cronjob_event``; recording what
+    that watch delivers lets readers look up CronJob status without issuing a
+    GET per object.
+    """
+
+    def __init__(self) -> None:
+        self._status: dict[tuple[str, str], dict[str, Any]] = {}
+        # Event handlers and timers run concurrently in Kopf's thread pool
+        self._lock = threading.Lock()
+
+    def observe(self, event: dict[str, Any]) -> None:
+        """Record (or forget, for DELETED events) the CronJob carried by a watch event."""
+        cronjob = event.get("object") or {}
+        metadata = cronjob.get("metadata") or {}
+        namespace = metadata.get("namespace")
+        name = metadata.get("name")
+        if not namespace or not name:
+            return
+
+        with self._lock:
+            if event.get("type") == "DELETED":
+                self._status.pop((namespace, name), None)
+            else:
+                self._status[(namespace, name)] = dict(cronjob.get("status") or {})
+
+    def get(self, namespace: str, name: str) -> dict[str, Any] | None:
+        """Return the cached CronJob status, or None if the CronJob has not been seen."""
+        with self._lock:
+            status = self._status.get((namespace, name))
+        return dict(status) if status is not None else None
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._status.clear()
+
+
+# Global instance
+cronjob_cache = CronJobCache()
@@ -0,0 +1,225 @@
+"""Coalescing writer for custom resource status patches."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from kubernetes import client
+
+from .. import logging as structured_logging
+from ..constants import API_GROUP
+
+# Pending patches are keyed by (plural, namespace, name)
+PatchKey = tuple[str, str, str]
+
+MERGE_PATCH = "application/merge-patch+json"
+JSON_PATCH = "application/json-patch+json"
+
+# Rate limiting and transient server errors are retried within the flush
+MAX_RETRIES = 3
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _json_patch_ops(status: dict[str, Any]) -> list[dict[str, Any]]:
+    """Build RFC 6902 operations setting each status field.
+
+    ``add`` replaces a member that already exists and, unlike ``replace``,
+    does not fail when the field has never been set. It still fails while the
+    object has no ``status`` at all, which ``StatusPatchService`` handles.
+    """
+    return [
+        {
+            "op": "add",
+            "path": "/status/" + field.replace("~", "~0").replace("/", "~1"),
+            "value": value,
+        }
+        for field, value in status.items()
+    ]
+
+
+@dataclass(slots=True)
+class _PendingPatch:
+    """Status fields queued for one object, plus what to run once they are written."""
+
+    status: dict[str, Any] = field(default_factory=dict)
+    resource_version: str | None = None
+    on_success: list[Callable[[], None]] = field(default_factory=list)
+
+
+class StatusPatchService:
+    """Collect status patches and write each object at most once per flush window.
+
+    Handlers enqueue partial status bodies instead of patching synchronously.
+    Patches for the same object that arrive within one window are merged (last
+    value wins per field), so a burst of updates becomes a single API call.
+    Conditional patches are queued apart from unconditional ones, so one kind
+    never changes the precondition of the other.
+    """
+
+    def __init__(self, flush_interval: float = 0.25, retry_backoff: float = 0.1) -> None:
+        self.flush_interval = flush_interval
+        # Delay before the first retry; doubled for each further attempt
+        self.retry_backoff = retry_backoff
+        self._pending: dict[PatchKey, _PendingPatch] = {}
+        # Patches with a resourceVersion precondition
+        self._conditional: dict[PatchKey, _PendingPatch] = {}
+        # Handlers run in Kopf's thread pool, the flusher on the event loop
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self,
+        plural: str,
+        namespace: str,
+        name: str,
+        status: dict[str, Any],
+        resource_version: str | None = None,
+        on_success: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue a partial status update for the next flush.
+
+        When ``resource_version`` is given the write only succeeds if the object
+        is still at that version; on conflict the patch is dropped rather than
+        retried, since the next watch event or timer tick re-evaluates it.
+        ``on_success`` is called after the patch carrying ``status`` is written,
+        and not at all if the write fails or is dropped.
+        """
+        key = (plural, namespace, name)
+        with self._lock:
+            if resource_version:
+                pending = self._conditional.setdefault(key, _PendingPatch())
+                # The most recent version observed is the one to compare against
+                pending.resource_version = resource_version
+            else:
+                pending = self._pending.setdefault(key, _PendingPatch())
+            pending.status.update(status)
+            if on_success is not None:
+                pending.on_success.append(on_success)
+
+    def pending(self) -> dict[PatchKey, dict[str, Any]]:
+        """Return a snapshot of the queued fields per object."""
+        with self._lock:
+            snapshot: dict[PatchKey, dict[str, Any]] = {}
+            for queue in (self._conditional, self._pending):
+                for key, pending in queue.items():
+                    snapshot.setdefault(key, {}).update(pending.status)
+            return snapshot
+
+    def flush(self, api: client.CustomObjectsApi | None = None) -> int:
+        """Write all queued patches and return how many patches were written."""
+        with self._lock:
+            conditional, self._conditional = self._conditional, {}
+            pending, self._pending = self._pending, {}
+        if not conditional and not pending:
+            return 0
+
+        api = api or client.CustomObjectsApi()
+        written = 0
+        # Conditional patches go first: they were computed against the version the
+        # object is at now, which an unconditional write would move past.
+        for queue in (conditional, pending):
+            for key, patch in queue.items():
+                if self._write(api, key, patch):
+                    written += 1
+                    for callback in patch.on_success:
+                        callback()
+        return written
+
+    def _write(self, api: client.CustomObjectsApi, key: PatchKey, patch: _PendingPatch) -> bool:
+        """Write one queued patch; failures are logged and reported as ``False``."""
+        plural, namespace, name = key
+        try:
+            if patch.resource_version:
+                # The resourceVersion precondition needs a merge patch to yield a 409
+                body: Any = {
+                    "metadata": {"resourceVersion": patch.resource_version},
+                    "status": patch.status,
+                }
+                self._patch_with_retry(api, plural, namespace, name, body, MERGE_PATCH)
+                return True
+            try:
+                self._patch_with_retry(
+                    api, plural, namespace, name, _json_patch_ops(patch.status), JSON_PATCH
+                )
+            except client.exceptions.ApiException as e:
+                if e.status != 422:
+                    raise
+                # "add /status/<field>" is rejected while the object has no status
+                # yet; a merge patch creates it
+                self._patch_with_retry(
+                    api, plural, namespace, name, {"status": patch.status}, MERGE_PATCH
+                )
+            return True
+        except client.exceptions.ApiException as e:
+            if e.status != 409:
+                self._log_failure(plural, namespace, name, e)
+                return False
+            structured_logging.logger.debug(
+                "Queued status patch skipped after resourceVersion conflict",
+                resource=f"{namespace}/{name}",
+                event="status-flush",
+                reason="StatusPatchConflict",
+                plural=plural,
+            )
+        except Exception as e:
+            self._log_failure(plural, namespace, name, e)
+        return False
+
+    def _patch_with_retry(
+        self,
+        api: client.CustomObjectsApi,
+        plural: str,
+        namespace: str,
+        name: str,
+        body: Any,
+        content_type: str,
+    ) -> None:
+        """Patch the status subresource, retrying 429 and 5xx responses with backoff."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                api.patch_namespaced_custom_object_status(
+                    group=API_GROUP,
+                    version="v1alpha1",
+                    namespace=namespace,
+                    plural=plural,
+                    name=name,
+                    body=body,
+                    field_manager="ansible-operator",
+                    _content_type=content_type,
+                )
+                return
+            except client.exceptions.ApiException as e:
+                if e.status not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                    raise
+                time.sleep(self.retry_backoff * 2**attempt)
+
+    @staticmethod
+    def _log_failure(plural: str, namespace: str, name: str, error: Exception) -> None:
+        structured_logging.logger.warning(
+            f"Failed to apply queued status patch: {error}",
+            resource=f"{namespace}/{name}",
+            event="status-flush",
+            reason="StatusPatchFailed",
+            plural=plural,
+            error=str(error),
+        )
+
+    async def run(self, api_factory: Callable[[], client.CustomObjectsApi]) -> None:
+        """Flush queued patches every ``flush_interval`` seconds until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                if self._pending or self._conditional:
+                    await asyncio.to_thread(self.flush, api_factory())
+        finally:
+            # Do not drop updates queued right before shutdown
+            if self._pending or self._conditional:
+                await asyncio.to_thread(self.flush, api_factory())
+
+
+# Global instance
+status_patch_service = StatusPatchService()
@@ -0,0 +1,136 @@
+"""
+Pytest configuration and shared fixtures for unit tests.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from kubernetes import client
+
+# Captured at import so specs stay valid while tests patch the client classes
+_BATCH_V1_API = client.BatchV1Api
+
+
+@dataclass(slots=True)
+class PatchObj:
+    """Stand-in for the Kopf patch object handlers write status and meta into."""
+
+    status: dict[str, Any] = field(default_factory=dict)
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+@pytest.fixture
+def mock_patch() -> PatchObj:
+    """Empty Kopf patch object."""
+    return PatchObj()
+
+
+@pytest.fixture(scope="session")
+def job_manifest() -> dict[str, Any]:
+    """Minimal Job manifest returned by mocked Job builders."""
+    return {"apiVersion": "batch/v1", "kind": "Job"}
+
+
+@pytest.fixture(scope="session")
+def api_exc_409() -> client.exceptions.ApiException:
+    """Conflict raised when creating a Job that already exists."""
+    return client.exceptions.ApiException(status=409, reason="Job already exists")
+
+
+@pytest.fixture
+def batch_api() -> Mock:
+    """BatchV1Api instance mock restricted to the real client's methods."""
+    return Mock(spec=_BATCH_V1_API)
+
+
+@pytest.fixture
+def wire_existing_job(
+    batch_api: Mock, api_exc_409: client.exceptions.ApiException, mock_patch: PatchObj
+) -> Callable[..., tuple[Mock, PatchObj]]:
+    """Return a helper that wires ``batch_api`` for a probe Job that may already exist.
+
+    By default creation fails with a 409 and the read returns a Job with the
+    given completion counts. With ``read_exc`` the read raises instead and the
+    retried creation succeeds; ``create_sequence`` overrides the creation
+    results entirely. The helper returns the API mock and the ``mock_patch`` fixture.
+    """
+
+    def wire(
+        *,
+        succeeded: int | None = None,
+        failed: int | None = None,
+        read_exc: Exception | None = None,
+        create_sequence: list[Any] | None = None,
+    ) -> tuple[Mock, PatchObj]:
+        if create_sequence is not None:
+            batch_api.create_namespaced_job.side_effect = create_sequence
+        elif read_exc is not None:
+            batch_api.create_namespaced_job.side_effect = [api_exc_409, None]
+        else:
+            batch_api.create_namespaced_job.side_effect = api_exc_409
+
+        if read_exc is not None:
+            batch_api.read_namespaced_job.side_effect = read_exc
+        else:
+            batch_api.read_namespaced_job.return_value = SimpleNamespace(
+                status=SimpleNamespace(succeeded=succeeded, failed=failed)
+            )
+
+        return batch_api, mock_patch
+
+    return wire
+
+
+def _assert_logged(mock_method: Mock, substring: str) -> None:
+    """Assert that any message logged through ``mock_method`` contains ``substring``."""
+    messages = [c.args[0] if c.args else "" for c in mock_method.call_args_list]
+    assert any(substring in message for message in messages), f"no {substring!r} log message"
+
+
+@pytest.fixture(scope="session")
+def assert_logged() -> Callable[[Mock, str], None]:
+    """Return an assertion that a logger method was called with a message containing a substring."""
+    return _assert_logged
+
+
+def _make_cj(
+    labels: Mapping[str, str] | None = None,
+    annotations: Mapping[str, str] | None = None,
+    owner_references: list[SimpleNamespace] | None = None,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(
+            labels=labels, annotations=annotations, owner_references=owner_references
+        )
+    )
+
+
+def _make_owner_ref(kind: str, name: str, uid: str) -> SimpleNamespace:
+    return SimpleNamespace(kind=kind, name=name, uid=uid)
+
+
+@pytest.fixture(scope="session")
+def make_cj() -> Callable[..., SimpleNamespace]:
+    """Return a builder for CronJobs carrying only labels, annotations and owner references."""
+    return _make_cj
+
+
+@pytest.fixture(scope="session")
+def make_owner_ref() -> Callable[[str, str, str], SimpleNamespace]:
+    """Return a builder for owner references from kind, name and UID."""
+    return _make_owner_ref
+
+
+def _by_type(conditions: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Index conditions by their type."""
+    return {c["type"]: c for c in conditions}
+
+
+@pytest.fixture(scope="session")
+def by_type() -> Callable[[list[dict[str, Any]]], dict[str, dict[str, Any]]]:
+    """Return a helper indexing status conditions by their type."""
+    return _by_type
@@ -0,0 +1,53 @@
+"""Unit tests for the CronJob watch cache."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ansible_operator.services.cronjob_cache import CronJobCache
+
+
+def _event(event_type: str, status: dict[str, Any] | None = None) -> dict[str, Any]:
+    return {
+        "type": event_type,
+        "object": {
+            "metadata": {"namespace": "test-namespace", "name": "schedule-test-schedule"},
+            "status": status or {},
+        },
+    }
+
+
+class TestCronJobCache:
+    """Test recording CronJob status from watch events."""
+
+    def test_get_returns_none_for_unseen_cronjob(self) -> None:
+        """Test that a CronJob the watch has not delivered is a cache miss."""
+        assert CronJobCache().get("test-namespace", "schedule-test-schedule") is None
+
+    def test_observe_records_latest_status(self) -> None:
+        """Test that later events replace the cached status."""
+        cache = CronJobCache()
+
+        cache.observe(_event("ADDED"))
+        cache.observe(_event("MODIFIED", {"nextScheduleTime": "2024-01-01T13:00:00Z"}))
+
+        assert cache.get("test-namespace", "schedule-test-schedule") == {
+            "nextScheduleTime": "2024-01-01T13:00:00Z"
+        }
+
+    def test_deleted_event_evicts_entry(self) -> None:
+        """Test that a DELETED event removes the CronJob from the cache."""
+        cache = CronJobCache()
+
+        cache.observe(_event("ADDED", {"nextScheduleTime": "2024-01-01T13:00:00Z"}))
+        cache.observe(_event("DELETED"))
+
+        assert cache.get("test-namespace", "schedule-test-schedule") is None
+
+    def test_events_without_name_are_ignored(self) -> None:
+        """Test that objects missing namespace or name are not cached."""
+        cache = CronJobCache()
+
+        cache.observe({"type": "ADDED", "object": {"metadata": {}}})
+
+        assert cache._status == {}
@@ -105,13 +105,16 @@ class TestMetrics:
             for s in reconcile_total_samples
             if s.labels["kind"] == "Repository" and s.labels["result"] == "success"
         )
-        duration_sample = next(
-            s for s in reconcile_duration_samples if s.labels["kind"] == "Repository"
+        # The first bucket depends on timing; the count does not
+        duration_count_sample = next(
+            s
+            for s in reconcile_duration_samples
+            if s.labels["kind"] == "Repository" and s.name.endswith("_count")
         )
 
         assert started_sample.value == 1.0
         assert success_sample.value == 1.0
-        assert duration_sample.value > 0
+        assert duration_count_sample.value == 1.0
 
     def test_reconcile_metrics_playbook_started(self):
         """Test that Playbook reconciliation metrics are recorded when started."""
@@ -244,13 +247,16 @@ class TestMetrics:
             for s in reconcile_total_samples
             if s.labels["kind"] == "Schedule" and s.labels["result"] == "success"
         )
-        duration_sample = next(
-            s for s in reconcile_duration_samples if s.labels["kind"] == "Schedule"
+        # The first bucket depends on timing; the count does not
+        duration_count_sample = next(
+            s
+            for s in reconcile_duration_samples
+            if s.labels["kind"] == "Schedule" and s.name.endswith("_count")
         )
 
         assert started_sample.value == 1.0
         assert success_sample.value == 1.0
-        assert duration_sample.value > 0
+        assert duration_count_sample.value == 1.0
 
     def test_job_completion_metrics_repository_success(self):
         """Test that Repository job completion metrics are recorded on success."""
@@ -452,9 +458,9 @@ class TestMetrics:
             }
         }
 
-        with patch("ansible_operator.main.client.CustomObjectsApi") as mock_api_class:
+        with patch("ansible_operator.main._custom_api") as mock_custom_api:
             mock_api = MagicMock()
-            mock_api_class.return_value = mock_api
+            mock_custom_api.return_value = mock_api
 
             # Mock schedule exists
             mock_api.get_namespaced_custom_object.return_value = {
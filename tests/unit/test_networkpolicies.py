@@ -1,106 +1,119 @@
 """Unit tests for NetworkPolicy Helm templates."""
 
+import hashlib
 import pytest
 import yaml  # type: ignore
 from pathlib import Path
 from typing import Any, Dict, List
 
-
-def test_networkpolicy_operator_template_restrictive():
-    """Test NetworkPolicy operator template with restrictive preset."""
-    # This would test the Helm template rendering
-    # For now, we'll test the structure and logic
-
-    # Mock values for restrictive preset
-    values: Dict[str, Any] = {
-        "networkPolicies": {
-            "enabled": True,
-            "preset": "restrictive",
-            "git": {
-                "endpoints": ["github.com", "gitlab.com"],
-                "custom": [],
-                "ports": [{"port": 22, "protocol": "TCP"}, {"port": 443, "protocol": "TCP"}],
-            },
-            "registries": {
-                "endpoints": ["docker.io", "quay.io"],
-                "custom": [],
-                "ports": [{"port": 443, "protocol": "TCP"}],
-            },
-            "dns": {"enabled": False, "endpoints": [], "ports": []},
-            "kubernetes": {"enabled": False, "endpoints": [], "ports": []},
-            "additionalRules": [],
-        }
-    }
-
-    # Verify restrictive preset configuration
-    assert values["networkPolicies"]["enabled"] is True
-    assert values["networkPolicies"]["preset"] == "restrictive"
-    assert values["networkPolicies"]["dns"]["enabled"] is False
-    assert values["networkPolicies"]["kubernetes"]["enabled"] is False
-    assert len(values["networkPolicies"]["git"]["endpoints"]) == 2
-    assert len(values["networkPolicies"]["registries"]["endpoints"]) == 2
-
-
-def test_networkpolicy_operator_template_moderate():
-    """Test NetworkPolicy operator template with moderate preset."""
-    values: Dict[str, Any] = {
-        "networkPolicies": {
-            "enabled": True,
-            "preset": "moderate",
-            "git": {
-                "endpoints": ["github.com", "gitlab.com"],
-                "custom": [],
-                "ports": [{"port": 22, "protocol": "TCP"}, {"port": 443, "protocol": "TCP"}],
-            },
-            "registries": {
-                "endpoints": ["docker.io", "quay.io"],
-                "custom": [],
-                "ports": [{"port": 443, "protocol": "TCP"}],
-            },
-            "dns": {
-                "enabled": True,
-                "endpoints": ["10.96.0.10"],
-                "ports": [{"port": 53, "protocol": "UDP"}, {"port": 53, "protocol": "TCP"}],
-            },
-            "kubernetes": {
+# libyaml-backed loader when available; it parses UTF-8 bytes without a decode pass.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared read-only fixtures; built once at import instead of per test.
+_GIT_PORTS = ({"port": 22, "protocol": "TCP"}, {"port": 443, "protocol": "TCP"})
+_ADDITIONAL_RULE = {
+    "to": (
+        {"namespaceSelector": {"matchLabels": {"name": "monitoring"}}},
+        {"podSelector": {"matchLabels": {"app": "prometheus"}}},
+    ),
+    "ports": ({"port": 9090, "protocol": "TCP"},),
+}
+
+_HELM_VALUES_FILE = (
+    Path(__file__).parent.parent.parent / "helm" / "ansible-playbook-operator" / "values.yaml"
+)
+
+
+def _cached_yaml_load(path: Path, cache: Any) -> Any:
+    """Load YAML from path, reusing a parse stored in the pytest cache.
+
+    Entries are keyed by a hash of the file content, so an edited file is
+    always re-parsed. Without a cache (``-p no:cacheprovider``) this is a
+    plain parse.
+    """
+    raw = path.read_bytes()
+    if cache is None:
+        return yaml.load(raw, Loader=_YAML_LOADER)
+
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    key = f"ansible-playbook-operator/yaml/{path.name}-{digest}"
+    data = cache.get(key, None)
+    if data is None:
+        data = yaml.load(raw, Loader=_YAML_LOADER)
+        cache.set(key, data)
+    return data
+
+
+@pytest.fixture(scope="session")
+def helm_values(request: pytest.FixtureRequest) -> Dict[str, Any] | None:
+    """Parsed Helm values.yaml, or None when the chart is not present."""
+    if not _HELM_VALUES_FILE.exists():
+        return None
+    return _cached_yaml_load(_HELM_VALUES_FILE, getattr(request.config, "cache", None))
+
+
+@pytest.fixture
+def make_np_values():
+    """Factory for networkPolicies values in the shape of the chart's presets."""
+
+    def _make(preset: str, dns_enabled: bool = False, k8s_enabled: bool = False) -> Dict[str, Any]:
+        open_egress = preset == "permissive"
+        return {
+            "networkPolicies": {
                 "enabled": True,
-                "endpoints": ["kubernetes.default.svc.cluster.local"],
-                "ports": [{"port": 443, "protocol": "TCP"}],
-            },
-            "additionalRules": [],
+                "preset": preset,
+                "git": {
+                    "endpoints": [] if open_egress else ["github.com", "gitlab.com"],
+                    "custom": [],
+                    "ports": () if open_egress else _GIT_PORTS,
+                },
+                "registries": {
+                    "endpoints": [] if open_egress else ["docker.io", "quay.io"],
+                    "custom": [],
+                    "ports": [] if open_egress else [{"port": 443, "protocol": "TCP"}],
+                },
+                "dns": {
+                    "enabled": dns_enabled,
+                    "endpoints": ["10.96.0.10"] if dns_enabled else [],
+                    "ports": (
+                        [{"port": 53, "protocol": "UDP"}, {"port": 53, "protocol": "TCP"}]
+                        if dns_enabled
+                        else []
+                    ),
+                },
+                "kubernetes": {
+                    "enabled": k8s_enabled,
+                    "endpoints": ["kubernetes.default.svc.cluster.local"] if k8s_enabled else [],
+                    "ports": [{"port": 443, "protocol": "TCP"}] if k8s_enabled else [],
+                },
+                "additionalRules": [],
+            }
         }
-    }
 
-    # Verify moderate preset configuration
-    assert values["networkPolicies"]["enabled"] is True
-    assert values["networkPolicies"]["preset"] == "moderate"
-    assert values["networkPolicies"]["dns"]["enabled"] is True
-    assert values["networkPolicies"]["kubernetes"]["enabled"] is True
-    assert len(values["networkPolicies"]["dns"]["endpoints"]) == 1
-    assert len(values["networkPolicies"]["kubernetes"]["endpoints"]) == 1
+    return _make
 
 
-def test_networkpolicy_operator_template_permissive():
-    """Test NetworkPolicy operator template with permissive preset."""
-    values: Dict[str, Any] = {
-        "networkPolicies": {
-            "enabled": True,
-            "preset": "permissive",
-            "git": {"endpoints": [], "custom": [], "ports": []},
-            "registries": {"endpoints": [], "custom": [], "ports": []},
-            "dns": {"enabled": False, "endpoints": [], "ports": []},
-            "kubernetes": {"enabled": False, "endpoints": [], "ports": []},
-            "additionalRules": [],
-        }
-    }
+@pytest.mark.parametrize(
+    "preset,dns_en,k8s_en,git_n,reg_n",
+    [
+        ("restrictive", False, False, 2, 2),
+        ("moderate", True, True, 2, 2),
+        ("permissive", False, False, 0, 0),
+    ],
+    ids=["restrictive", "moderate", "permissive"],
+)
+def test_networkpolicy_preset(make_np_values, preset, dns_en, k8s_en, git_n, reg_n):
+    """Test NetworkPolicy operator template values for each preset."""
+    np = make_np_values(preset=preset, dns_enabled=dns_en, k8s_enabled=k8s_en)["networkPolicies"]
 
-    # Verify permissive preset configuration
-    assert values["networkPolicies"]["enabled"] is True
-    assert values["networkPolicies"]["preset"] == "permissive"
-    assert values["networkPolicies"]["dns"]["enabled"] is False
-    assert values["networkPolicies"]["kubernetes"]["enabled"] is False
-    assert len(values["networkPolicies"]["git"]["endpoints"]) == 0
-    assert len(values["networkPolicies"]["registries"]["endpoints"]) == 0
+    assert np["enabled"] is True
+    assert np["preset"] == preset
+    assert np["dns"]["enabled"] is dns_en
+    assert np["kubernetes"]["enabled"] is k8s_en
+    assert len(np["git"]["endpoints"]) == git_n
+    assert len(np["registries"]["endpoints"]) == reg_n
+    assert len(np["dns"]["endpoints"]) == (1 if dns_en else 0)
+    assert len(np["kubernetes"]["endpoints"]) == (1 if k8s_en else 0)
 
 
 def test_networkpolicy_operator_template_disabled():
@@ -121,7 +134,7 @@ def test_networkpolicy_custom_endpoints():
             "git": {
                 "endpoints": ["github.com"],
                 "custom": ["git.internal.company.com", "192.168.1.100"],
-                "ports": [{"port": 22, "protocol": "TCP"}, {"port": 443, "protocol": "TCP"}],
+                "ports": _GIT_PORTS,
             },
             "registries": {
                 "endpoints": ["docker.io"],
@@ -178,15 +191,7 @@ def test_networkpolicy_additional_rules():
                 "endpoints": ["kubernetes.default.svc.cluster.local"],
                 "ports": [{"port": 443, "protocol": "TCP"}],
             },
-            "additionalRules": [
-                {
-                    "to": [
-                        {"namespaceSelector": {"matchLabels": {"name": "monitoring"}}},
-                        {"podSelector": {"matchLabels": {"app": "prometheus"}}},
-                    ],
-                    "ports": [{"port": 9090, "protocol": "TCP"}],
-                }
-            ],
+            "additionalRules": [_ADDITIONAL_RULE],
         }
     }
 
@@ -298,37 +303,17 @@ def test_networkpolicy_example_values_file():
     example_file = Path(__file__).parent.parent.parent / "examples" / "values-networkpolicies.yaml"
 
     if example_file.exists():
-        with open(example_file, "r") as f:
-            content = f.read()
-
-        # Remove comments and test YAML parsing
-        lines = content.split("\n")
-        yaml_lines = []
-        for line in lines:
-            if not line.strip().startswith("#"):
-                yaml_lines.append(line)
-
-        yaml_content = "\n".join(yaml_lines)
-
         # Should not raise an exception
         try:
-            yaml.safe_load(yaml_content)
+            yaml.load(example_file.read_bytes(), Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             pytest.fail(f"Example values file contains invalid YAML: {e}")
 
 
-def test_networkpolicy_helm_values_structure():
+def test_networkpolicy_helm_values_structure(helm_values):
     """Test that the Helm values.yaml structure is correct."""
-    values_file = (
-        Path(__file__).parent.parent.parent / "helm" / "ansible-playbook-operator" / "values.yaml"
-    )
-
-    if values_file.exists():
-        with open(values_file, "r") as f:
-            content = f.read()
-
-        # Parse YAML
-        values = yaml.safe_load(content)
+    if helm_values is not None:
+        values = helm_values
 
         # Check NetworkPolicy structure
         assert "networkPolicies" in values
@@ -7,6 +7,9 @@ from kubernetes import client
 from ansible_operator.main import reconcile_orphaned_probe_jobs
 from ansible_operator.constants import API_GROUP
 
+# Canned API errors shared across tests.
+_NOT_FOUND = client.exceptions.ApiException(status=404)
+
 
 class TestOrphanedProbeJobs:
     """Test orphaned probe job reconciliation."""
@@ -142,9 +145,7 @@ class TestOrphanedProbeJobs:
         mock_batch_api.list_namespaced_job.return_value = mock_jobs_response
 
         # Mock repository not found (404)
-        mock_api_exception = client.exceptions.ApiException()
-        mock_api_exception.status = 404
-        mock_custom_api.get_namespaced_custom_object.side_effect = mock_api_exception
+        mock_custom_api.get_namespaced_custom_object.side_effect = _NOT_FOUND
 
         # Call the function
         reconcile_orphaned_probe_jobs()
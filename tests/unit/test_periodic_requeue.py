@@ -2,39 +2,59 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+import json
+from datetime import UTC, datetime, timedelta, timezone
+from unittest.mock import Mock
 from typing import Any
 
 import pytest
-
-from ansible_operator.constants import API_GROUP
-from ansible_operator.main import periodic_schedule_requeue
+from kubernetes.client.exceptions import ApiException
+
+from ansible_operator.main import (
+    _compute_next_run_patch,
+    _parse_iso,
+    _periodic_requeue_enabled,
+    on_delete_schedule,
+    periodic_schedule_requeue,
+)
+from ansible_operator.services.cronjob_cache import CronJobCache
+
+_NEXT_SCHEDULE_TIME = datetime(2024, 1, 1, 13, 0, 0, tzinfo=UTC)
+
+
+def _cronjob(next_schedule_time: datetime | None) -> Mock:
+    """Build a raw CronJob response carrying only status.nextScheduleTime."""
+    status = {}
+    if next_schedule_time:
+        status["nextScheduleTime"] = next_schedule_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+    response = Mock()
+    response.data = json.dumps({"status": status}).encode()
+    return response
+
+
+@pytest.fixture
+def periodic_mocks(monkeypatch: pytest.MonkeyPatch) -> tuple[Mock, Mock]:
+    """Stub the CronJob API and the status patch queue used by the timer."""
+    mock_batch_api = Mock()
+    mock_status_patches = Mock()
+    monkeypatch.setattr("ansible_operator.main._batch_api", lambda: mock_batch_api)
+    monkeypatch.setattr("ansible_operator.main.status_patch_service", mock_status_patches)
+    monkeypatch.setattr("ansible_operator.main._REQUEUE_BACKOFF", {})
+    monkeypatch.setattr("ansible_operator.main.cronjob_cache", CronJobCache())
+    return mock_batch_api, mock_status_patches
 
 
 class TestPeriodicScheduleRequeue:
     """Test cases for periodic Schedule requeue functionality."""
 
-    @patch("ansible_operator.main.client.BatchV1Api")
-    @patch("ansible_operator.main.client.CustomObjectsApi")
     def test_periodic_requeue_updates_next_run_time(
-        self, mock_custom_api_class: Mock, mock_batch_api_class: Mock
+        self, periodic_mocks: tuple[Mock, Mock]
     ) -> None:
         """Test that periodic requeue updates nextRunTime when it differs."""
-        mock_batch_api = Mock()
-        mock_batch_api_class.return_value = mock_batch_api
-
-        mock_custom_api = Mock()
-        mock_custom_api_class.return_value = mock_custom_api
+        mock_batch_api, mock_status_patches = periodic_mocks
 
         # Mock CronJob with nextScheduleTime
-        next_schedule_time = datetime(2024, 1, 1, 13, 0, 0, tzinfo=timezone.utc)
-        cronjob_status = Mock()
-        cronjob_status.next_schedule_time = next_schedule_time
-
-        cronjob = Mock()
-        cronjob.status = cronjob_status
-        mock_batch_api.read_namespaced_cron_job.return_value = cronjob
+        mock_batch_api.read_namespaced_cron_job.return_value = _cronjob(_NEXT_SCHEDULE_TIME)
 
         # Mock Schedule with different nextRunTime
         schedule_status = {"nextRunTime": "2024-01-01T12:00:00Z"}
@@ -48,51 +68,54 @@ class TestPeriodicScheduleRequeue:
             status=schedule_status,
         )
 
-        # Verify CronJob was read
+        # Verify CronJob was read as raw JSON, skipping model deserialisation
         mock_batch_api.read_namespaced_cron_job.assert_called_once_with(
-            "schedule-test-schedule", "test-namespace"
+            "schedule-test-schedule", "test-namespace", _preload_content=False
         )
 
-        # Verify Schedule status was updated
-        mock_custom_api.patch_namespaced_custom_object_status.assert_called_once()
-        call_args = mock_custom_api.patch_namespaced_custom_object_status.call_args
-
-        assert call_args[1]["group"] == API_GROUP
-        assert call_args[1]["version"] == "v1alpha1"
-        assert call_args[1]["namespace"] == "test-namespace"
-        assert call_args[1]["plural"] == "schedules"
-        assert call_args[1]["name"] == "test-schedule"
-        assert call_args[1]["field_manager"] == "ansible-operator"
-
-        # Verify the patch body
-        patch_body = call_args[1]["body"]
-        assert patch_body["status"]["nextRunTime"] == "2024-01-01T13:00:00+00:00Z"
-
-    @patch("ansible_operator.main.client.BatchV1Api")
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_periodic_requeue_skips_update_when_next_run_time_matches(
-        self, mock_custom_api_class: Mock, mock_batch_api_class: Mock
-    ) -> None:
-        """Test that periodic requeue skips update when nextRunTime matches."""
-        mock_batch_api = Mock()
-        mock_batch_api_class.return_value = mock_batch_api
-
-        mock_custom_api = Mock()
-        mock_custom_api_class.return_value = mock_custom_api
-
-        # Mock CronJob with nextScheduleTime
-        next_schedule_time = datetime(2024, 1, 1, 13, 0, 0, tzinfo=timezone.utc)
-        cronjob_status = Mock()
-        cronjob_status.next_schedule_time = next_schedule_time
-
-        cronjob = Mock()
-        cronjob.status = cronjob_status
-        mock_batch_api.read_namespaced_cron_job.return_value = cronjob
+        # Verify the Schedule status update was queued
+        mock_status_patches.enqueue.assert_called_once_with(
+            "schedules",
+            "test-namespace",
+            "test-schedule",
+            {"nextRunTime": "2024-01-01T13:00:00Z"},
+            resource_version=None,
+        )
 
-        # Mock Schedule with matching nextRunTime
-        schedule_status = {"nextRunTime": "2024-01-01T13:00:00+00:00Z"}
+    @pytest.mark.parametrize(
+        "cronjob_behavior,schedule_status,expect_patch",
+        [
+            pytest.param(
+                _cronjob(_NEXT_SCHEDULE_TIME),
+                {"nextRunTime": "2024-01-01T13:00:00Z"},
+                False,
+                id="match",
+            ),
+            pytest.param(
+                _cronjob(_NEXT_SCHEDULE_TIME),
+                {"nextRunTime": "2024-01-01T12:00:00Z"},
+                True,
+                id="differ",
+            ),
+            pytest.param(ApiException(status=404), {}, False, id="not_found"),
+            pytest.param(_cronjob(None), {}, False, id="no_next_schedule_time"),
+            pytest.param(ApiException(status=500), {}, False, id="api_error"),
+        ],
+    )
+    def test_periodic_requeue_branches(
+        self,
+        periodic_mocks: tuple[Mock, Mock],
+        cronjob_behavior: Any,
+        schedule_status: dict[str, Any],
+        expect_patch: bool,
+    ) -> None:
+        """Test that periodic requeue only queues a patch when nextRunTime changed."""
+        mock_batch_api, mock_status_patches = periodic_mocks
+        if isinstance(cronjob_behavior, Exception):
+            mock_batch_api.read_namespaced_cron_job.side_effect = cronjob_behavior
+        else:
+            mock_batch_api.read_namespaced_cron_job.return_value = cronjob_behavior
 
-        # Call the periodic requeue function
         periodic_schedule_requeue(
             name="test-schedule",
             namespace="test-namespace",
@@ -101,103 +124,109 @@ class TestPeriodicScheduleRequeue:
             status=schedule_status,
         )
 
-        # Verify CronJob was read
         mock_batch_api.read_namespaced_cron_job.assert_called_once_with(
-            "schedule-test-schedule", "test-namespace"
+            "schedule-test-schedule", "test-namespace", _preload_content=False
         )
+        assert mock_status_patches.enqueue.called == expect_patch
 
-        # Verify Schedule status was NOT updated
-        mock_custom_api.patch_namespaced_custom_object_status.assert_not_called()
-
-    @patch("ansible_operator.main.client.BatchV1Api")
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_periodic_requeue_handles_cronjob_not_found(
-        self, mock_custom_api_class: Mock, mock_batch_api_class: Mock
+    def test_periodic_requeue_reads_next_schedule_time_from_watch_cache(
+        self, periodic_mocks: tuple[Mock, Mock], monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Test that periodic requeue handles CronJob not found gracefully."""
-        mock_batch_api = Mock()
-        mock_batch_api_class.return_value = mock_batch_api
-
-        mock_custom_api = Mock()
-        mock_custom_api_class.return_value = mock_custom_api
-
-        # Mock CronJob not found (404)
-        from kubernetes.client.exceptions import ApiException
-
-        mock_batch_api.read_namespaced_cron_job.side_effect = ApiException(status=404)
+        """Test that a CronJob already seen by the watch is not fetched again."""
+        mock_batch_api, mock_status_patches = periodic_mocks
+        cache = CronJobCache()
+        cache.observe(
+            {
+                "type": "MODIFIED",
+                "object": {
+                    "metadata": {"namespace": "test-namespace", "name": "schedule-test-schedule"},
+                    "status": {"nextScheduleTime": "2024-01-01T13:00:00Z"},
+                },
+            }
+        )
+        monkeypatch.setattr("ansible_operator.main.cronjob_cache", cache)
 
-        # Call the periodic requeue function
         periodic_schedule_requeue(
             name="test-schedule",
             namespace="test-namespace",
             uid="schedule-uid-123",
             spec={},
-            status={},
+            status={"nextRunTime": "2024-01-01T12:00:00Z"},
         )
 
-        # Verify CronJob was attempted to be read
-        mock_batch_api.read_namespaced_cron_job.assert_called_once_with(
-            "schedule-test-schedule", "test-namespace"
+        mock_batch_api.read_namespaced_cron_job.assert_not_called()
+        mock_status_patches.enqueue.assert_called_once_with(
+            "schedules",
+            "test-namespace",
+            "test-schedule",
+            {"nextRunTime": "2024-01-01T13:00:00Z"},
+            resource_version=None,
         )
 
-        # Verify Schedule status was NOT updated
-        mock_custom_api.patch_namespaced_custom_object_status.assert_not_called()
-
-    @patch("ansible_operator.main.client.BatchV1Api")
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_periodic_requeue_handles_cronjob_without_next_schedule_time(
-        self, mock_custom_api_class: Mock, mock_batch_api_class: Mock
+    def test_periodic_requeue_conditions_patch_on_resource_version(
+        self, periodic_mocks: tuple[Mock, Mock]
     ) -> None:
-        """Test that periodic requeue handles CronJob without nextScheduleTime."""
-        mock_batch_api = Mock()
-        mock_batch_api_class.return_value = mock_batch_api
-
-        mock_custom_api = Mock()
-        mock_custom_api_class.return_value = mock_custom_api
-
-        # Mock CronJob without nextScheduleTime
-        cronjob_status = Mock()
-        cronjob_status.next_schedule_time = None
-
-        cronjob = Mock()
-        cronjob.status = cronjob_status
-        mock_batch_api.read_namespaced_cron_job.return_value = cronjob
+        """Test that the queued patch carries the Schedule's resourceVersion."""
+        mock_batch_api, mock_status_patches = periodic_mocks
+        mock_batch_api.read_namespaced_cron_job.return_value = _cronjob(_NEXT_SCHEDULE_TIME)
 
-        # Call the periodic requeue function
         periodic_schedule_requeue(
             name="test-schedule",
             namespace="test-namespace",
             uid="schedule-uid-123",
             spec={},
             status={},
+            meta={"resourceVersion": "42"},
         )
 
-        # Verify CronJob was read
-        mock_batch_api.read_namespaced_cron_job.assert_called_once_with(
-            "schedule-test-schedule", "test-namespace"
-        )
-
-        # Verify Schedule status was NOT updated
-        mock_custom_api.patch_namespaced_custom_object_status.assert_not_called()
+        assert mock_status_patches.enqueue.call_args.kwargs["resource_version"] == "42"
 
-    @patch("ansible_operator.main.client.BatchV1Api")
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_periodic_requeue_handles_api_exception(
-        self, mock_custom_api_class: Mock, mock_batch_api_class: Mock
+    def test_periodic_requeue_propagates_unexpected_errors(
+        self, periodic_mocks: tuple[Mock, Mock]
     ) -> None:
-        """Test that periodic requeue handles API exceptions gracefully."""
-        mock_batch_api = Mock()
-        mock_batch_api_class.return_value = mock_batch_api
+        """Test that non-API errors are not swallowed."""
+        mock_batch_api, mock_status_patches = periodic_mocks
+        mock_batch_api.read_namespaced_cron_job.side_effect = ValueError("Test error")
+
+        with pytest.raises(ValueError, match="Test error"):
+            periodic_schedule_requeue(
+                name="test-schedule",
+                namespace="test-namespace",
+                uid="schedule-uid-123",
+                spec={},
+                status={},
+            )
+
+        mock_status_patches.enqueue.assert_not_called()
+
+    def test_periodic_requeue_backs_off_after_api_error(
+        self, periodic_mocks: tuple[Mock, Mock]
+    ) -> None:
+        """Test that a second tick within the backoff window skips the CronJob read."""
+        mock_batch_api, _ = periodic_mocks
+        mock_batch_api.read_namespaced_cron_job.side_effect = ApiException(status=500)
+        kwargs: dict[str, Any] = {
+            "name": "test-schedule",
+            "namespace": "test-namespace",
+            "uid": "schedule-uid-123",
+            "spec": {},
+            "status": {},
+        }
 
-        mock_custom_api = Mock()
-        mock_custom_api_class.return_value = mock_custom_api
+        periodic_schedule_requeue(**kwargs)
+        periodic_schedule_requeue(**kwargs)
 
-        # Mock API exception (non-404)
-        from kubernetes.client.exceptions import ApiException
+        mock_batch_api.read_namespaced_cron_job.assert_called_once()
 
-        mock_batch_api.read_namespaced_cron_job.side_effect = ApiException(status=500)
+    def test_periodic_requeue_resets_backoff_on_success(
+        self, periodic_mocks: tuple[Mock, Mock], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a successful read clears the Schedule's backoff state."""
+        mock_batch_api, _ = periodic_mocks
+        backoff = {"schedule-uid-123": (0.0, 3)}
+        monkeypatch.setattr("ansible_operator.main._REQUEUE_BACKOFF", backoff)
+        mock_batch_api.read_namespaced_cron_job.return_value = _cronjob(_NEXT_SCHEDULE_TIME)
 
-        # Call the periodic requeue function
         periodic_schedule_requeue(
             name="test-schedule",
             namespace="test-namespace",
@@ -206,42 +235,114 @@ class TestPeriodicScheduleRequeue:
             status={},
         )
 
-        # Verify CronJob was attempted to be read
-        mock_batch_api.read_namespaced_cron_job.assert_called_once_with(
-            "schedule-test-schedule", "test-namespace"
-        )
+        assert backoff == {}
+
+    def test_delete_schedule_clears_backoff(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that deleting a Schedule drops its backoff state."""
+        backoff = {"schedule-uid-123": (float("inf"), 3)}
+        monkeypatch.setattr("ansible_operator.main._REQUEUE_BACKOFF", backoff)
+
+        on_delete_schedule(name="test-schedule", namespace="test-namespace", uid="schedule-uid-123")
 
-        # Verify Schedule status was NOT updated
-        mock_custom_api.patch_namespaced_custom_object_status.assert_not_called()
+        assert backoff == {}
 
-    @patch("ansible_operator.main.client.BatchV1Api")
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_periodic_requeue_handles_general_exception(
-        self, mock_custom_api_class: Mock, mock_batch_api_class: Mock
+    def test_periodic_requeue_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the polling fallback is off unless explicitly enabled."""
+        monkeypatch.delenv("SCHEDULE_PERIODIC_REQUEUE", raising=False)
+
+        assert _periodic_requeue_enabled() is False
+
+    @pytest.mark.parametrize("value", ["true", "True", "1", "yes"])
+    def test_periodic_requeue_enabled_via_env(
+        self, monkeypatch: pytest.MonkeyPatch, value: str
     ) -> None:
-        """Test that periodic requeue handles general exceptions gracefully."""
-        mock_batch_api = Mock()
-        mock_batch_api_class.return_value = mock_batch_api
+        """Test that SCHEDULE_PERIODIC_REQUEUE turns the polling fallback on."""
+        monkeypatch.setenv("SCHEDULE_PERIODIC_REQUEUE", value)
 
-        mock_custom_api = Mock()
-        mock_custom_api_class.return_value = mock_custom_api
+        assert _periodic_requeue_enabled() is True
 
-        # Mock general exception
-        mock_batch_api.read_namespaced_cron_job.side_effect = Exception("Test error")
+    def test_periodic_requeue_does_not_repatch_written_value(
+        self, periodic_mocks: tuple[Mock, Mock]
+    ) -> None:
+        """Test that feeding back the written nextRunTime produces no second patch."""
+        mock_batch_api, mock_status_patches = periodic_mocks
 
-        # Call the periodic requeue function
-        periodic_schedule_requeue(
-            name="test-schedule",
-            namespace="test-namespace",
-            uid="schedule-uid-123",
-            spec={},
-            status={},
-        )
+        mock_batch_api.read_namespaced_cron_job.return_value = _cronjob(_NEXT_SCHEDULE_TIME)
 
-        # Verify CronJob was attempted to be read
-        mock_batch_api.read_namespaced_cron_job.assert_called_once_with(
-            "schedule-test-schedule", "test-namespace"
+        kwargs: dict[str, Any] = {
+            "name": "test-schedule",
+            "namespace": "test-namespace",
+            "uid": "schedule-uid-123",
+            "spec": {},
+        }
+        periodic_schedule_requeue(status={"nextRunTime": "2024-01-01T12:00:00Z"}, **kwargs)
+        written = mock_status_patches.enqueue.call_args[0][3]
+
+        periodic_schedule_requeue(status=written, **kwargs)
+
+        mock_status_patches.enqueue.assert_called_once()
+
+
+class TestComputeNextRunPatch:
+    """Test cases for the pure nextRunTime comparison helper."""
+
+    def test_returns_patch_when_next_run_time_differs(self) -> None:
+        """Test that a differing nextRunTime produces a status patch."""
+        next_schedule_time = datetime(2024, 1, 1, 13, 0, 0, tzinfo=UTC)
+
+        patch_body = _compute_next_run_patch("2024-01-01T12:00:00Z", next_schedule_time)
+
+        assert patch_body == {"status": {"nextRunTime": "2024-01-01T13:00:00Z"}}
+
+    def test_returns_none_when_next_run_time_matches(self) -> None:
+        """Test that a matching nextRunTime needs no patch."""
+        next_schedule_time = datetime(2024, 1, 1, 13, 0, 0, tzinfo=UTC)
+
+        assert _compute_next_run_patch("2024-01-01T13:00:00Z", next_schedule_time) is None
+
+    def test_returns_none_without_next_schedule_time(self) -> None:
+        """Test that a CronJob without nextScheduleTime needs no patch."""
+        assert _compute_next_run_patch("2024-01-01T12:00:00Z", None) is None
+
+    def test_normalises_non_utc_offsets(self) -> None:
+        """Test that offset-aware datetimes are written in canonical UTC form."""
+        cet = timezone(timedelta(hours=1))
+        next_schedule_time = datetime(2024, 1, 1, 14, 0, 0, tzinfo=cet)
+
+        patch_body = _compute_next_run_patch(None, next_schedule_time)
+
+        assert patch_body == {"status": {"nextRunTime": "2024-01-01T13:00:00Z"}}
+
+    def test_returns_none_for_equivalent_offset_representation(self) -> None:
+        """Test that the same instant written with a different offset needs no patch."""
+        next_schedule_time = datetime(2024, 1, 1, 13, 0, 0, tzinfo=UTC)
+
+        assert _compute_next_run_patch("2024-01-01T14:00:00+01:00", next_schedule_time) is None
+
+    def test_overwrites_unparseable_next_run_time(self) -> None:
+        """Test that a malformed stored value is replaced with the canonical form."""
+        next_schedule_time = datetime(2024, 1, 1, 13, 0, 0, tzinfo=UTC)
+
+        patch_body = _compute_next_run_patch("2024-01-01T13:00:00+00:00Z", next_schedule_time)
+
+        assert patch_body == {"status": {"nextRunTime": "2024-01-01T13:00:00Z"}}
+
+
+class TestParseIso:
+    """Test cases for the memoised timestamp parser."""
+
+    def test_parses_zulu_suffix_as_utc(self) -> None:
+        """Test that a trailing "Z" is read as UTC."""
+        assert _parse_iso("2024-01-01T13:00:00Z") == datetime(
+            2024, 1, 1, 13, 0, 0, tzinfo=UTC
         )
 
-        # Verify Schedule status was NOT updated
-        mock_custom_api.patch_namespaced_custom_object_status.assert_not_called()
+    def test_repeated_values_hit_the_cache(self) -> None:
+        """Test that parsing the same string twice reuses the cached result."""
+        _parse_iso.cache_clear()
+
+        first = _parse_iso("2024-01-01T13:00:00Z")
+        second = _parse_iso("2024-01-01T13:00:00Z")
+
+        assert first is second
+        assert _parse_iso.cache_info().hits >= 1
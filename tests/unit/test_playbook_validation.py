@@ -1,12 +1,20 @@
 """Unit tests for playbook validation functionality."""
 
-from unittest.mock import MagicMock, patch
+import contextlib
+import functools
+from collections.abc import Mapping
+from operator import itemgetter
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, patch
 from typing import Any
 
 import pytest
-from kubernetes import client
+from kubernetes.client.exceptions import ApiException
 
+from ansible_operator import main as _main
 from ansible_operator.main import reconcile_playbook
+from ansible_operator.services import git as _git
 from ansible_operator.services.git import GitService, GitValidationError
 
 
@@ -15,373 +23,204 @@ class MockPatch:
 
     def __init__(self):
         self.status = {}
-        self.meta = MagicMock()
-
-
+        self.meta = SimpleNamespace()
+
+
+_CONDITION_FIELDS = itemgetter("type", "status", "reason", "message")
+
+
+def _assert_ready(patch_obj: MockPatch, *, status: str, reason: str, message: str) -> None:
+    """Assert the patch carries exactly one condition: Ready with the given fields."""
+    (condition,) = patch_obj.status["conditions"]
+    assert _CONDITION_FIELDS(condition) == ("Ready", status, reason, message)
+
+
+def _assert_validate_failed(mock_emit: Mock, message: str) -> None:
+    """Assert a single ValidateFailed warning was emitted for the test Playbook."""
+    assert mock_emit.call_count == 1
+    kwargs = mock_emit.call_args.kwargs
+    assert kwargs["kind"] == "Playbook"
+    assert kwargs["namespace"] == "default"
+    assert kwargs["name"] == "test-playbook"
+    assert kwargs["reason"] == "ValidateFailed"
+    assert kwargs["type_"] == "Warning"
+    assert kwargs["message"] == message
+
+
+_VALID_SPEC: Mapping[str, Any] = MappingProxyType(
+    {
+        "repositoryRef": MappingProxyType({"name": "test-repo"}),
+        "playbookPath": "playbooks/test.yml",
+    }
+)
+_REPO_OBJ: Mapping[str, Any] = MappingProxyType(
+    {"spec": MappingProxyType({"url": "https://github.com/test/repo.git"})}
+)
+
+
+# Validation failures reconcile_playbook reports with Ready=False and a
+# ValidateFailed event, keyed by scenario id
+_FAILURE_SCENARIOS: dict[str, SimpleNamespace] = {
+    "missing_repo_ref": SimpleNamespace(
+        spec={},
+        readiness=None,
+        repo_behavior=None,
+        paths_result=None,
+        reason="RepoRefMissing",
+        message="spec.repositoryRef.name must be set",
+        event_message="spec.repositoryRef.name must be set",
+    ),
+    "missing_playbook_path": SimpleNamespace(
+        spec={"repositoryRef": {"name": "test-repo"}},
+        readiness=None,
+        repo_behavior=None,
+        paths_result=None,
+        reason="InvalidPath",
+        message="spec.playbookPath must be set",
+        event_message="spec.playbookPath must be set",
+    ),
+    "repository_not_ready": SimpleNamespace(
+        spec=_VALID_SPEC,
+        readiness=(False, "Repository Ready condition not found"),
+        repo_behavior=None,
+        paths_result=None,
+        reason="RepoNotReady",
+        message="Repository Ready condition not found",
+        event_message="Repository not ready: Repository Ready condition not found",
+    ),
+    "repository_not_found": SimpleNamespace(
+        spec=_VALID_SPEC,
+        readiness=(True, ""),
+        repo_behavior=ApiException(status=404),
+        paths_result=None,
+        reason="RepoNotReady",
+        message="Repository test-repo not found",
+        event_message="Repository test-repo not found",
+    ),
+    "invalid_paths": SimpleNamespace(
+        spec=_VALID_SPEC,
+        readiness=(True, ""),
+        repo_behavior=_REPO_OBJ,
+        paths_result=(False, "Playbook file not found: playbooks/test.yml"),
+        reason="InvalidPath",
+        message="Playbook file not found: playbooks/test.yml",
+        event_message="Path validation failed: Playbook file not found: playbooks/test.yml",
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def valid_spec() -> Mapping[str, Any]:
+    """Read-only Playbook spec with a repository reference and playbook path."""
+    return _VALID_SPEC
+
+
+@pytest.fixture(scope="module")
+def repo_obj() -> Mapping[str, Any]:
+    """Read-only Repository object as returned by the custom objects API."""
+    return _REPO_OBJ
+
+
+@pytest.mark.xdist_group(name="playbook_validation")
 class TestPlaybookValidation:
     """Test playbook validation and condition management."""
 
-    def test_reconcile_playbook_missing_repo_ref(self):
-        """Test that missing repository reference sets Ready=False."""
-        spec: dict[str, Any] = {}
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
-
-        # Create meta mock that returns None for deletionTimestamp
-        meta_mock = MagicMock()
-        meta_mock.get.side_effect = lambda key, default=None: (
-            None if key == "deletionTimestamp" else MagicMock()
+    _run = staticmethod(
+        functools.partial(
+            reconcile_playbook, name="test-playbook", namespace="default", uid="uid-123"
         )
-
-        # Mock the event emission to capture calls
-        with patch("ansible_operator.main._emit_event") as mock_emit:
-            reconcile_playbook(
-                spec=spec,
-                status=status,
-                patch=mock_patch,
-                name="test-playbook",
-                namespace="default",
-                uid="uid-123",
-                meta=meta_mock,
-            )
-
-        # Check conditions were set in mock_patch.status
-        conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 1
-
-        ready_condition = conditions[0]
-        assert ready_condition == {
-            "type": "Ready",
-            "status": "False",
-            "reason": "RepoRefMissing",
-            "message": "spec.repositoryRef.name must be set",
-        }
-
-        # Check event was emitted
-        mock_emit.assert_called_once_with(
-            kind="Playbook",
-            namespace="default",
-            name="test-playbook",
-            reason="ValidateFailed",
-            message="spec.repositoryRef.name must be set",
-            type_="Warning",
-        )
-
-    def test_reconcile_playbook_missing_playbook_path(self):
-        """Test that missing playbook path sets Ready=False."""
-        spec: dict[str, Any] = {
-            "repositoryRef": {"name": "test-repo"},
-        }
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
-
-        # Create meta mock that returns None for deletionTimestamp
-        meta_mock = MagicMock()
-        meta_mock.get.side_effect = lambda key, default=None: (
-            None if key == "deletionTimestamp" else MagicMock()
-        )
-
-        # Mock the event emission to capture calls
-        with patch("ansible_operator.main._emit_event") as mock_emit:
-            reconcile_playbook(
-                spec=spec,
-                status=status,
-                patch=mock_patch,
-                name="test-playbook",
-                namespace="default",
-                uid="uid-123",
-                meta=meta_mock,
-            )
-
-        # Check conditions were set in mock_patch.status
-        conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 1
-
-        ready_condition = conditions[0]
-        assert ready_condition == {
-            "type": "Ready",
-            "status": "False",
-            "reason": "InvalidPath",
-            "message": "spec.playbookPath must be set",
-        }
-
-        # Check event was emitted
-        mock_emit.assert_called_once_with(
-            kind="Playbook",
-            namespace="default",
-            name="test-playbook",
-            reason="ValidateFailed",
-            message="spec.playbookPath must be set",
-            type_="Warning",
+    )
+
+    @pytest.fixture(autouse=True)
+    def patched(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        """Stub event emission, GitService and the custom objects API for every test."""
+        mocks = SimpleNamespace(
+            emit=Mock(),
+            git=Mock(return_value=Mock(spec=GitService)),
+            api=Mock(return_value=Mock(spec=_main.client.CustomObjectsApi)),
         )
-
-    def test_reconcile_playbook_repository_not_ready(self):
-        """Test that repository not ready sets Ready=False with RepoNotReady reason."""
-        spec: dict[str, Any] = {
-            "repositoryRef": {"name": "test-repo"},
-            "playbookPath": "playbooks/test.yml",
-        }
+        monkeypatch.setattr(_main, "_emit_event", mocks.emit)
+        monkeypatch.setattr(_main, "GitService", mocks.git)
+        monkeypatch.setattr(_main.client, "CustomObjectsApi", mocks.api)
+        return mocks
+
+    @pytest.fixture
+    def happy_git(self, patched, repo_obj, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        """Configure a ready Repository whose paths validate, plus a stub batch API."""
+        mock_git_service = patched.git.return_value
+        mock_git_service.check_repository_readiness.return_value = (True, "")
+        mock_git_service.validate_repository_paths.return_value = (True, "")
+        patched.api.return_value.get_namespaced_custom_object.return_value = repo_obj
+        monkeypatch.setattr(_main.client, "BatchV1Api", Mock())
+        return patched
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def failure_outcomes(cls) -> dict[str, tuple[MockPatch, Mock]]:
+        """Run reconcile_playbook once per failure scenario and keep the results."""
+        outcomes: dict[str, tuple[MockPatch, Mock]] = {}
+        custom_objects_api = _main.client.CustomObjectsApi
+        with contextlib.ExitStack() as stack:
+            emit_event = stack.enter_context(patch.object(_main, "_emit_event"))
+            git_service_class = stack.enter_context(patch.object(_main, "GitService"))
+            api_class = stack.enter_context(patch.object(_main.client, "CustomObjectsApi"))
+
+            for scenario_id, scenario in _FAILURE_SCENARIOS.items():
+                # Fresh collaborators per scenario behind the shared patches
+                emit = Mock()
+                emit_event.side_effect = emit
+                git_service = git_service_class.return_value = Mock(spec=GitService)
+                api = api_class.return_value = Mock(spec=custom_objects_api)
+                if scenario.readiness is not None:
+                    git_service.check_repository_readiness.return_value = scenario.readiness
+                if scenario.paths_result is not None:
+                    git_service.validate_repository_paths.return_value = scenario.paths_result
+                if isinstance(scenario.repo_behavior, Exception):
+                    api.get_namespaced_custom_object.side_effect = scenario.repo_behavior
+                elif scenario.repo_behavior is not None:
+                    api.get_namespaced_custom_object.return_value = scenario.repo_behavior
+
+                mock_patch = MockPatch()
+                cls._run(spec=scenario.spec, status={}, patch=mock_patch, meta={})
+                outcomes[scenario_id] = (mock_patch, emit)
+        return outcomes
+
+    @pytest.mark.parametrize("scenario_id", list(_FAILURE_SCENARIOS))
+    def test_reconcile_playbook_failure_sets_ready_false(self, failure_outcomes, scenario_id):
+        """Test that each validation failure sets a single Ready=False condition."""
+        mock_patch, _ = failure_outcomes[scenario_id]
+        scenario = _FAILURE_SCENARIOS[scenario_id]
+
+        _assert_ready(mock_patch, status="False", reason=scenario.reason, message=scenario.message)
+
+    @pytest.mark.parametrize("scenario_id", list(_FAILURE_SCENARIOS))
+    def test_reconcile_playbook_failure_emits_validate_failed(self, failure_outcomes, scenario_id):
+        """Test that each validation failure emits one ValidateFailed warning."""
+        _, mock_emit = failure_outcomes[scenario_id]
+
+        _assert_validate_failed(mock_emit, _FAILURE_SCENARIOS[scenario_id].event_message)
+
+    def test_reconcile_playbook_success(self, happy_git, valid_spec):
+        """Test successful playbook validation sets Ready=True."""
+        spec = valid_spec
         status: dict[str, Any] = {}
         mock_patch = MockPatch()
 
-        # Mock GitService to return repository not ready
-        with patch("ansible_operator.main.GitService") as mock_git_service_class:
-            mock_git_service = MagicMock()
-            mock_git_service.check_repository_readiness.return_value = (
-                False,
-                "Repository Ready condition not found",
-            )
-            mock_git_service_class.return_value = mock_git_service
-
-            # Create meta mock that returns None for deletionTimestamp
-            meta_mock = MagicMock()
-            meta_mock.get.side_effect = lambda key, default=None: (
-                None if key == "deletionTimestamp" else MagicMock()
-            )
-            meta_mock.annotations = {}
-
-            # Mock the event emission to capture calls
-            with patch("ansible_operator.main._emit_event") as mock_emit:
-                reconcile_playbook(
-                    spec=spec,
-                    status=status,
-                    patch=mock_patch,
-                    name="test-playbook",
-                    namespace="default",
-                    uid="uid-123",
-                    meta=meta_mock,
-                )
-
-        # Check conditions were set in mock_patch.status
-        conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 1
-
-        ready_condition = conditions[0]
-        assert ready_condition == {
-            "type": "Ready",
-            "status": "False",
-            "reason": "RepoNotReady",
-            "message": "Repository Ready condition not found",
-        }
-
-        # Check event was emitted
-        mock_emit.assert_called_once_with(
-            kind="Playbook",
-            namespace="default",
-            name="test-playbook",
-            reason="ValidateFailed",
-            message="Repository not ready: Repository Ready condition not found",
-            type_="Warning",
-        )
-
-    def test_reconcile_playbook_repository_not_found(self):
-        """Test that repository not found sets Ready=False with RepoNotReady reason."""
-        spec: dict[str, Any] = {
-            "repositoryRef": {"name": "test-repo"},
-            "playbookPath": "playbooks/test.yml",
-        }
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
+        # Kopf meta without a deletionTimestamp
+        meta_mock: dict[str, Any] = {}
 
-        # Mock GitService to return repository ready
-        with patch("ansible_operator.main.GitService") as mock_git_service_class:
-            mock_git_service = MagicMock()
-            mock_git_service.check_repository_readiness.return_value = (True, "")
-            mock_git_service_class.return_value = mock_git_service
-
-            # Mock Kubernetes API to return 404 for repository
-            with patch("ansible_operator.main.client.CustomObjectsApi") as mock_api_class:
-                mock_api = MagicMock()
-                mock_api.get_namespaced_custom_object.side_effect = client.exceptions.ApiException(
-                    status=404
-                )
-                mock_api_class.return_value = mock_api
-
-                # Create meta mock that returns None for deletionTimestamp
-                meta_mock = MagicMock()
-                meta_mock.get.side_effect = lambda key, default=None: (
-                    None if key == "deletionTimestamp" else MagicMock()
-                )
-
-                # Mock the event emission to capture calls
-                with patch("ansible_operator.main._emit_event") as mock_emit:
-                    reconcile_playbook(
-                        spec=spec,
-                        status=status,
-                        patch=mock_patch,
-                        name="test-playbook",
-                        namespace="default",
-                        uid="uid-123",
-                        meta=meta_mock,
-                    )
-
-        # Check conditions were set in mock_patch.status
-        conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 1
-
-        ready_condition = conditions[0]
-        assert ready_condition == {
-            "type": "Ready",
-            "status": "False",
-            "reason": "RepoNotReady",
-            "message": "Repository test-repo not found",
-        }
+        self._run(spec=spec, status=status, patch=mock_patch, meta=meta_mock)
 
-        # Check event was emitted
-        mock_emit.assert_called_once_with(
-            kind="Playbook",
-            namespace="default",
-            name="test-playbook",
-            reason="ValidateFailed",
-            message="Repository test-repo not found",
-            type_="Warning",
+        # Check the single Ready condition set in mock_patch.status
+        _assert_ready(
+            mock_patch,
+            status="True",
+            reason="Validated",
+            message="Playbook paths and repository validated successfully",
         )
 
-    def test_reconcile_playbook_invalid_paths(self):
-        """Test that invalid paths set Ready=False with InvalidPath reason."""
-        spec: dict[str, Any] = {
-            "repositoryRef": {"name": "test-repo"},
-            "playbookPath": "playbooks/test.yml",
-        }
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
-
-        # Mock GitService to return repository ready but paths invalid
-        with patch("ansible_operator.main.GitService") as mock_git_service_class:
-            mock_git_service = MagicMock()
-            mock_git_service.check_repository_readiness.return_value = (True, "")
-            mock_git_service.validate_repository_paths.return_value = (
-                False,
-                "Playbook file not found: playbooks/test.yml",
-            )
-            mock_git_service_class.return_value = mock_git_service
-
-            # Mock Kubernetes API to return repository
-            with patch("ansible_operator.main.client.CustomObjectsApi") as mock_api_class:
-                mock_api = MagicMock()
-                mock_api.get_namespaced_custom_object.return_value = {
-                    "spec": {"url": "https://github.com/test/repo.git"}
-                }
-                mock_api_class.return_value = mock_api
-
-                # Create meta mock that returns None for deletionTimestamp
-                meta_mock = MagicMock()
-                meta_mock.get.side_effect = lambda key, default=None: (
-                    None if key == "deletionTimestamp" else MagicMock()
-                )
-
-                # Mock the event emission to capture calls
-                with patch("ansible_operator.main._emit_event") as mock_emit:
-                    reconcile_playbook(
-                        spec=spec,
-                        status=status,
-                        patch=mock_patch,
-                        name="test-playbook",
-                        namespace="default",
-                        uid="uid-123",
-                        meta=meta_mock,
-                    )
-
-        # Check conditions were set in mock_patch.status
-        conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 1
-
-        ready_condition = conditions[0]
-        assert ready_condition == {
-            "type": "Ready",
-            "status": "False",
-            "reason": "InvalidPath",
-            "message": "Playbook file not found: playbooks/test.yml",
-        }
-
-        # Check event was emitted
-        mock_emit.assert_called_once_with(
-            kind="Playbook",
-            namespace="default",
-            name="test-playbook",
-            reason="ValidateFailed",
-            message="Path validation failed: Playbook file not found: playbooks/test.yml",
-            type_="Warning",
-        )
-
-    def test_reconcile_playbook_success(self):
-        """Test successful playbook validation sets Ready=True."""
-        spec: dict[str, Any] = {
-            "repositoryRef": {"name": "test-repo"},
-            "playbookPath": "playbooks/test.yml",
-        }
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
-
-        # Mock GitService to return repository ready and paths valid
-        with (
-            patch("ansible_operator.main.GitService") as mock_git_service_class,
-            patch("ansible_operator.main.client.CustomObjectsApi") as mock_api_class,
-            patch("ansible_operator.main.client.BatchV1Api") as mock_batch_api_class,
-            patch(
-                "ansible_operator.services.dependencies.DependencyService"
-            ) as mock_dependency_service_class,
-            patch(
-                "ansible_operator.services.manual_run.ManualRunService"
-            ) as mock_manual_run_service_class,
-        ):
-
-            mock_git_service = MagicMock()
-            mock_git_service.check_repository_readiness.return_value = (True, "")
-            mock_git_service.validate_repository_paths.return_value = (True, "")
-            mock_git_service_class.return_value = mock_git_service
-
-            mock_api = MagicMock()
-            mock_api.get_namespaced_custom_object.return_value = {
-                "spec": {"url": "https://github.com/test/repo.git"}
-            }
-            mock_api_class.return_value = mock_api
-
-            mock_batch_api = MagicMock()
-            mock_batch_api_class.return_value = mock_batch_api
-
-            mock_dependency_service = MagicMock()
-            mock_dependency_service_class.return_value = mock_dependency_service
-            mock_dependency_service.index_playbook_dependencies.return_value = None
-            mock_dependency_service.requeue_dependent_schedules.return_value = None
-
-            mock_manual_run_service = MagicMock()
-            mock_manual_run_service_class.return_value = mock_manual_run_service
-            mock_manual_run_service.detect_manual_run_request.return_value = None
-
-            # Create meta mock that returns None for deletionTimestamp
-            meta_mock = MagicMock()
-            meta_mock.get.side_effect = lambda key, default=None: (
-                None if key == "deletionTimestamp" else MagicMock()
-            )
-            meta_mock.annotations = {}
-
-            # Mock the event emission to capture calls
-            with patch("ansible_operator.main._emit_event") as mock_emit:
-                reconcile_playbook(
-                    spec=spec,
-                    status=status,
-                    patch=mock_patch,
-                    name="test-playbook",
-                    namespace="default",
-                    uid="uid-123",
-                    meta=meta_mock,
-                )
-
-        # Check conditions were set in mock_patch.status
-        conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 1
-
-        ready_condition = conditions[0]
-        assert ready_condition == {
-            "type": "Ready",
-            "status": "True",
-            "reason": "Validated",
-            "message": "Playbook paths and repository validated successfully",
-        }
-
         # Check ValidateSucceeded event was emitted
-        mock_emit.assert_any_call(
+        happy_git.emit.assert_any_call(
             kind="Playbook",
             namespace="default",
             name="test-playbook",
@@ -389,7 +228,7 @@ class TestPlaybookValidation:
             message="Playbook validation completed successfully",
         )
 
-    def test_reconcile_playbook_cross_namespace_repo(self):
+    def test_reconcile_playbook_cross_namespace_repo(self, happy_git):
         """Test playbook validation with cross-namespace repository reference."""
         spec: dict[str, Any] = {
             "repositoryRef": {"name": "test-repo", "namespace": "other-namespace"},
@@ -398,82 +237,51 @@ class TestPlaybookValidation:
         status: dict[str, Any] = {}
         mock_patch = MockPatch()
 
-        # Mock GitService to return repository ready and paths valid
-        with (
-            patch("ansible_operator.main.GitService") as mock_git_service_class,
-            patch("ansible_operator.main.client.CustomObjectsApi") as mock_api_class,
-            patch("ansible_operator.main.client.BatchV1Api") as mock_batch_api_class,
-            patch(
-                "ansible_operator.services.dependencies.DependencyService"
-            ) as mock_dependency_service_class,
-            patch(
-                "ansible_operator.services.manual_run.ManualRunService"
-            ) as mock_manual_run_service_class,
-        ):
-
-            mock_git_service = MagicMock()
-            mock_git_service.check_repository_readiness.return_value = (True, "")
-            mock_git_service.validate_repository_paths.return_value = (True, "")
-            mock_git_service_class.return_value = mock_git_service
-
-            mock_api = MagicMock()
-            mock_api.get_namespaced_custom_object.return_value = {
-                "spec": {"url": "https://github.com/test/repo.git"}
-            }
-            mock_api_class.return_value = mock_api
-
-            mock_batch_api = MagicMock()
-            mock_batch_api_class.return_value = mock_batch_api
-
-            mock_dependency_service = MagicMock()
-            mock_dependency_service_class.return_value = mock_dependency_service
-            mock_dependency_service.index_playbook_dependencies.return_value = None
-            mock_dependency_service.requeue_dependent_schedules.return_value = None
-
-            mock_manual_run_service = MagicMock()
-            mock_manual_run_service_class.return_value = mock_manual_run_service
-            mock_manual_run_service.detect_manual_run_request.return_value = None
-
-            # Create meta mock that returns None for deletionTimestamp
-            meta_mock = MagicMock()
-            meta_mock.get.side_effect = lambda key, default=None: (
-                None if key == "deletionTimestamp" else MagicMock()
-            )
-            meta_mock.annotations = {}
-
-            # Mock the event emission to capture calls
-            with patch("ansible_operator.main._emit_event") as mock_emit:
-                reconcile_playbook(
-                    spec=spec,
-                    status=status,
-                    patch=mock_patch,
-                    name="test-playbook",
-                    namespace="default",
-                    uid="uid-123",
-                    meta=meta_mock,
-                )
+        # Kopf meta without a deletionTimestamp
+        meta_mock: dict[str, Any] = {}
+
+        self._run(spec=spec, status=status, patch=mock_patch, meta=meta_mock)
 
         # Verify that the repository was fetched from the correct namespace
-        mock_api.get_namespaced_custom_object.assert_any_call(
-            group="ansible.cloud37.dev",
-            version="v1alpha1",
-            namespace="other-namespace",
-            plural="repositories",
-            name="test-repo",
-        )
+        repo_get = happy_git.api.return_value.get_namespaced_custom_object
+        assert (
+            ("group", "ansible.cloud37.dev"),
+            ("version", "v1alpha1"),
+            ("namespace", "other-namespace"),
+            ("plural", "repositories"),
+            ("name", "test-repo"),
+        ) in [tuple(call.kwargs.items()) for call in repo_get.call_args_list]
 
         # Verify GitService was called with correct namespace
-        mock_git_service.check_repository_readiness.assert_called_once_with(
-            "test-repo", "other-namespace"
-        )
-        mock_git_service.validate_repository_paths.assert_called_once_with(
-            {"url": "https://github.com/test/repo.git"}, spec, "other-namespace"
+        mock_git_service = happy_git.git.return_value
+        readiness = mock_git_service.check_repository_readiness
+        assert readiness.call_count == 1
+        assert readiness.call_args.args == ("test-repo", "other-namespace")
+        validate_paths = mock_git_service.validate_repository_paths
+        assert validate_paths.call_count == 1
+        assert validate_paths.call_args.args == (
+            {"url": "https://github.com/test/repo.git"},
+            spec,
+            "other-namespace",
         )
 
 
+@pytest.mark.xdist_group(name="git_service")
 class TestGitService:
     """Test GitService functionality."""
 
+    @pytest.fixture
+    def clone_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point GitService's temporary clone at a real directory under tmp_path."""
+        monkeypatch.setattr(
+            _git,
+            "tempfile",
+            SimpleNamespace(TemporaryDirectory=lambda: contextlib.nullcontext(str(tmp_path))),
+        )
+        clone_dir = tmp_path / "repo"
+        clone_dir.mkdir()
+        return clone_dir
+
     def test_validate_repository_paths_missing_url(self):
         """Test validation with missing repository URL."""
         git_service = GitService()
@@ -496,11 +304,10 @@ class TestGitService:
         assert not is_valid
         assert "Playbook path not specified" in error
 
-    @patch("ansible_operator.services.git.subprocess.run")
+    @patch.object(_git.subprocess, "run")
     def test_validate_repository_paths_clone_failure(self, mock_run):
         """Test validation with git clone failure."""
-        mock_run.return_value.returncode = 1
-        mock_run.return_value.stderr = "Permission denied"
+        mock_run.return_value = SimpleNamespace(returncode=1, stderr="Permission denied")
 
         git_service = GitService()
         repo_spec = {"url": "https://github.com/test/repo.git"}
@@ -511,13 +318,13 @@ class TestGitService:
         assert not is_valid
         assert "Failed to clone repository: Permission denied" in error
 
-    @patch("ansible_operator.services.git.subprocess.run")
+    @patch.object(_git.subprocess, "run")
     def test_validate_repository_paths_checkout_failure(self, mock_run):
         """Test validation with git checkout failure."""
         # First call succeeds (clone), second fails (checkout)
         mock_run.side_effect = [
-            MagicMock(returncode=0, stderr=""),  # clone success
-            MagicMock(returncode=1, stderr="Revision not found"),  # checkout failure
+            SimpleNamespace(returncode=0, stderr=""),  # clone success
+            SimpleNamespace(returncode=1, stderr="Revision not found"),  # checkout failure
         ]
 
         git_service = GitService()
@@ -532,23 +339,11 @@ class TestGitService:
         assert not is_valid
         assert "Failed to checkout revision nonexistent-revision: Revision not found" in error
 
-    @patch("ansible_operator.services.git.subprocess.run")
-    @patch("ansible_operator.services.git.Path")
-    def test_validate_repository_paths_missing_playbook_file(self, mock_path, mock_run):
+    @patch.object(_git.subprocess, "run")
+    def test_validate_repository_paths_missing_playbook_file(self, mock_run, clone_dir):
         """Test validation with missing playbook file."""
         # Mock successful git operations
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stderr = ""
-
-        # Mock Path behavior
-        mock_clone_dir = MagicMock()
-        mock_playbook_file = MagicMock()
-        mock_playbook_file.exists.return_value = False
-
-        # Set up the chain: Path(temp_dir) / "repo" -> clone_dir
-        mock_path.return_value.__truediv__.return_value = mock_clone_dir
-        # Set up: clone_dir / playbook_path -> playbook_file
-        mock_clone_dir.__truediv__.return_value = mock_playbook_file
+        mock_run.return_value = SimpleNamespace(returncode=0, stderr="")
 
         git_service = GitService()
         repo_spec = {"url": "https://github.com/test/repo.git"}
@@ -559,33 +354,13 @@ class TestGitService:
         assert not is_valid
         assert "Playbook file not found: missing.yml" in error
 
-    @patch("ansible_operator.services.git.subprocess.run")
-    @patch("ansible_operator.services.git.Path")
-    def test_validate_repository_paths_missing_inventory_file(self, mock_path, mock_run):
+    @patch.object(_git.subprocess, "run")
+    def test_validate_repository_paths_missing_inventory_file(self, mock_run, clone_dir):
         """Test validation with missing inventory file."""
         # Mock successful git operations
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stderr = ""
-
-        # Mock Path behavior
-        mock_clone_dir = MagicMock()
-        mock_playbook_file = MagicMock()
-        mock_playbook_file.exists.return_value = True
-        mock_inventory_file = MagicMock()
-        mock_inventory_file.exists.return_value = False
-
-        # Set up the chain: Path(temp_dir) / "repo" -> clone_dir
-        mock_path.return_value.__truediv__.return_value = mock_clone_dir
+        mock_run.return_value = SimpleNamespace(returncode=0, stderr="")
 
-        # Set up different returns for different paths
-        def mock_truediv(path_str):
-            if "playbook.yml" in str(path_str):
-                return mock_playbook_file
-            elif "inventory/hosts" in str(path_str):
-                return mock_inventory_file
-            return MagicMock()
-
-        mock_clone_dir.__truediv__.side_effect = mock_truediv
+        (clone_dir / "playbook.yml").touch()
 
         git_service = GitService()
         repo_spec = {"url": "https://github.com/test/repo.git"}
@@ -599,33 +374,13 @@ class TestGitService:
         assert not is_valid
         assert "Inventory file not found: inventory/hosts" in error
 
-    @patch("ansible_operator.services.git.subprocess.run")
-    @patch("ansible_operator.services.git.Path")
-    def test_validate_repository_paths_missing_ansible_cfg(self, mock_path, mock_run):
+    @patch.object(_git.subprocess, "run")
+    def test_validate_repository_paths_missing_ansible_cfg(self, mock_run, clone_dir):
         """Test validation with missing ansible.cfg file."""
         # Mock successful git operations
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stderr = ""
-
-        # Mock Path behavior
-        mock_clone_dir = MagicMock()
-        mock_playbook_file = MagicMock()
-        mock_playbook_file.exists.return_value = True
-        mock_ansible_cfg_file = MagicMock()
-        mock_ansible_cfg_file.exists.return_value = False
-
-        # Set up the chain: Path(temp_dir) / "repo" -> clone_dir
-        mock_path.return_value.__truediv__.return_value = mock_clone_dir
+        mock_run.return_value = SimpleNamespace(returncode=0, stderr="")
 
-        # Set up different returns for different paths
-        def mock_truediv(path_str):
-            if "playbook.yml" in str(path_str):
-                return mock_playbook_file
-            elif "ansible.cfg" in str(path_str):
-                return mock_ansible_cfg_file
-            return MagicMock()
-
-        mock_clone_dir.__truediv__.side_effect = mock_truediv
+        (clone_dir / "playbook.yml").touch()
 
         git_service = GitService()
         repo_spec = {"url": "https://github.com/test/repo.git"}
@@ -639,13 +394,35 @@ class TestGitService:
         assert not is_valid
         assert "Ansible config file not found: ansible.cfg" in error
 
-    @patch("ansible_operator.services.git.client.CustomObjectsApi")
+    @patch.object(_git.subprocess, "run")
+    def test_validate_repository_paths_all_files_present(self, mock_run, clone_dir):
+        """Test validation succeeds when every referenced file exists."""
+        # Mock successful git operations
+        mock_run.return_value = SimpleNamespace(returncode=0, stderr="")
+
+        (clone_dir / "playbook.yml").touch()
+        (clone_dir / "inventory").mkdir()
+        (clone_dir / "inventory" / "hosts").touch()
+        (clone_dir / "ansible.cfg").touch()
+
+        git_service = GitService()
+        repo_spec = {"url": "https://github.com/test/repo.git"}
+        playbook_spec = {
+            "playbookPath": "playbook.yml",
+            "inventoryPath": "inventory/hosts",
+            "ansibleCfgPath": "ansible.cfg",
+        }
+
+        assert git_service.validate_repository_paths(repo_spec, playbook_spec, "default") == (
+            True,
+            "",
+        )
+
+    @patch.object(_git.client, "CustomObjectsApi")
     def test_check_repository_readiness_not_found(self, mock_api_class):
         """Test repository readiness check when repository not found."""
-        mock_api = MagicMock()
-        mock_api.get_namespaced_custom_object.side_effect = client.exceptions.ApiException(
-            status=404
-        )
+        mock_api = Mock()
+        mock_api.get_namespaced_custom_object.side_effect = ApiException(status=404)
         mock_api_class.return_value = mock_api
 
         git_service = GitService()
@@ -654,10 +431,10 @@ class TestGitService:
         assert not is_ready
         assert "Repository missing-repo not found" in error
 
-    @patch("ansible_operator.services.git.client.CustomObjectsApi")
+    @patch.object(_git.client, "CustomObjectsApi")
     def test_check_repository_readiness_no_ready_condition(self, mock_api_class):
         """Test repository readiness check when Ready condition is missing."""
-        mock_api = MagicMock()
+        mock_api = Mock()
         mock_api.get_namespaced_custom_object.return_value = {"status": {"conditions": []}}
         mock_api_class.return_value = mock_api
 
@@ -667,10 +444,10 @@ class TestGitService:
         assert not is_ready
         assert "Repository Ready condition not found" in error
 
-    @patch("ansible_operator.services.git.client.CustomObjectsApi")
+    @patch.object(_git.client, "CustomObjectsApi")
     def test_check_repository_readiness_not_ready(self, mock_api_class):
         """Test repository readiness check when repository is not ready."""
-        mock_api = MagicMock()
+        mock_api = Mock()
         mock_api.get_namespaced_custom_object.return_value = {
             "status": {
                 "conditions": [
@@ -691,10 +468,10 @@ class TestGitService:
         assert not is_ready
         assert "Repository not ready: AuthValid - Authentication failed" in error
 
-    @patch("ansible_operator.services.git.client.CustomObjectsApi")
+    @patch.object(_git.client, "CustomObjectsApi")
     def test_check_repository_readiness_success(self, mock_api_class):
         """Test successful repository readiness check."""
-        mock_api = MagicMock()
+        mock_api = Mock()
         mock_api.get_namespaced_custom_object.return_value = {
             "status": {
                 "conditions": [
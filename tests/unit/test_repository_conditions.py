@@ -1,7 +1,9 @@
+from collections.abc import Iterator
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, call, patch
 
-from kubernetes import client
+import pytest
 
 from ansible_operator.main import (
     _emit_event,
@@ -11,459 +13,378 @@ from ansible_operator.main import (
 )
 
 
-class MockPatch:
-    """Mock Kopf patch object."""
+def _repository_event(**kwargs: Any) -> Any:
+    """Build the expected _emit_event call for the test Repository."""
+    return call(kind="Repository", namespace="default", name="test-repo", **kwargs)
 
-    def __init__(self):
-        self.status = {}
-        self.meta = MagicMock()
 
+# Repository specs are shared read-only across test cases
+_SPEC_MISSING_URL = MappingProxyType({})
+_SPEC_TOKEN_AUTH_WITHOUT_SECRET = MappingProxyType(
+    {"url": "https://github.com/example/repo.git", "auth": {"method": "token"}}
+)
+_SPEC_SSH_MISSING_KNOWN_HOSTS = MappingProxyType(
+    {
+        "url": "git@github.com:example/repo.git",
+        "auth": {"method": "ssh", "secretRef": {"name": "ssh-secret"}},
+        "ssh": {
+            "knownHostsConfigMapRef": {"name": "known-hosts"},
+            "strictHostKeyChecking": True,
+        },
+    }
+)
+_SPEC_TOKEN_AUTH = MappingProxyType(
+    {
+        "url": "https://github.com/example/repo.git",
+        "auth": {"method": "token", "secretRef": {"name": "token-secret"}},
+    }
+)
 
-class TestRepositoryConditions:
-    """Test repository condition management and event emission."""
-
-    def test_reconcile_repository_missing_url(self):
-        """Test that missing URL sets AuthValid=False and Ready=False."""
-        spec: dict[str, Any] = {}
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
-
-        # Create meta mock that returns None for deletionTimestamp
-        meta_mock = MagicMock()
-        meta_mock.get.side_effect = lambda key, default=None: (
-            None if key == "deletionTimestamp" else MagicMock()
-        )
-
-        # Mock the event emission to capture calls
-        with patch("ansible_operator.main._emit_event") as mock_emit:
-            reconcile_repository(
-                spec=spec,
-                status=status,
-                patch=mock_patch,
-                name="test-repo",
-                namespace="default",
-                uid="uid-123",
-                meta=meta_mock,
-            )
-
-        # Check conditions were set in mock_patch.status
-        conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 2
-
-        # Find conditions by type
-        auth_valid = next(c for c in conditions if c["type"] == "AuthValid")
-        ready = next(c for c in conditions if c["type"] == "Ready")
-
-        assert auth_valid == {
-            "type": "AuthValid",
-            "status": "False",
-            "reason": "MissingURL",
-            "message": "spec.url must be set",
-        }
-        assert ready == {
-            "type": "Ready",
-            "status": "False",
-            "reason": "InvalidSpec",
-            "message": "Repository spec invalid",
+# Metadata of the connectivity probe Job owned by the test Repository
+_JOB_META = {
+    "name": "test-repo-probe",
+    "namespace": "default",
+    "labels": {"ansible.cloud37.dev/probe-type": "connectivity"},
+    "ownerReferences": [
+        {
+            "kind": "Repository",
+            "apiVersion": "ansible.cloud37.dev/v1alpha1",
+            "uid": "repo-uid",
         }
+    ],
+}
+
+
+def _job_event(succeeded: int, failed: int) -> dict[str, Any]:
+    """Build a probe Job event with the given completion counts."""
+    return {"object": {"metadata": _JOB_META, "status": {"succeeded": succeeded, "failed": failed}}}
+
+
+# Expected _emit_event calls, keyed by test case id
+EXPECTED_EMIT = {
+    "missing_url": _repository_event(
+        reason="ValidateFailed", message="Missing spec.url", type_="Warning"
+    ),
+    "missing_auth_secret": _repository_event(
+        reason="ValidateFailed",
+        message="auth.method set but auth.secretRef.name missing",
+        type_="Warning",
+    ),
+    "missing_known_hosts_configmap": _repository_event(
+        reason="ValidateFailed",
+        message="SSH known hosts ConfigMap 'known-hosts' not found",
+        type_="Warning",
+    ),
+    "probe_success": _repository_event(
+        reason="ValidateSucceeded",
+        message="Repository connectivity and clone capability verified",
+    ),
+    "probe_failure": _repository_event(
+        reason="ValidateFailed",
+        message="Repository connectivity check failed",
+        type_="Warning",
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def meta() -> dict[str, Any]:
+    """Kopf meta for a Repository that is not being deleted."""
+    return {}
 
-        # Check event was emitted
-        mock_emit.assert_called_once_with(
-            kind="Repository",
-            namespace="default",
-            name="test-repo",
-            reason="ValidateFailed",
-            message="Missing spec.url",
-            type_="Warning",
-        )
 
-    def test_reconcile_repository_missing_auth_secret(self):
-        """Test that missing auth secret sets AuthValid=False and Ready=False."""
-        spec = {"url": "https://github.com/example/repo.git", "auth": {"method": "token"}}
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
+class TestRepositoryConditions:
+    """Test repository condition management and event emission."""
 
-        # Create meta mock that returns None for deletionTimestamp
-        meta_mock = MagicMock()
-        meta_mock.get.side_effect = lambda key, default=None: (
-            None if key == "deletionTimestamp" else MagicMock()
-        )
+    @pytest.fixture(autouse=True)
+    def _k8s_mocks(self) -> Iterator[None]:
+        """Patch the Kubernetes API classes the Repository handlers construct."""
+        with (
+            patch("kubernetes.client.CoreV1Api") as core_api,
+            patch("kubernetes.client.BatchV1Api") as batch_api,
+            patch("kubernetes.client.CustomObjectsApi") as custom_objects_api,
+        ):
+            self.core = core_api.return_value
+            self.batch = batch_api.return_value
+            self.custom_objects = custom_objects_api.return_value
+            yield
+
+    @pytest.mark.parametrize(
+        "spec,expected_conditions,expected_event",
+        [
+            pytest.param(
+                _SPEC_MISSING_URL,
+                {
+                    "AuthValid": {
+                        "type": "AuthValid",
+                        "status": "False",
+                        "reason": "MissingURL",
+                        "message": "spec.url must be set",
+                    },
+                    "Ready": {
+                        "type": "Ready",
+                        "status": "False",
+                        "reason": "InvalidSpec",
+                        "message": "Repository spec invalid",
+                    },
+                },
+                EXPECTED_EMIT["missing_url"],
+                id="missing_url",
+            ),
+            pytest.param(
+                _SPEC_TOKEN_AUTH_WITHOUT_SECRET,
+                {
+                    "AuthValid": {
+                        "type": "AuthValid",
+                        "status": "False",
+                        "reason": "SecretMissing",
+                        "message": "auth.secretRef.name must be set when auth.method is provided",
+                    },
+                    "Ready": {
+                        "type": "Ready",
+                        "status": "False",
+                        "reason": "InvalidSpec",
+                        "message": "Repository auth invalid",
+                    },
+                },
+                EXPECTED_EMIT["missing_auth_secret"],
+                id="missing_auth_secret",
+            ),
+            pytest.param(
+                _SPEC_SSH_MISSING_KNOWN_HOSTS,
+                {
+                    "AuthValid": {
+                        "type": "AuthValid",
+                        "status": "False",
+                        "reason": "ConfigMapNotFound",
+                        "message": "SSH known hosts ConfigMap 'known-hosts' not found",
+                    },
+                    "Ready": {
+                        "type": "Ready",
+                        "status": "False",
+                        "reason": "InvalidSpec",
+                        "message": "Repository auth invalid",
+                    },
+                },
+                EXPECTED_EMIT["missing_known_hosts_configmap"],
+                id="missing_known_hosts_configmap",
+            ),
+            pytest.param(
+                _SPEC_TOKEN_AUTH,
+                {
+                    "AuthValid": {
+                        "type": "AuthValid",
+                        "status": "Unknown",
+                        "reason": "ProbeRunning",
+                        "message": "Connectivity probe in progress",
+                    },
+                    "CloneReady": {
+                        "type": "CloneReady",
+                        "status": "Unknown",
+                        "reason": "Deferred",
+                        "message": "Waiting for connectivity probe",
+                    },
+                    "Ready": {
+                        "type": "Ready",
+                        "status": "Unknown",
+                        "reason": "Deferred",
+                        "message": "Repository connectivity being probed",
+                    },
+                },
+                None,
+                id="probe_running",
+            ),
+        ],
+    )
+    def test_reconcile_repository_conditions(
+        self, by_type, meta, spec, expected_conditions, expected_event
+    ):
+        """Test the conditions and event each Repository spec produces."""
+        from kubernetes.client.exceptions import ApiException
+
+        # reconcile_repository writes finalizers into patch.meta
+        mock_patch = SimpleNamespace(status={}, meta={})
+
+        with patch.multiple(
+            "ansible_operator.main", _emit_event=DEFAULT, build_connectivity_probe_job=DEFAULT
+        ) as main_mocks:
+            main_mocks["build_connectivity_probe_job"].return_value = {
+                "metadata": {"name": "test-repo-probe"}
+            }
+            # Referenced known_hosts ConfigMaps do not exist
+            self.core.read_namespaced_config_map.side_effect = ApiException(status=404)
 
-        with patch("ansible_operator.main._emit_event") as mock_emit:
             reconcile_repository(
                 spec=spec,
-                status=status,
+                status={},
                 patch=mock_patch,
                 name="test-repo",
                 namespace="default",
                 uid="uid-123",
-                meta=meta_mock,
+                meta=meta,
             )
 
-        # Check conditions were set
+        mock_emit = main_mocks["_emit_event"]
         conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 2
-
-        # Find conditions by type
-        auth_valid = next(c for c in conditions if c["type"] == "AuthValid")
-        ready = next(c for c in conditions if c["type"] == "Ready")
-
-        assert auth_valid == {
-            "type": "AuthValid",
-            "status": "False",
-            "reason": "SecretMissing",
-            "message": "auth.secretRef.name must be set when auth.method is provided",
-        }
-        assert ready == {
-            "type": "Ready",
-            "status": "False",
-            "reason": "InvalidSpec",
-            "message": "Repository auth invalid",
-        }
-
-        # Check event was emitted
-        mock_emit.assert_called_once_with(
-            kind="Repository",
-            namespace="default",
-            name="test-repo",
-            reason="ValidateFailed",
-            message="auth.method set but auth.secretRef.name missing",
-            type_="Warning",
-        )
+        assert by_type(conditions) == expected_conditions
+        assert len(conditions) == len(expected_conditions)
 
-    @patch("kubernetes.client.CoreV1Api")
-    def test_reconcile_repository_missing_known_hosts_configmap(self, mock_core_api):
-        """Test that missing known_hosts ConfigMap sets AuthValid=False and Ready=False."""
-        # Mock ConfigMap read to raise 404
-        mock_api = MagicMock()
-        mock_api.read_namespaced_config_map.side_effect = client.exceptions.ApiException(status=404)
-        mock_core_api.return_value = mock_api
-
-        spec = {
-            "url": "git@github.com:example/repo.git",
-            "auth": {"method": "ssh", "secretRef": {"name": "ssh-secret"}},
-            "ssh": {
-                "knownHostsConfigMapRef": {"name": "known-hosts"},
-                "strictHostKeyChecking": True,
-            },
-        }
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
+        if expected_event is None:
+            mock_emit.assert_not_called()
+        else:
+            assert mock_emit.call_args == expected_event
+            assert mock_emit.call_count == 1
 
-        # Create meta mock that returns None for deletionTimestamp
-        meta_mock = MagicMock()
-        meta_mock.get.side_effect = lambda key, default=None: (
-            None if key == "deletionTimestamp" else MagicMock()
-        )
+    def test_handle_job_completion_probe_success(self, by_type):
+        """Test that successful probe sets AuthValid=True, CloneReady=True, Ready=True."""
+        with patch.multiple("ansible_operator.main", _emit_event=DEFAULT) as main_mocks:
+            handle_job_completion(_job_event(1, 0))
+        mock_emit = main_mocks["_emit_event"]
 
-        with patch("ansible_operator.main._emit_event") as mock_emit:
-            reconcile_repository(
-                spec=spec,
-                status=status,
-                patch=mock_patch,
-                name="test-repo",
-                namespace="default",
-                uid="uid-123",
-                meta=meta_mock,
-            )
+        # Check that patch_namespaced_custom_object_status was called
+        self.custom_objects.patch_namespaced_custom_object_status.assert_called_once()
+        call_args = self.custom_objects.patch_namespaced_custom_object_status.call_args
+        patch_body = call_args[1]["body"]
 
-        # Check conditions were set
-        conditions = mock_patch.status.get("conditions", [])
-        assert len(conditions) == 2
+        # Check conditions in patch body
+        conditions = patch_body["status"]["conditions"]
+        assert len(conditions) == 3
 
         # Find conditions by type
-        auth_valid = next(c for c in conditions if c["type"] == "AuthValid")
-        ready = next(c for c in conditions if c["type"] == "Ready")
+        indexed = by_type(conditions)
+        auth_valid = indexed["AuthValid"]
+        clone_ready = indexed["CloneReady"]
+        ready = indexed["Ready"]
 
         assert auth_valid == {
             "type": "AuthValid",
-            "status": "False",
-            "reason": "ConfigMapNotFound",
-            "message": "SSH known hosts ConfigMap 'known-hosts' not found",
+            "status": "True",
+            "reason": "ProbeSucceeded",
+            "message": "Connectivity probe successful",
+        }
+        assert clone_ready == {
+            "type": "CloneReady",
+            "status": "True",
+            "reason": "ProbeSucceeded",
+            "message": "Repository clone ready",
         }
         assert ready == {
             "type": "Ready",
-            "status": "False",
-            "reason": "InvalidSpec",
-            "message": "Repository auth invalid",
+            "status": "True",
+            "reason": "Validated",
+            "message": "Repository is ready for use",
         }
 
         # Check event was emitted
-        mock_emit.assert_called_once_with(
-            kind="Repository",
-            namespace="default",
-            name="test-repo",
-            reason="ValidateFailed",
-            message="SSH known hosts ConfigMap 'known-hosts' not found",
-            type_="Warning",
-        )
-
-    @patch("kubernetes.client.BatchV1Api")
-    @patch("ansible_operator.main.build_connectivity_probe_job")
-    def test_reconcile_repository_probe_running_conditions(self, mock_build_job, mock_batch_api):
-        """Test that probe running sets conditions to Unknown."""
-        mock_build_job.return_value = {"metadata": {"name": "test-repo-probe"}}
+        assert mock_emit.call_args == EXPECTED_EMIT["probe_success"]
+        assert mock_emit.call_count == 1
 
-        spec = {
-            "url": "https://github.com/example/repo.git",
-            "auth": {"method": "token", "secretRef": {"name": "token-secret"}},
-        }
-        status: dict[str, Any] = {}
-        mock_patch = MockPatch()
-
-        # Create meta mock that returns None for deletionTimestamp
-        meta_mock = MagicMock()
-        meta_mock.get.side_effect = lambda key, default=None: (
-            None if key == "deletionTimestamp" else MagicMock()
-        )
+    def test_handle_job_completion_probe_failure(self, by_type):
+        """Test that failed probe sets AuthValid=False, CloneReady=False, Ready=False."""
+        with patch.multiple("ansible_operator.main", _emit_event=DEFAULT) as main_mocks:
+            handle_job_completion(_job_event(0, 1))
+        mock_emit = main_mocks["_emit_event"]
 
-        reconcile_repository(
-            spec=spec,
-            status=status,
-            patch=mock_patch,
-            name="test-repo",
-            namespace="default",
-            uid="uid-123",
-            meta=meta_mock,
-        )
+        # Check that patch_namespaced_custom_object_status was called
+        self.custom_objects.patch_namespaced_custom_object_status.assert_called_once()
+        call_args = self.custom_objects.patch_namespaced_custom_object_status.call_args
+        patch_body = call_args[1]["body"]
 
-        # Check conditions were set for probe running
-        conditions = mock_patch.status.get("conditions", [])
+        # Check conditions in patch body
+        conditions = patch_body["status"]["conditions"]
         assert len(conditions) == 3
 
         # Find conditions by type
-        auth_valid = next(c for c in conditions if c["type"] == "AuthValid")
-        clone_ready = next(c for c in conditions if c["type"] == "CloneReady")
-        ready = next(c for c in conditions if c["type"] == "Ready")
+        indexed = by_type(conditions)
+        auth_valid = indexed["AuthValid"]
+        clone_ready = indexed["CloneReady"]
+        ready = indexed["Ready"]
 
         assert auth_valid == {
             "type": "AuthValid",
-            "status": "Unknown",
-            "reason": "ProbeRunning",
-            "message": "Connectivity probe in progress",
+            "status": "False",
+            "reason": "ProbeFailed",
+            "message": "Connectivity probe failed",
         }
         assert clone_ready == {
             "type": "CloneReady",
-            "status": "Unknown",
-            "reason": "Deferred",
-            "message": "Waiting for connectivity probe",
+            "status": "False",
+            "reason": "ProbeFailed",
+            "message": "Cannot attempt clone without connectivity",
         }
         assert ready == {
             "type": "Ready",
-            "status": "Unknown",
-            "reason": "Deferred",
-            "message": "Repository connectivity being probed",
-        }
-
-    @patch("kubernetes.client.CustomObjectsApi")
-    @patch("ansible_operator.main._emit_event")
-    def test_handle_job_completion_probe_success(self, mock_emit, mock_custom_api):
-        """Test that successful probe sets AuthValid=True, CloneReady=True, Ready=True."""
-        # Mock the repository exists
-        mock_api = MagicMock()
-        mock_custom_api.return_value = mock_api
-
-        job_event = {
-            "object": {
-                "metadata": {
-                    "name": "test-repo-probe",
-                    "namespace": "default",
-                    "labels": {"ansible.cloud37.dev/probe-type": "connectivity"},
-                    "ownerReferences": [
-                        {
-                            "kind": "Repository",
-                            "apiVersion": "ansible.cloud37.dev/v1alpha1",
-                            "uid": "repo-uid",
-                        }
-                    ],
-                },
-                "status": {"succeeded": 1, "failed": 0},
-            }
-        }
-
-        with patch("kubernetes.client.CustomObjectsApi") as mock_co_api_class:
-            mock_co_instance = MagicMock()
-            mock_co_api_class.return_value = mock_co_instance
-
-            handle_job_completion(job_event)
-
-            # Check that patch_namespaced_custom_object_status was called
-            mock_co_instance.patch_namespaced_custom_object_status.assert_called_once()
-            call_args = mock_co_instance.patch_namespaced_custom_object_status.call_args
-            patch_body = call_args[1]["body"]
-
-            # Check conditions in patch body
-            conditions = patch_body["status"]["conditions"]
-            assert len(conditions) == 3
-
-            # Find conditions by type
-            auth_valid = next(c for c in conditions if c["type"] == "AuthValid")
-            clone_ready = next(c for c in conditions if c["type"] == "CloneReady")
-            ready = next(c for c in conditions if c["type"] == "Ready")
-
-            assert auth_valid == {
-                "type": "AuthValid",
-                "status": "True",
-                "reason": "ProbeSucceeded",
-                "message": "Connectivity probe successful",
-            }
-            assert clone_ready == {
-                "type": "CloneReady",
-                "status": "True",
-                "reason": "ProbeSucceeded",
-                "message": "Repository clone ready",
-            }
-            assert ready == {
-                "type": "Ready",
-                "status": "True",
-                "reason": "Validated",
-                "message": "Repository is ready for use",
-            }
-
-            # Check event was emitted
-            mock_emit.assert_called_once_with(
-                kind="Repository",
-                namespace="default",
-                name="test-repo",
-                reason="ValidateSucceeded",
-                message="Repository connectivity and clone capability verified",
-            )
-
-    @patch("kubernetes.client.CustomObjectsApi")
-    @patch("ansible_operator.main._emit_event")
-    def test_handle_job_completion_probe_failure(self, mock_emit, mock_custom_api):
-        """Test that failed probe sets AuthValid=False, CloneReady=False, Ready=False."""
-        # Mock the repository exists
-        mock_api = MagicMock()
-        mock_custom_api.return_value = mock_api
-
-        job_event = {
-            "object": {
-                "metadata": {
-                    "name": "test-repo-probe",
-                    "namespace": "default",
-                    "labels": {"ansible.cloud37.dev/probe-type": "connectivity"},
-                    "ownerReferences": [
-                        {
-                            "kind": "Repository",
-                            "apiVersion": "ansible.cloud37.dev/v1alpha1",
-                            "uid": "repo-uid",
-                        }
-                    ],
-                },
-                "status": {"succeeded": 0, "failed": 1},
-            }
+            "status": "False",
+            "reason": "ProbeFailed",
+            "message": "Repository connectivity check failed",
         }
 
-        with patch("kubernetes.client.CustomObjectsApi") as mock_co_api_class:
-            mock_co_instance = MagicMock()
-            mock_co_api_class.return_value = mock_co_instance
-
-            handle_job_completion(job_event)
-
-            # Check that patch_namespaced_custom_object_status was called
-            mock_co_instance.patch_namespaced_custom_object_status.assert_called_once()
-            call_args = mock_co_instance.patch_namespaced_custom_object_status.call_args
-            patch_body = call_args[1]["body"]
-
-            # Check conditions in patch body
-            conditions = patch_body["status"]["conditions"]
-            assert len(conditions) == 3
-
-            # Find conditions by type
-            auth_valid = next(c for c in conditions if c["type"] == "AuthValid")
-            clone_ready = next(c for c in conditions if c["type"] == "CloneReady")
-            ready = next(c for c in conditions if c["type"] == "Ready")
-
-            assert auth_valid == {
-                "type": "AuthValid",
-                "status": "False",
-                "reason": "ProbeFailed",
-                "message": "Connectivity probe failed",
-            }
-            assert clone_ready == {
-                "type": "CloneReady",
-                "status": "False",
-                "reason": "ProbeFailed",
-                "message": "Cannot attempt clone without connectivity",
-            }
-            assert ready == {
-                "type": "Ready",
-                "status": "False",
-                "reason": "ProbeFailed",
-                "message": "Repository connectivity check failed",
-            }
-
-            # Check event was emitted
-            mock_emit.assert_called_once_with(
-                kind="Repository",
-                namespace="default",
-                name="test-repo",
-                reason="ValidateFailed",
-                message="Repository connectivity check failed",
-                type_="Warning",
-            )
+        # Check event was emitted
+        assert mock_emit.call_args == EXPECTED_EMIT["probe_failure"]
+        assert mock_emit.call_count == 1
 
 
 class TestConditionHelpers:
     """Test condition update and event emission helpers."""
 
-    def test_update_condition_replaces_existing(self):
-        """Test that _update_condition replaces existing conditions of the same type."""
-        status = {
-            "conditions": [
+    @pytest.mark.parametrize(
+        "initial,args,expected",
+        [
+            pytest.param(
                 {
-                    "type": "AuthValid",
-                    "status": "Unknown",
-                    "reason": "OldReason",
-                    "message": "Old message",
+                    "conditions": [
+                        {
+                            "type": "AuthValid",
+                            "status": "Unknown",
+                            "reason": "OldReason",
+                            "message": "Old message",
+                        },
+                        {
+                            "type": "Ready",
+                            "status": "True",
+                            "reason": "OldReason",
+                            "message": "Old message",
+                        },
+                    ]
                 },
+                ("AuthValid", "True", "NewReason", "New message"),
                 {
-                    "type": "Ready",
-                    "status": "True",
-                    "reason": "OldReason",
-                    "message": "Old message",
+                    "AuthValid": {
+                        "type": "AuthValid",
+                        "status": "True",
+                        "reason": "NewReason",
+                        "message": "New message",
+                    },
+                    "Ready": {
+                        "type": "Ready",
+                        "status": "True",
+                        "reason": "OldReason",
+                        "message": "Old message",
+                    },
                 },
-            ]
-        }
-
-        _update_condition(status, "AuthValid", "True", "NewReason", "New message")
-
-        conditions = status["conditions"]
-        assert len(conditions) == 2
-
-        # AuthValid should be updated
-        auth_valid = next(c for c in conditions if c["type"] == "AuthValid")
-        assert auth_valid == {
-            "type": "AuthValid",
-            "status": "True",
-            "reason": "NewReason",
-            "message": "New message",
-        }
-
-        # Ready should be unchanged
-        ready = next(c for c in conditions if c["type"] == "Ready")
-        assert ready == {
-            "type": "Ready",
-            "status": "True",
-            "reason": "OldReason",
-            "message": "Old message",
-        }
-
-    def test_update_condition_creates_new(self):
-        """Test that _update_condition creates new conditions when none exist."""
-        status: dict[str, Any] = {}
-
-        _update_condition(status, "AuthValid", "True", "NewReason", "New message")
-
-        conditions = status["conditions"]
-        assert len(conditions) == 1
-        assert conditions[0] == {
-            "type": "AuthValid",
-            "status": "True",
-            "reason": "NewReason",
-            "message": "New message",
-        }
+                id="replaces_existing",
+            ),
+            pytest.param(
+                {},
+                ("AuthValid", "True", "NewReason", "New message"),
+                {
+                    "AuthValid": {
+                        "type": "AuthValid",
+                        "status": "True",
+                        "reason": "NewReason",
+                        "message": "New message",
+                    },
+                },
+                id="creates_new",
+            ),
+        ],
+    )
+    def test_update_condition(self, by_type, initial, args, expected):
+        """Test that _update_condition replaces a condition of the same type or adds it."""
+        _update_condition(initial, *args)
+
+        assert by_type(initial["conditions"]) == expected
+        assert len(initial["conditions"]) == len(expected)
 
     @patch("ansible_operator.main.client")
     def test_emit_event_success(self, mock_client):
@@ -1,11 +1,13 @@
 """Tests for repository reconciliation with existing probe jobs."""
 
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from kubernetes import client
+from unittest.mock import Mock
 
+from ansible_operator import main as _main
 from ansible_operator.main import reconcile_repository
-from ansible_operator.constants import API_GROUP_VERSION
 
 
 class MockApiException(Exception):
@@ -16,347 +18,155 @@ class MockApiException(Exception):
         self.status = status
 
 
-class TestRepositoryExistingProbeJobs:
-    """Test repository reconciliation with existing probe jobs."""
-
-    @patch("ansible_operator.main.client")
-    @patch("ansible_operator.main.build_connectivity_probe_job")
-    @patch("ansible_operator.main.dependency_service")
-    @patch("ansible_operator.main.structured_logging")
-    @patch("ansible_operator.main.metrics")
-    @patch("ansible_operator.main._get_executor_service_account")
-    def test_reconcile_repository_existing_job_succeeded(
-        self, mock_sa, mock_metrics, mock_logging, mock_deps, mock_build_job, mock_client
-    ):
-        """Test repository reconciliation when existing probe job has succeeded."""
-        # Setup mocks
-        mock_sa.return_value = "executor-sa"
-
-        # Mock Kubernetes API clients
-        mock_batch_api = Mock()
-        mock_client.BatchV1Api.return_value = mock_batch_api
-
-        # Mock job creation failure (409 - already exists)
-        mock_api_exception = MockApiException(status=409, reason="Job already exists")
-        mock_batch_api.create_namespaced_job.side_effect = mock_api_exception
-
-        # Mock existing job with succeeded status
-        mock_existing_job = Mock()
-        mock_existing_job.status.succeeded = 1
-        mock_existing_job.status.failed = 0
-        mock_batch_api.read_namespaced_job.return_value = mock_existing_job
-
-        # Mock job manifest
-        mock_job_manifest = {"apiVersion": "batch/v1", "kind": "Job"}
-        mock_build_job.return_value = mock_job_manifest
-
-        # Mock patch object
-        mock_patch = Mock()
-        mock_patch.status = {}
-        mock_patch.meta = {}
-
-        # Call the function
-        reconcile_repository(
-            spec={"url": "https://github.com/test/repo"},
-            status={},
-            patch=mock_patch,
-            name="test-repo",
-            namespace="default",
-            uid="test-uid",
-            meta={},
-        )
-
-        # Verify job creation was attempted
-        mock_batch_api.create_namespaced_job.assert_called_once()
-
-        # Verify existing job was read
-        mock_batch_api.read_namespaced_job.assert_called_once_with(
-            name="test-repo-probe", namespace="default"
-        )
-
-        # Verify job was NOT patched (already succeeded)
-        mock_batch_api.patch_namespaced_job.assert_not_called()
-
-        # Verify conditions were set to succeeded
-        assert len(mock_patch.status["conditions"]) == 3
-        conditions = {c["type"]: c for c in mock_patch.status["conditions"]}
-        assert conditions["AuthValid"]["status"] == "True"
-        assert conditions["AuthValid"]["reason"] == "ProbeSucceeded"
-        assert conditions["CloneReady"]["status"] == "True"
-        assert conditions["CloneReady"]["reason"] == "ProbeSucceeded"
-        assert conditions["Ready"]["status"] == "True"
-        assert conditions["Ready"]["reason"] == "Validated"
-
-        # Verify logging
-        mock_logging.logger.info.assert_called()
-        log_calls = [call[0][0] for call in mock_logging.logger.info.call_args_list]
-        assert any("Existing probe job already succeeded" in call for call in log_calls)
-
-    @patch("ansible_operator.main.client")
-    @patch("ansible_operator.main.build_connectivity_probe_job")
-    @patch("ansible_operator.main.dependency_service")
-    @patch("ansible_operator.main.structured_logging")
-    @patch("ansible_operator.main.metrics")
-    @patch("ansible_operator.main._get_executor_service_account")
-    def test_reconcile_repository_existing_job_failed(
-        self, mock_sa, mock_metrics, mock_logging, mock_deps, mock_build_job, mock_client
-    ):
-        """Test repository reconciliation when existing probe job has failed."""
-        # Setup mocks
-        mock_sa.return_value = "executor-sa"
-
-        # Mock Kubernetes API clients
-        mock_batch_api = Mock()
-        mock_client.BatchV1Api.return_value = mock_batch_api
-
-        # Mock job creation failure (409 - already exists)
-        mock_api_exception = MockApiException(status=409, reason="Job already exists")
-        mock_batch_api.create_namespaced_job.side_effect = mock_api_exception
-
-        # Mock existing job with failed status
-        mock_existing_job = Mock()
-        mock_existing_job.status.succeeded = 0
-        mock_existing_job.status.failed = 1
-        mock_batch_api.read_namespaced_job.return_value = mock_existing_job
-
-        # Mock job manifest
-        mock_job_manifest = {"apiVersion": "batch/v1", "kind": "Job"}
-        mock_build_job.return_value = mock_job_manifest
-
-        # Mock patch object
-        mock_patch = Mock()
-        mock_patch.status = {}
-        mock_patch.meta = {}
-
-        # Call the function
-        reconcile_repository(
-            spec={"url": "https://github.com/test/repo"},
-            status={},
-            patch=mock_patch,
-            name="test-repo",
-            namespace="default",
-            uid="test-uid",
-            meta={},
-        )
-
-        # Verify job creation was attempted
-        mock_batch_api.create_namespaced_job.assert_called_once()
-
-        # Verify existing job was read
-        mock_batch_api.read_namespaced_job.assert_called_once_with(
-            name="test-repo-probe", namespace="default"
-        )
-
-        # Verify job was NOT patched (already failed)
-        mock_batch_api.patch_namespaced_job.assert_not_called()
-
-        # Verify conditions were set to failed
-        assert len(mock_patch.status["conditions"]) == 3
-        conditions = {c["type"]: c for c in mock_patch.status["conditions"]}
-        assert conditions["AuthValid"]["status"] == "False"
-        assert conditions["AuthValid"]["reason"] == "ProbeFailed"
-        assert conditions["CloneReady"]["status"] == "False"
-        assert conditions["CloneReady"]["reason"] == "ProbeFailed"
-        assert conditions["Ready"]["status"] == "False"
-        assert conditions["Ready"]["reason"] == "ProbeFailed"
-
-        # Verify logging
-        mock_logging.logger.info.assert_called()
-        log_calls = [call[0][0] for call in mock_logging.logger.info.call_args_list]
-        assert any("Existing probe job already failed" in call for call in log_calls)
-
-    @patch("ansible_operator.main.client")
-    @patch("ansible_operator.main.build_connectivity_probe_job")
-    @patch("ansible_operator.main.dependency_service")
-    @patch("ansible_operator.main.structured_logging")
-    @patch("ansible_operator.main.metrics")
-    @patch("ansible_operator.main._get_executor_service_account")
-    def test_reconcile_repository_existing_job_running(
-        self, mock_sa, mock_metrics, mock_logging, mock_deps, mock_build_job, mock_client
-    ):
-        """Test repository reconciliation when existing probe job is still running."""
-        # Setup mocks
-        mock_sa.return_value = "executor-sa"
-
-        # Mock Kubernetes API clients
-        mock_batch_api = Mock()
-        mock_client.BatchV1Api.return_value = mock_batch_api
-
-        # Mock job creation failure (409 - already exists)
-        mock_api_exception = MockApiException(status=409, reason="Job already exists")
-        mock_batch_api.create_namespaced_job.side_effect = mock_api_exception
-
-        # Mock existing job that's still running
-        mock_existing_job = Mock()
-        mock_existing_job.status.succeeded = None
-        mock_existing_job.status.failed = None
-        mock_batch_api.read_namespaced_job.return_value = mock_existing_job
-
-        # Mock job manifest
-        mock_job_manifest = {"apiVersion": "batch/v1", "kind": "Job"}
-        mock_build_job.return_value = mock_job_manifest
-
-        # Mock patch object
-        mock_patch = Mock()
-        mock_patch.status = {}
-        mock_patch.meta = {}
-
-        # Call the function
-        reconcile_repository(
-            spec={"url": "https://github.com/test/repo"},
-            status={},
-            patch=mock_patch,
-            name="test-repo",
-            namespace="default",
-            uid="test-uid",
-            meta={},
-        )
-
-        # Verify job creation was attempted
-        mock_batch_api.create_namespaced_job.assert_called_once()
-
-        # Verify existing job was read
-        mock_batch_api.read_namespaced_job.assert_called_once_with(
-            name="test-repo-probe", namespace="default"
-        )
-
-        # Verify job was patched (still running)
-        mock_batch_api.patch_namespaced_job.assert_called_once_with(
-            name="test-repo-probe",
-            namespace="default",
-            body=mock_job_manifest,
-            field_manager="ansible-operator",
-        )
-
-        # Verify conditions were set to running
-        assert len(mock_patch.status["conditions"]) == 3
-        conditions = {c["type"]: c for c in mock_patch.status["conditions"]}
-        assert conditions["AuthValid"]["status"] == "Unknown"
-        assert conditions["AuthValid"]["reason"] == "ProbeRunning"
-        assert conditions["CloneReady"]["status"] == "Unknown"
-        assert conditions["CloneReady"]["reason"] == "Deferred"
-        assert conditions["Ready"]["status"] == "Unknown"
-        assert conditions["Ready"]["reason"] == "Deferred"
-
-    @patch("ansible_operator.main.client")
-    @patch("ansible_operator.main.build_connectivity_probe_job")
-    @patch("ansible_operator.main.dependency_service")
-    @patch("ansible_operator.main.structured_logging")
-    @patch("ansible_operator.main.metrics")
-    @patch("ansible_operator.main._get_executor_service_account")
-    def test_reconcile_repository_existing_job_deleted_between_calls(
-        self, mock_sa, mock_metrics, mock_logging, mock_deps, mock_build_job, mock_client
-    ):
-        """Test repository reconciliation when existing job is deleted between creation attempt and read."""
-        # Setup mocks
-        mock_sa.return_value = "executor-sa"
-
-        # Mock Kubernetes API clients
-        mock_batch_api = Mock()
-        mock_client.BatchV1Api.return_value = mock_batch_api
-
-        # Mock job creation failure (409 - already exists) then success
-        mock_api_exception = MockApiException(status=409, reason="Job already exists")
-        mock_batch_api.create_namespaced_job.side_effect = [mock_api_exception, None]
-
-        # Mock job read failure (404 - job deleted)
-        mock_job_api_exception = MockApiException(status=404, reason="Job not found")
-        mock_batch_api.read_namespaced_job.side_effect = mock_job_api_exception
-
-        # Mock job manifest
-        mock_job_manifest = {"apiVersion": "batch/v1", "kind": "Job"}
-        mock_build_job.return_value = mock_job_manifest
+# Raised when the existing probe Job is deleted before it can be read
+_EXC_404 = MockApiException(404, "Job not found")
+
+# Condition status and reason by type for each probe Job outcome
+EXPECTED_SUCCEEDED = {
+    "AuthValid": {"status": "True", "reason": "ProbeSucceeded"},
+    "CloneReady": {"status": "True", "reason": "ProbeSucceeded"},
+    "Ready": {"status": "True", "reason": "Validated"},
+}
+EXPECTED_FAILED = {
+    "AuthValid": {"status": "False", "reason": "ProbeFailed"},
+    "CloneReady": {"status": "False", "reason": "ProbeFailed"},
+    "Ready": {"status": "False", "reason": "ProbeFailed"},
+}
+EXPECTED_RUNNING = {
+    "AuthValid": {"status": "Unknown", "reason": "ProbeRunning"},
+    "CloneReady": {"status": "Unknown", "reason": "Deferred"},
+    "Ready": {"status": "Unknown", "reason": "Deferred"},
+}
+
+
+def _project(conditions: list[dict[str, Any]]) -> dict[str, dict[str, str]]:
+    """Reduce conditions to their status and reason, indexed by type."""
+    return {c["type"]: {"status": c["status"], "reason": c["reason"]} for c in conditions}
+
+
+@pytest.fixture(autouse=True)
+def repo_mocks(
+    monkeypatch: pytest.MonkeyPatch, job_manifest: dict[str, Any], batch_api: Mock
+) -> SimpleNamespace:
+    """Replace the collaborators reconcile_repository reaches for."""
+    mocks = SimpleNamespace(
+        sa=Mock(return_value="executor-sa"),
+        batch_api=batch_api,
+        build_job=Mock(return_value=job_manifest),
+        client=Mock(),
+        deps=Mock(),
+        logging=Mock(),
+        metrics=Mock(),
+    )
+    mocks.client.BatchV1Api.return_value = mocks.batch_api
+    monkeypatch.setattr(_main, "_get_executor_service_account", mocks.sa)
+    monkeypatch.setattr(_main, "build_connectivity_probe_job", mocks.build_job)
+    monkeypatch.setattr(_main, "client", mocks.client)
+    monkeypatch.setattr(_main, "dependency_service", mocks.deps)
+    monkeypatch.setattr(_main, "structured_logging", mocks.logging)
+    monkeypatch.setattr(_main, "metrics", mocks.metrics)
+    return mocks
+
+
+def _run_reconcile(mock_patch: Any) -> None:
+    """Reconcile the test Repository into ``mock_patch``."""
+    reconcile_repository(
+        spec={"url": "https://github.com/test/repo"},
+        status={},
+        patch=mock_patch,
+        name="test-repo",
+        namespace="default",
+        uid="test-uid",
+        meta={},
+    )
 
-        # Mock patch object
-        mock_patch = Mock()
-        mock_patch.status = {}
-        mock_patch.meta = {}
 
-        # Call the function
-        reconcile_repository(
-            spec={"url": "https://github.com/test/repo"},
-            status={},
-            patch=mock_patch,
-            name="test-repo",
-            namespace="default",
-            uid="test-uid",
-            meta={},
-        )
-
-        # Verify job creation was attempted twice (first failed, second succeeded)
-        assert mock_batch_api.create_namespaced_job.call_count == 2
-
-        # Verify existing job was read
-        mock_batch_api.read_namespaced_job.assert_called_once_with(
-            name="test-repo-probe", namespace="default"
-        )
-
-        # Verify job was NOT patched
-        mock_batch_api.patch_namespaced_job.assert_not_called()
-
-        # Verify conditions were set to running
-        assert len(mock_patch.status["conditions"]) == 3
-        conditions = {c["type"]: c for c in mock_patch.status["conditions"]}
-        assert conditions["AuthValid"]["status"] == "Unknown"
-        assert conditions["AuthValid"]["reason"] == "ProbeRunning"
+class TestRepositoryExistingProbeJobs:
+    """Test repository reconciliation with existing probe jobs."""
 
-    @patch("ansible_operator.main.client")
-    @patch("ansible_operator.main.build_connectivity_probe_job")
-    @patch("ansible_operator.main.dependency_service")
-    @patch("ansible_operator.main.structured_logging")
-    @patch("ansible_operator.main.metrics")
-    @patch("ansible_operator.main._get_executor_service_account")
-    def test_reconcile_repository_new_job_created(
-        self, mock_sa, mock_metrics, mock_logging, mock_deps, mock_build_job, mock_client
+    @pytest.mark.parametrize(
+        "wiring,expected_conditions,log_msg,patch_called",
+        [
+            pytest.param(
+                {"succeeded": 1, "failed": 0},
+                EXPECTED_SUCCEEDED,
+                "Existing probe job already succeeded",
+                False,
+                id="existing_job_succeeded",
+            ),
+            pytest.param(
+                {"succeeded": 0, "failed": 1},
+                EXPECTED_FAILED,
+                "Existing probe job already failed",
+                False,
+                id="existing_job_failed",
+            ),
+            pytest.param(
+                {},
+                EXPECTED_RUNNING,
+                None,
+                True,
+                id="existing_job_running",
+            ),
+            pytest.param(
+                # Job is deleted between the creation attempt and the read
+                {"read_exc": _EXC_404},
+                EXPECTED_RUNNING,
+                None,
+                False,
+                id="existing_job_deleted_between_calls",
+            ),
+            pytest.param(
+                {"create_sequence": [None]},
+                EXPECTED_RUNNING,
+                None,
+                False,
+                id="new_job_created",
+            ),
+        ],
+    )
+    def test_reconcile_repository_existing_job(
+        self,
+        repo_mocks,
+        wire_existing_job,
+        assert_logged,
+        wiring,
+        expected_conditions,
+        log_msg,
+        patch_called,
     ):
-        """Test repository reconciliation when new probe job is created successfully."""
-        # Setup mocks
-        mock_sa.return_value = "executor-sa"
-
-        # Mock Kubernetes API clients
-        mock_batch_api = Mock()
-        mock_client.BatchV1Api.return_value = mock_batch_api
-
-        # Mock job creation success
-        mock_batch_api.create_namespaced_job.return_value = None
-
-        # Mock job manifest
-        mock_job_manifest = {"apiVersion": "batch/v1", "kind": "Job"}
-        mock_build_job.return_value = mock_job_manifest
-
-        # Mock patch object
-        mock_patch = Mock()
-        mock_patch.status = {}
-        mock_patch.meta = {}
-
-        # Call the function
-        reconcile_repository(
-            spec={"url": "https://github.com/test/repo"},
-            status={},
-            patch=mock_patch,
-            name="test-repo",
-            namespace="default",
-            uid="test-uid",
-            meta={},
-        )
-
-        # Verify job creation was called
-        mock_batch_api.create_namespaced_job.assert_called_once_with(
-            namespace="default", body=mock_job_manifest, field_manager="ansible-operator"
-        )
-
-        # Verify existing job was NOT read
-        mock_batch_api.read_namespaced_job.assert_not_called()
-
-        # Verify job was NOT patched
-        mock_batch_api.patch_namespaced_job.assert_not_called()
-
-        # Verify conditions were set to running
-        assert len(mock_patch.status["conditions"]) == 3
-        conditions = {c["type"]: c for c in mock_patch.status["conditions"]}
-        assert conditions["AuthValid"]["status"] == "Unknown"
-        assert conditions["AuthValid"]["reason"] == "ProbeRunning"
-        assert conditions["CloneReady"]["status"] == "Unknown"
-        assert conditions["CloneReady"]["reason"] == "Deferred"
-        assert conditions["Ready"]["status"] == "Unknown"
-        assert conditions["Ready"]["reason"] == "Deferred"
+        """Test repository reconciliation for each state of the probe job."""
+        mock_batch_api, mock_patch = wire_existing_job(**wiring)
+        _run_reconcile(mock_patch)
+        mock_job_manifest = repo_mocks.build_job.return_value
+
+        if "create_sequence" in wiring:
+            # A newly created job needs no lookup
+            mock_batch_api.create_namespaced_job.assert_called_once_with(
+                namespace="default", body=mock_job_manifest, field_manager="ansible-operator"
+            )
+            mock_batch_api.read_namespaced_job.assert_not_called()
+        else:
+            # Creation is retried once when the existing job disappeared
+            expected_creates = 2 if "read_exc" in wiring else 1
+            assert mock_batch_api.create_namespaced_job.call_count == expected_creates
+            mock_batch_api.read_namespaced_job.assert_called_once_with(
+                name="test-repo-probe", namespace="default"
+            )
+
+        if patch_called:
+            mock_batch_api.patch_namespaced_job.assert_called_once_with(
+                name="test-repo-probe",
+                namespace="default",
+                body=mock_job_manifest,
+                field_manager="ansible-operator",
+            )
+        else:
+            mock_batch_api.patch_namespaced_job.assert_not_called()
+
+        conditions = mock_patch.status["conditions"]
+        assert len(conditions) == 3
+        assert _project(conditions) == expected_conditions
+
+        if log_msg is not None:
+            assert_logged(repo_mocks.logging.logger.info, log_msg)
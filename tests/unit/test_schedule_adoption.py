@@ -2,236 +2,214 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
 from ansible_operator.constants import (
     ANNOTATION_OWNER_UID,
     LABEL_MANAGED_BY,
-    LABEL_OWNER_KIND,
-    LABEL_OWNER_NAME,
     LABEL_OWNER_UID,
 )
 from ansible_operator.main import _can_safely_adopt_cronjob
 
+# Shared read-only metadata; cases that differ build their own dicts
+_MANAGED_BY = MappingProxyType({LABEL_MANAGED_BY: "ansible-operator"})
+_MANAGED_LABELS = MappingProxyType({**_MANAGED_BY, LABEL_OWNER_UID: "test-uid-123"})
+_UID_ANNOTATION = MappingProxyType({ANNOTATION_OWNER_UID: "test-uid-123"})
+_OTHER_UID_ANNOTATION = MappingProxyType({ANNOTATION_OWNER_UID: "different-uid-456"})
+
+
+@dataclass(frozen=True, slots=True)
+class AdoptionCase:
+    """Ownership metadata of an existing CronJob and the expected adoption decision."""
+
+    labels: Mapping[str, str] | None
+    annotations: Mapping[str, str] | None
+    # Owner references as (kind, name, uid)
+    refs: list[tuple[str, str, str]] | None
+    ok: bool
+    reason_substring: str
+    # Adoption reasons are fixed; rejection reasons carry extra detail
+    exact: bool
+
+
+CASES: tuple[object, ...] = (
+    pytest.param(
+        AdoptionCase(
+            labels=_MANAGED_LABELS,
+            annotations={},
+            refs=[],
+            ok=True,
+            reason_substring="matching owner UID",
+            exact=True,
+        ),
+        id="matching_owner_uid_label",
+    ),
+    pytest.param(
+        AdoptionCase(
+            labels=_MANAGED_BY,
+            annotations=_UID_ANNOTATION,
+            refs=[],
+            ok=True,
+            reason_substring="matching owner UID",
+            exact=True,
+        ),
+        id="matching_owner_uid_annotation",
+    ),
+    pytest.param(
+        AdoptionCase(
+            labels={**_MANAGED_LABELS, LABEL_OWNER_UID: "different-uid-456"},
+            annotations={},
+            refs=[],
+            ok=False,
+            reason_substring=(
+                "different owner UID: existing=different-uid-456, current=test-uid-123"
+            ),
+            exact=False,
+        ),
+        id="different_owner_uid",
+    ),
+    pytest.param(
+        # Not managed by ansible-operator
+        AdoptionCase(
+            labels={},
+            annotations={},
+            refs=[("Schedule", "test-schedule", "test-uid-123")],
+            ok=True,
+            reason_substring="matching owner reference",
+            exact=True,
+        ),
+        id="matching_owner_reference",
+    ),
+    pytest.param(
+        # Manual adoption
+        AdoptionCase(
+            labels={},
+            annotations=_UID_ANNOTATION,
+            refs=[],
+            ok=True,
+            reason_substring="matching UID annotation",
+            exact=True,
+        ),
+        id="matching_uid_annotation_only",
+    ),
+    pytest.param(
+        AdoptionCase(
+            labels={},
+            annotations={},
+            refs=[],
+            ok=False,
+            reason_substring="no matching ownership indicators",
+            exact=False,
+        ),
+        id="no_matching_indicators",
+    ),
+    pytest.param(
+        AdoptionCase(
+            labels={},
+            annotations={},
+            refs=[("Schedule", "different-schedule", "different-uid-456")],
+            ok=False,
+            reason_substring="no matching ownership indicators",
+            exact=False,
+        ),
+        id="different_owner_reference",
+    ),
+    pytest.param(
+        # Only the owner name differs
+        AdoptionCase(
+            labels={},
+            annotations={},
+            refs=[("Schedule", "different-schedule", "test-uid-123")],
+            ok=False,
+            reason_substring="no matching ownership indicators",
+            exact=False,
+        ),
+        id="owner_reference_name_mismatch",
+    ),
+    pytest.param(
+        AdoptionCase(
+            labels={LABEL_MANAGED_BY: "other-operator"},
+            annotations={},
+            refs=[],
+            ok=False,
+            reason_substring="no matching ownership indicators",
+            exact=False,
+        ),
+        id="not_managed_by_operator",
+    ),
+    pytest.param(
+        AdoptionCase(
+            labels=None,
+            annotations=None,
+            refs=None,
+            ok=False,
+            reason_substring="no matching ownership indicators",
+            exact=False,
+        ),
+        id="none_labels_and_annotations",
+    ),
+    pytest.param(
+        AdoptionCase(
+            labels={},
+            annotations={},
+            refs=[],
+            ok=False,
+            reason_substring="no matching ownership indicators",
+            exact=False,
+        ),
+        id="empty_labels_and_annotations",
+    ),
+    pytest.param(
+        # Owner UID label takes priority over the annotation
+        AdoptionCase(
+            labels=_MANAGED_LABELS,
+            annotations=_OTHER_UID_ANNOTATION,
+            refs=[],
+            ok=True,
+            reason_substring="matching owner UID",
+            exact=True,
+        ),
+        id="owner_uid_over_annotation",
+    ),
+    pytest.param(
+        # Owner reference takes priority over the UID annotation
+        AdoptionCase(
+            labels={},
+            annotations=_OTHER_UID_ANNOTATION,
+            refs=[("Schedule", "test-schedule", "test-uid-123")],
+            ok=True,
+            reason_substring="matching owner reference",
+            exact=True,
+        ),
+        id="owner_reference_over_annotation",
+    ),
+)
+
 
 class TestScheduleAdoption:
     """Test cases for safe CronJob adoption logic."""
 
-    def test_can_adopt_matching_owner_uid_label(self) -> None:
-        """Test adoption when owner UID label matches."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {
-            LABEL_MANAGED_BY: "ansible-operator",
-            LABEL_OWNER_UID: "test-uid-123",
-        }
-        existing_cj.metadata.annotations = {}
-        existing_cj.metadata.owner_references = []
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is True
-        assert reason == "matching owner UID"
-
-    def test_can_adopt_matching_owner_uid_annotation(self) -> None:
-        """Test adoption when owner UID annotation matches."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {
-            LABEL_MANAGED_BY: "ansible-operator",
-        }
-        existing_cj.metadata.annotations = {
-            ANNOTATION_OWNER_UID: "test-uid-123",
-        }
-        existing_cj.metadata.owner_references = []
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is True
-        assert reason == "matching owner UID"
-
-    def test_cannot_adopt_different_owner_uid(self) -> None:
-        """Test rejection when owner UID doesn't match."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {
-            LABEL_MANAGED_BY: "ansible-operator",
-            LABEL_OWNER_UID: "different-uid-456",
-        }
-        existing_cj.metadata.annotations = {}
-        existing_cj.metadata.owner_references = []
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is False
-        assert "different owner UID" in reason
-        assert "different-uid-456" in reason
-        assert "test-uid-123" in reason
-
-    def test_can_adopt_matching_owner_reference(self) -> None:
-        """Test adoption when owner reference matches."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {}  # Not managed by ansible-operator
-        existing_cj.metadata.annotations = {}
-        owner_ref = Mock()
-        owner_ref.kind = "Schedule"
-        owner_ref.name = "test-schedule"
-        owner_ref.uid = "test-uid-123"
-        existing_cj.metadata.owner_references = [owner_ref]
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is True
-        assert reason == "matching owner reference"
-
-    def test_can_adopt_matching_uid_annotation_only(self) -> None:
-        """Test adoption when only UID annotation matches (manual adoption)."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {}
-        existing_cj.metadata.annotations = {
-            ANNOTATION_OWNER_UID: "test-uid-123",
-        }
-        existing_cj.metadata.owner_references = []
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is True
-        assert reason == "matching UID annotation"
-
-    def test_cannot_adopt_no_matching_indicators(self) -> None:
-        """Test rejection when no ownership indicators match."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {}
-        existing_cj.metadata.annotations = {}
-        existing_cj.metadata.owner_references = []
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is False
-        assert "no matching ownership indicators" in reason
-
-    def test_cannot_adopt_different_owner_reference(self) -> None:
-        """Test rejection when owner reference doesn't match."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {}
-        existing_cj.metadata.annotations = {}
-        existing_cj.metadata.owner_references = [
-            Mock(
-                kind="Schedule",
-                name="different-schedule",
-                uid="different-uid-456",
-            )
-        ]
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is False
-        assert "no matching ownership indicators" in reason
-
-    def test_cannot_adopt_not_managed_by_operator(self) -> None:
-        """Test rejection when CronJob is not managed by ansible-operator."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {
-            LABEL_MANAGED_BY: "other-operator",
-        }
-        existing_cj.metadata.annotations = {}
-        existing_cj.metadata.owner_references = []
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is False
-        assert "no matching ownership indicators" in reason
-
-    def test_handles_none_labels_and_annotations(self) -> None:
-        """Test handling of None labels and annotations."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = None
-        existing_cj.metadata.annotations = None
-        existing_cj.metadata.owner_references = None
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is False
-        assert "no matching ownership indicators" in reason
-
-    def test_handles_empty_labels_and_annotations(self) -> None:
-        """Test handling of empty labels and annotations."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {}
-        existing_cj.metadata.annotations = {}
-        existing_cj.metadata.owner_references = []
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is False
-        assert "no matching ownership indicators" in reason
-
-    def test_priority_order_owner_uid_over_annotation(self) -> None:
-        """Test that owner UID label takes priority over annotation."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {
-            LABEL_MANAGED_BY: "ansible-operator",
-            LABEL_OWNER_UID: "test-uid-123",
-        }
-        existing_cj.metadata.annotations = {
-            ANNOTATION_OWNER_UID: "different-uid-456",
-        }
-        existing_cj.metadata.owner_references = []
-
-        can_adopt, reason = _can_safely_adopt_cronjob(
-            existing_cj, "test-uid-123", "test-schedule", "test-namespace"
-        )
-
-        assert can_adopt is True
-        assert reason == "matching owner UID"
-
-    def test_priority_order_owner_reference_over_annotation(self) -> None:
-        """Test that owner reference takes priority over UID annotation."""
-        existing_cj = Mock()
-        existing_cj.metadata = Mock()
-        existing_cj.metadata.labels = {}  # Not managed by ansible-operator
-        existing_cj.metadata.annotations = {
-            ANNOTATION_OWNER_UID: "different-uid-456",
-        }
-        owner_ref = Mock()
-        owner_ref.kind = "Schedule"
-        owner_ref.name = "test-schedule"
-        owner_ref.uid = "test-uid-123"
-        existing_cj.metadata.owner_references = [owner_ref]
+    @pytest.mark.parametrize("case", CASES)
+    def test_adopt(
+        self,
+        make_cj: Callable[..., SimpleNamespace],
+        make_owner_ref: Callable[[str, str, str], SimpleNamespace],
+        case: AdoptionCase,
+    ) -> None:
+        """Test the adoption decision and reason for each ownership combination."""
+        refs = None if case.refs is None else [make_owner_ref(*r) for r in case.refs]
+        existing_cj = make_cj(case.labels, case.annotations, refs)
 
         can_adopt, reason = _can_safely_adopt_cronjob(
             existing_cj, "test-uid-123", "test-schedule", "test-namespace"
         )
 
-        assert can_adopt is True
-        assert reason == "matching owner reference"
+        assert can_adopt is case.ok
+        if case.exact:
+            assert reason == case.reason_substring
+        else:
+            assert case.reason_substring in reason
@@ -1,10 +1,12 @@
 """Unit tests for Schedule condition management and concurrency handling."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
-from kubernetes import client
 
 from ansible_operator.constants import COND_BLOCKED_BY_CONCURRENCY, COND_READY
 from ansible_operator.main import (
@@ -14,6 +16,49 @@ from ansible_operator.main import (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class FakeJob:
+    """Job list item exposing only the fields _check_concurrent_jobs reads."""
+
+    name: str
+    active: int | None
+    succeeded: int | None
+    failed: int | None
+
+    @property
+    def metadata(self) -> SimpleNamespace:
+        return SimpleNamespace(name=self.name)
+
+    @property
+    def status(self) -> SimpleNamespace:
+        return SimpleNamespace(active=self.active, succeeded=self.succeeded, failed=self.failed)
+
+
+@pytest.fixture
+def batch_api(monkeypatch: pytest.MonkeyPatch, batch_api: Mock) -> Mock:
+    """Return the BatchV1Api instance that _check_concurrent_jobs constructs."""
+    monkeypatch.setattr("ansible_operator.main.client.BatchV1Api", lambda: batch_api)
+    return batch_api
+
+
+@pytest.fixture
+def emit_recorder(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    """Record the keyword arguments of every _emit_event call."""
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr("ansible_operator.main._emit_event", lambda **kw: calls.append(kw))
+    return calls
+
+
+@pytest.fixture
+def stub_concurrent_jobs(monkeypatch: pytest.MonkeyPatch) -> Callable[[tuple[bool, str]], None]:
+    """Return a helper that fixes the result of _check_concurrent_jobs."""
+
+    def stub(result: tuple[bool, str]) -> None:
+        monkeypatch.setattr("ansible_operator.main._check_concurrent_jobs", lambda *a, **k: result)
+
+    return stub
+
+
 class TestScheduleConditions:
     """Test Schedule condition management."""
 
@@ -30,7 +75,7 @@ class TestScheduleConditions:
         assert condition["reason"] == "TestReason"
         assert condition["message"] == "Test message"
 
-    def test_update_condition_replaces_existing_condition(self):
+    def test_update_condition_replaces_existing_condition(self, by_type):
         """Test that _update_condition replaces existing condition of same type."""
         status = {
             "conditions": [
@@ -52,49 +97,48 @@ class TestScheduleConditions:
         _update_condition(status, "TestCondition", "True", "NewReason", "New message")
 
         assert len(status["conditions"]) == 2
-        test_condition = next(c for c in status["conditions"] if c["type"] == "TestCondition")
+        conditions = by_type(status["conditions"])
+        test_condition = conditions["TestCondition"]
         assert test_condition["status"] == "True"
         assert test_condition["reason"] == "NewReason"
         assert test_condition["message"] == "New message"
 
-        other_condition = next(c for c in status["conditions"] if c["type"] == "OtherCondition")
-        assert other_condition["status"] == "True"  # Unchanged
+        assert conditions["OtherCondition"]["status"] == "True"  # Unchanged
 
-    @patch("ansible_operator.main.client.BatchV1Api")
-    def test_check_concurrent_jobs_no_active_jobs(self, mock_batch_api):
+    def test_check_concurrent_jobs_no_active_jobs(self, batch_api):
         """Test _check_concurrent_jobs when no active jobs exist."""
-        mock_api_instance = Mock()
-        mock_batch_api.return_value = mock_api_instance
+        mock_api_instance = batch_api
 
         # Mock empty job list
         mock_job_list = Mock()
         mock_job_list.items = []
-        mock_api_instance.list_namespaced_job.return_value = mock_job_list
+
+        # Record only the arguments of the single list call
+        seen: dict[str, Any] = {}
+
+        def _list(**kw):
+            seen.update(kw)
+            return mock_job_list
+
+        mock_api_instance.list_namespaced_job = _list
 
         has_concurrent, reason = _check_concurrent_jobs("test-ns", "test-schedule", "test-uid")
 
         assert has_concurrent is False
         assert reason == ""
-        mock_api_instance.list_namespaced_job.assert_called_once_with(
-            namespace="test-ns",
-            label_selector="ansible.cloud37.dev/owner-uid=test-uid",
-        )
+        assert seen == {
+            "namespace": "test-ns",
+            "label_selector": "ansible.cloud37.dev/owner-uid=test-uid",
+        }
 
-    @patch("ansible_operator.main.client.BatchV1Api")
-    def test_check_concurrent_jobs_with_active_jobs(self, mock_batch_api):
+    def test_check_concurrent_jobs_with_active_jobs(self, batch_api):
         """Test _check_concurrent_jobs when active jobs exist."""
-        mock_api_instance = Mock()
-        mock_batch_api.return_value = mock_api_instance
+        mock_api_instance = batch_api
 
-        # Mock job with active status
-        mock_job = Mock()
-        mock_job.metadata.name = "test-job-1"
-        mock_job.status.active = 1
-        mock_job.status.succeeded = None
-        mock_job.status.failed = None
+        # Job with active status
+        mock_job = FakeJob(name="test-job-1", active=1, succeeded=None, failed=None)
 
-        mock_job_list = Mock()
-        mock_job_list.items = [mock_job]
+        mock_job_list = SimpleNamespace(items=[mock_job])
         mock_api_instance.list_namespaced_job.return_value = mock_job_list
 
         has_concurrent, reason = _check_concurrent_jobs("test-ns", "test-schedule", "test-uid")
@@ -102,21 +146,14 @@ class TestScheduleConditions:
         assert has_concurrent is True
         assert "test-job-1" in reason
 
-    @patch("ansible_operator.main.client.BatchV1Api")
-    def test_check_concurrent_jobs_with_pending_jobs(self, mock_batch_api):
+    def test_check_concurrent_jobs_with_pending_jobs(self, batch_api):
         """Test _check_concurrent_jobs when jobs are pending (not completed)."""
-        mock_api_instance = Mock()
-        mock_batch_api.return_value = mock_api_instance
+        mock_api_instance = batch_api
 
-        # Mock job that's pending (no active, succeeded, or failed)
-        mock_job = Mock()
-        mock_job.metadata.name = "test-job-2"
-        mock_job.status.active = None
-        mock_job.status.succeeded = None
-        mock_job.status.failed = None
+        # Job that's pending (no active, succeeded, or failed)
+        mock_job = FakeJob(name="test-job-2", active=None, succeeded=None, failed=None)
 
-        mock_job_list = Mock()
-        mock_job_list.items = [mock_job]
+        mock_job_list = SimpleNamespace(items=[mock_job])
         mock_api_instance.list_namespaced_job.return_value = mock_job_list
 
         has_concurrent, reason = _check_concurrent_jobs("test-ns", "test-schedule", "test-uid")
@@ -124,21 +161,14 @@ class TestScheduleConditions:
         assert has_concurrent is True
         assert "test-job-2" in reason
 
-    @patch("ansible_operator.main.client.BatchV1Api")
-    def test_check_concurrent_jobs_with_completed_jobs(self, mock_batch_api):
+    def test_check_concurrent_jobs_with_completed_jobs(self, batch_api):
         """Test _check_concurrent_jobs when jobs are completed."""
-        mock_api_instance = Mock()
-        mock_batch_api.return_value = mock_api_instance
+        mock_api_instance = batch_api
 
-        # Mock completed job
-        mock_job = Mock()
-        mock_job.metadata.name = "test-job-3"
-        mock_job.status.active = 0
-        mock_job.status.succeeded = 1
-        mock_job.status.failed = None
+        # Completed job
+        mock_job = FakeJob(name="test-job-3", active=0, succeeded=1, failed=None)
 
-        mock_job_list = Mock()
-        mock_job_list.items = [mock_job]
+        mock_job_list = SimpleNamespace(items=[mock_job])
         mock_api_instance.list_namespaced_job.return_value = mock_job_list
 
         has_concurrent, reason = _check_concurrent_jobs("test-ns", "test-schedule", "test-uid")
@@ -146,11 +176,9 @@ class TestScheduleConditions:
         assert has_concurrent is False
         assert reason == ""
 
-    @patch("ansible_operator.main.client.BatchV1Api")
-    def test_check_concurrent_jobs_api_exception(self, mock_batch_api):
+    def test_check_concurrent_jobs_api_exception(self, batch_api):
         """Test _check_concurrent_jobs handles API exceptions gracefully."""
-        mock_api_instance = Mock()
-        mock_batch_api.return_value = mock_api_instance
+        mock_api_instance = batch_api
         mock_api_instance.list_namespaced_job.side_effect = Exception("API Error")
 
         has_concurrent, reason = _check_concurrent_jobs("test-ns", "test-schedule", "test-uid")
@@ -159,165 +187,137 @@ class TestScheduleConditions:
         assert has_concurrent is False
         assert reason == ""
 
-    def test_update_schedule_conditions_ready_state(self):
-        """Test _update_schedule_conditions for ready state."""
+    @pytest.mark.parametrize(
+        "spec,cj_exists,pb_ready,concurrent,expected_ready,expected_reason,"
+        "expected_blocked_status,expected_event_types",
+        [
+            pytest.param(
+                {"concurrencyPolicy": "Forbid"},
+                True,
+                True,
+                (False, ""),
+                "True",
+                "Ready",
+                "False",
+                ["Normal", "Normal"],
+                id="ready_state",
+            ),
+            pytest.param(
+                {"concurrencyPolicy": "Forbid"},
+                False,
+                True,
+                (False, ""),
+                "False",
+                "CronJobMissing",
+                "False",
+                ["Normal", "Warning"],
+                id="cronjob_missing",
+            ),
+            pytest.param(
+                {"concurrencyPolicy": "Forbid"},
+                True,
+                False,
+                (False, ""),
+                "False",
+                "PlaybookNotReady",
+                "False",
+                ["Normal", "Warning"],
+                id="playbook_not_ready",
+            ),
+            pytest.param(
+                {"concurrencyPolicy": "Forbid"},
+                True,
+                True,
+                (True, "Active Jobs: job-1"),
+                "False",
+                "BlockedByConcurrency",
+                "True",
+                ["Warning", "Warning"],
+                id="blocked_by_concurrency",
+            ),
+            pytest.param(
+                # Concurrent jobs do not block Ready, but are still reported
+                {"concurrencyPolicy": "Allow"},
+                True,
+                True,
+                (True, "Active Jobs: job-1"),
+                "True",
+                "Ready",
+                "True",
+                ["Warning", "Normal"],
+                id="allow_concurrency_policy",
+            ),
+            pytest.param(
+                {"concurrencyPolicy": "Replace"},
+                True,
+                True,
+                (True, "Active Jobs: job-1"),
+                "True",
+                "Ready",
+                "True",
+                ["Warning", "Normal"],
+                id="replace_concurrency_policy",
+            ),
+            pytest.param(
+                # No concurrencyPolicy behaves like Forbid
+                {},
+                True,
+                True,
+                (True, "Active Jobs: job-1"),
+                "False",
+                "BlockedByConcurrency",
+                "True",
+                ["Warning", "Warning"],
+                id="default_concurrency_policy",
+            ),
+        ],
+    )
+    def test_update_schedule_conditions(
+        self,
+        by_type,
+        emit_recorder,
+        stub_concurrent_jobs,
+        spec,
+        cj_exists,
+        pb_ready,
+        concurrent,
+        expected_ready,
+        expected_reason,
+        expected_blocked_status,
+        expected_event_types,
+    ):
+        """Test the Ready and BlockedByConcurrency conditions for each Schedule state."""
         patch_status: dict[str, Any] = {}
-        spec = {"concurrencyPolicy": "Forbid"}
 
-        with patch("ansible_operator.main._check_concurrent_jobs", return_value=(False, "")):
-            with patch("ansible_operator.main._emit_event") as mock_emit:
-                _update_schedule_conditions(
-                    patch_status, "test-ns", "test-schedule", "test-uid", spec, True, True
-                )
+        stub_concurrent_jobs(concurrent)
+        _update_schedule_conditions(
+            patch_status, "test-ns", "test-schedule", "test-uid", spec, cj_exists, pb_ready
+        )
 
         conditions = patch_status["conditions"]
         assert len(conditions) == 2
 
-        ready_condition = next(c for c in conditions if c["type"] == COND_READY)
-        assert ready_condition["status"] == "True"
-        assert ready_condition["reason"] == "Ready"
-
-        blocked_condition = next(c for c in conditions if c["type"] == COND_BLOCKED_BY_CONCURRENCY)
-        assert blocked_condition["status"] == "False"
-        assert blocked_condition["reason"] == "NoConcurrentJobs"
-
-        # Should emit events for both conditions
-        assert mock_emit.call_count == 2
-
-    def test_update_schedule_conditions_cronjob_missing(self):
-        """Test _update_schedule_conditions when CronJob is missing."""
-        patch_status: dict[str, Any] = {}
-        spec = {"concurrencyPolicy": "Forbid"}
-
-        with patch("ansible_operator.main._check_concurrent_jobs", return_value=(False, "")):
-            _update_schedule_conditions(
-                patch_status, "test-ns", "test-schedule", "test-uid", spec, False, True
-            )
-
-        conditions = patch_status["conditions"]
-        ready_condition = next(c for c in conditions if c["type"] == COND_READY)
-        assert ready_condition["status"] == "False"
-        assert ready_condition["reason"] == "CronJobMissing"
-
-    def test_update_schedule_conditions_playbook_not_ready(self):
-        """Test _update_schedule_conditions when Playbook is not ready."""
-        patch_status: dict[str, Any] = {}
-        spec = {"concurrencyPolicy": "Forbid"}
-
-        with patch("ansible_operator.main._check_concurrent_jobs", return_value=(False, "")):
-            _update_schedule_conditions(
-                patch_status, "test-ns", "test-schedule", "test-uid", spec, True, False
-            )
-
-        conditions = patch_status["conditions"]
-        ready_condition = next(c for c in conditions if c["type"] == COND_READY)
-        assert ready_condition["status"] == "False"
-        assert ready_condition["reason"] == "PlaybookNotReady"
-
-    def test_update_schedule_conditions_blocked_by_concurrency(self):
-        """Test _update_schedule_conditions when blocked by concurrency."""
-        patch_status: dict[str, Any] = {}
-        spec = {"concurrencyPolicy": "Forbid"}
-
-        with patch(
-            "ansible_operator.main._check_concurrent_jobs",
-            return_value=(True, "Active Jobs: job-1"),
-        ):
-            with patch("ansible_operator.main._emit_event") as mock_emit:
-                _update_schedule_conditions(
-                    patch_status, "test-ns", "test-schedule", "test-uid", spec, True, True
-                )
-
-        conditions = patch_status["conditions"]
-
-        ready_condition = next(c for c in conditions if c["type"] == COND_READY)
-        assert ready_condition["status"] == "False"
-        assert ready_condition["reason"] == "BlockedByConcurrency"
-        assert "job-1" in ready_condition["message"]
-
-        blocked_condition = next(c for c in conditions if c["type"] == COND_BLOCKED_BY_CONCURRENCY)
-        assert blocked_condition["status"] == "True"
-        assert blocked_condition["reason"] == "ConcurrentJobsRunning"
-        assert "job-1" in blocked_condition["message"]
-
-        # Should emit events for both conditions
-        assert mock_emit.call_count == 2
-
-        # Check that Warning events are emitted for blocked conditions
-        warning_calls = [call for call in mock_emit.call_args_list if call[1]["type_"] == "Warning"]
-        assert len(warning_calls) == 2
-
-    def test_update_schedule_conditions_allow_concurrency_policy(self):
-        """Test _update_schedule_conditions with Allow concurrency policy."""
-        patch_status: dict[str, Any] = {}
-        spec = {"concurrencyPolicy": "Allow"}
-
-        with patch(
-            "ansible_operator.main._check_concurrent_jobs",
-            return_value=(True, "Active Jobs: job-1"),
-        ):
-            _update_schedule_conditions(
-                patch_status, "test-ns", "test-schedule", "test-uid", spec, True, True
-            )
-
-        conditions = patch_status["conditions"]
-
-        # With Allow policy, concurrent jobs should not block Ready condition
-        ready_condition = next(c for c in conditions if c["type"] == COND_READY)
-        assert ready_condition["status"] == "True"
-        assert ready_condition["reason"] == "Ready"
-
-        # But BlockedByConcurrency should still reflect the concurrent state
-        blocked_condition = next(c for c in conditions if c["type"] == COND_BLOCKED_BY_CONCURRENCY)
-        assert blocked_condition["status"] == "True"
-        assert blocked_condition["reason"] == "ConcurrentJobsRunning"
-
-    def test_update_schedule_conditions_replace_concurrency_policy(self):
-        """Test _update_schedule_conditions with Replace concurrency policy."""
-        patch_status: dict[str, Any] = {}
-        spec = {"concurrencyPolicy": "Replace"}
-
-        with patch(
-            "ansible_operator.main._check_concurrent_jobs",
-            return_value=(True, "Active Jobs: job-1"),
-        ):
-            _update_schedule_conditions(
-                patch_status, "test-ns", "test-schedule", "test-uid", spec, True, True
-            )
-
-        conditions = patch_status["conditions"]
-
-        # With Replace policy, concurrent jobs should not block Ready condition
-        ready_condition = next(c for c in conditions if c["type"] == COND_READY)
-        assert ready_condition["status"] == "True"
-        assert ready_condition["reason"] == "Ready"
-
-        # But BlockedByConcurrency should still reflect the concurrent state
-        blocked_condition = next(c for c in conditions if c["type"] == COND_BLOCKED_BY_CONCURRENCY)
-        assert blocked_condition["status"] == "True"
-        assert blocked_condition["reason"] == "ConcurrentJobsRunning"
-
-    def test_update_schedule_conditions_default_concurrency_policy(self):
-        """Test _update_schedule_conditions with default (Forbid) concurrency policy."""
-        patch_status: dict[str, Any] = {}
-        spec: dict[str, Any] = {}  # No concurrencyPolicy specified, should default to Forbid
-
-        with patch(
-            "ansible_operator.main._check_concurrent_jobs",
-            return_value=(True, "Active Jobs: job-1"),
-        ):
-            _update_schedule_conditions(
-                patch_status, "test-ns", "test-schedule", "test-uid", spec, True, True
-            )
-
-        conditions = patch_status["conditions"]
-
-        # Should behave like Forbid policy
-        ready_condition = next(c for c in conditions if c["type"] == COND_READY)
-        assert ready_condition["status"] == "False"
-        assert ready_condition["reason"] == "BlockedByConcurrency"
-
-    def test_update_schedule_conditions_no_event_on_no_change(self):
+        ct = by_type(conditions)
+        ready_condition = ct[COND_READY]
+        assert ready_condition["status"] == expected_ready
+        assert ready_condition["reason"] == expected_reason
+
+        blocked_condition = ct[COND_BLOCKED_BY_CONCURRENCY]
+        assert blocked_condition["status"] == expected_blocked_status
+        if concurrent[0]:
+            assert blocked_condition["reason"] == "ConcurrentJobsRunning"
+            assert "job-1" in blocked_condition["message"]
+        else:
+            assert blocked_condition["reason"] == "NoConcurrentJobs"
+        if expected_reason == "BlockedByConcurrency":
+            assert "job-1" in ready_condition["message"]
+
+        # One event per changed condition, Warning for blocked or failing ones
+        assert [call["type_"] for call in emit_recorder] == expected_event_types
+
+    def test_update_schedule_conditions_no_event_on_no_change(
+        self, emit_recorder, stub_concurrent_jobs
+    ):
         """Test _update_schedule_conditions doesn't emit events when conditions don't change."""
         patch_status: dict[str, Any] = {}
         spec = {"concurrencyPolicy": "Forbid"}
@@ -340,21 +340,20 @@ class TestScheduleConditions:
             ]
         }
 
-        with patch("ansible_operator.main._check_concurrent_jobs", return_value=(False, "")):
-            with patch("ansible_operator.main._emit_event") as mock_emit:
-                _update_schedule_conditions(
-                    patch_status,
-                    "test-ns",
-                    "test-schedule",
-                    "test-uid",
-                    spec,
-                    True,
-                    True,
-                    current_status,
-                )
+        stub_concurrent_jobs((False, ""))
+        _update_schedule_conditions(
+            patch_status,
+            "test-ns",
+            "test-schedule",
+            "test-uid",
+            spec,
+            True,
+            True,
+            current_status,
+        )
 
         # Should not emit any events since conditions didn't change
-        assert mock_emit.call_count == 0
+        assert len(emit_recorder) == 0
 
         # Conditions should not be updated since they didn't change
         assert "conditions" not in patch_status
@@ -1,52 +1,47 @@
-from ansible_operator.utils.schedule import compute_computed_schedule
-
-
-def test_hourly_random_is_valid_and_stable():
-    uid = "11111111-1111-1111-1111-111111111111"
-    s1, used = compute_computed_schedule("@hourly-random", uid)
-    s2, _ = compute_computed_schedule("@hourly-random", uid)
-    assert used is True
-    assert s1 == s2
-    minute, star, *_ = s1.split()
-    assert star == "*"
-    assert 0 <= int(minute) <= 59
-
+import re
 
-def test_daily_random_is_valid():
-    uid = "22222222-2222-2222-2222-222222222222"
-    s, used = compute_computed_schedule("@daily-random", uid)
-    assert used is True
-    minute, hour, *_ = s.split()
-    assert 0 <= int(minute) <= 59
-    assert 0 <= int(hour) <= 23
-
-
-def test_weekly_random_is_valid():
-    uid = "33333333-3333-3333-3333-333333333333"
-    s, used = compute_computed_schedule("@weekly-random", uid)
-    assert used is True
-    minute, hour, _, _, dow = s.split()
-    assert 0 <= int(minute) <= 59
-    assert 0 <= int(hour) <= 23
-    assert 0 <= int(dow) <= 6
+import pytest
 
+from ansible_operator.utils.schedule import compute_computed_schedule
 
-def test_monthly_random_is_valid():
-    uid = "44444444-4444-4444-4444-444444444444"
-    s, used = compute_computed_schedule("@monthly-random", uid)
+# Valid values of each randomized cron field, written without leading zeros
+_MINUTE = r"(?:[1-5]?\d)"
+_HOUR = r"(?:1?\d|2[0-3])"
+_DAY_OF_MONTH = r"(?:[1-9]|1\d|2[0-8])"
+_MONTH = r"(?:[1-9]|1[0-2])"
+_DAY_OF_WEEK = r"(?:[0-6])"
+
+_PATTERNS = {
+    "@hourly-random": re.compile(rf"{_MINUTE} \* \* \* \*"),
+    "@daily-random": re.compile(rf"{_MINUTE} {_HOUR} \* \* \*"),
+    "@weekly-random": re.compile(rf"{_MINUTE} {_HOUR} \* \* {_DAY_OF_WEEK}"),
+    "@monthly-random": re.compile(rf"{_MINUTE} {_HOUR} {_DAY_OF_MONTH} \* \*"),
+    "@yearly-random": re.compile(rf"{_MINUTE} {_HOUR} {_DAY_OF_MONTH} {_MONTH} \*"),
+}
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        ("@hourly-random", "11111111-1111-1111-1111-111111111111"),
+        ("@daily-random", "22222222-2222-2222-2222-222222222222"),
+        ("@weekly-random", "33333333-3333-3333-3333-333333333333"),
+        ("@monthly-random", "44444444-4444-4444-4444-444444444444"),
+        ("@yearly-random", "55555555-5555-5555-5555-555555555555"),
+    ],
+    ids=lambda param: param[0],
+)
+def macro_case(request: pytest.FixtureRequest) -> tuple[str, str]:
+    return request.param
+
+
+def test_random_macro_is_valid(macro_case: tuple[str, str]) -> None:
+    macro, uid = macro_case
+    schedule, used = compute_computed_schedule(macro, uid)
     assert used is True
-    minute, hour, dom, *_ = s.split()
-    assert 0 <= int(minute) <= 59
-    assert 0 <= int(hour) <= 23
-    assert 1 <= int(dom) <= 28
+    assert _PATTERNS[macro].fullmatch(schedule), schedule
 
 
-def test_yearly_random_is_valid():
-    uid = "55555555-5555-5555-5555-555555555555"
-    s, used = compute_computed_schedule("@yearly-random", uid)
-    assert used is True
-    minute, hour, dom, month, _ = s.split()
-    assert 0 <= int(minute) <= 59
-    assert 0 <= int(hour) <= 23
-    assert 1 <= int(dom) <= 28
-    assert 1 <= int(month) <= 12
+def test_random_macro_is_stable(macro_case: tuple[str, str]) -> None:
+    macro, uid = macro_case
+    assert compute_computed_schedule(macro, uid) == compute_computed_schedule(macro, uid)
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+from types import MappingProxyType
+from unittest.mock import Mock
 from typing import Any
 
+import kopf
 import pytest
+from kubernetes.client.exceptions import ApiException
 
 from ansible_operator.constants import (
     API_GROUP,
@@ -14,296 +17,361 @@ from ansible_operator.constants import (
     LABEL_OWNER_NAME,
     LABEL_OWNER_UID,
 )
+from ansible_operator import main as _main
 from ansible_operator.main import handle_cronjob_event, handle_schedule_job_event
+from ansible_operator.services.status_patches import MAX_RETRIES, StatusPatchService
+
+# Labels tying a CronJob or Job to the test Schedule
+_OWNER_LABELS = MappingProxyType(
+    {
+        LABEL_MANAGED_BY: "ansible-operator",
+        LABEL_OWNER_UID: "schedule-uid-123",
+        LABEL_OWNER_NAME: "test-namespace.test-schedule",
+    }
+)
+
+
+def _cronjob_event(
+    *,
+    labels: dict[str, str] | None = None,
+    status: dict[str, Any] | None = None,
+    **metadata: Any,
+) -> dict[str, Any]:
+    """Build an event for a CronJob owned by the test Schedule.
+
+    ``labels`` and ``status`` replace the defaults; other keyword arguments are
+    added to the metadata.
+    """
+    return {
+        "object": {
+            "metadata": {"labels": dict(_OWNER_LABELS) if labels is None else labels, **metadata},
+            "status": {"lastScheduleTime": "2024-01-01T12:00:00Z"} if status is None else status,
+        }
+    }
+
+
+def _job_event(
+    *,
+    name: str = "test-schedule-1234567890",
+    created: str = "2024-01-01T12:00:00Z",
+    labels: dict[str, str] | None = None,
+    status: dict[str, Any] | None = None,
+    **metadata: Any,
+) -> dict[str, Any]:
+    """Build an event for a Job created for the test Schedule, like ``_cronjob_event``."""
+    return {
+        "object": {
+            "metadata": {
+                "name": name,
+                "creationTimestamp": created,
+                "labels": dict(_OWNER_LABELS) if labels is None else labels,
+                **metadata,
+            },
+            "status": {} if status is None else status,
+        }
+    }
+
+
+def _registered_labels(fn: Any) -> list[Any]:
+    """Return the label filters of the Kopf event handlers registered for ``fn``."""
+    handlers = kopf.get_default_registry()._watching.get_all_handlers()
+    return [handler.labels for handler in handlers if handler.fn is fn]
+
+
+def _ops_by_path(body: Any) -> dict[str, Any]:
+    """Map the JSON Patch operations of a status patch body to their values by path."""
+    assert isinstance(body, list)
+    assert all(op["op"] == "add" for op in body)
+    return {op["path"]: op["value"] for op in body}
+
+
+@pytest.fixture(autouse=True)
+def mock_api(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """CustomObjectsApi the handlers read Schedules from and the flushes write to.
+
+    The concurrent Job lookup and event emission behind the condition update are
+    stubbed as well, so no handler reaches a real API client.
+    """
+    api = Mock()
+    monkeypatch.setattr("ansible_operator.main._custom_api", lambda: api)
+    monkeypatch.setattr(_main, "_check_concurrent_jobs", Mock(return_value=(False, "")))
+    monkeypatch.setattr(_main, "_emit_event", Mock())
+    return api
+
+
+@pytest.fixture(autouse=True)
+def status_patches(monkeypatch: pytest.MonkeyPatch) -> StatusPatchService:
+    """Give each test an empty status patch queue that it flushes itself."""
+    service = StatusPatchService(retry_backoff=0)
+    monkeypatch.setattr("ansible_operator.main.status_patch_service", service)
+    monkeypatch.setattr("ansible_operator.main._LAST_STATUS_SENT", {})
+    return service
 
 
 class TestScheduleStatusUpdates:
     """Test cases for Schedule status field updates."""
 
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_cronjob_event_updates_status_fields(self, mock_api_class: Mock) -> None:
+    def test_handle_cronjob_event_updates_status_fields(
+        self, mock_api: Mock, status_patches: StatusPatchService
+    ) -> None:
         """Test that CronJob events update Schedule status fields."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-
         # Mock CronJob event
-        cronjob_event = {
-            "object": {
-                "metadata": {
-                    "labels": {
-                        LABEL_MANAGED_BY: "ansible-operator",
-                        LABEL_OWNER_UID: "schedule-uid-123",
-                        LABEL_OWNER_NAME: "test-namespace.test-schedule",
-                    }
-                },
-                "status": {
-                    "lastScheduleTime": "2024-01-01T12:00:00Z",
-                    "nextScheduleTime": "2024-01-01T13:00:00Z",
-                },
+        cronjob_event = _cronjob_event(
+            status={
+                "lastScheduleTime": "2024-01-01T12:00:00Z",
+                "nextScheduleTime": "2024-01-01T13:00:00Z",
             }
-        }
+        )
 
         # Call the handler
         handle_cronjob_event(cronjob_event)
+        status_patches.flush(mock_api)
 
         # Verify API call
         mock_api.patch_namespaced_custom_object_status.assert_called_once()
         call_args = mock_api.patch_namespaced_custom_object_status.call_args
 
-        assert call_args[1]["group"] == API_GROUP
-        assert call_args[1]["version"] == "v1alpha1"
-        assert call_args[1]["namespace"] == "test-namespace"
-        assert call_args[1]["plural"] == "schedules"
-        assert call_args[1]["name"] == "test-schedule"
+        assert call_args.kwargs["group"] == API_GROUP
+        assert call_args.kwargs["version"] == "v1alpha1"
+        assert call_args.kwargs["namespace"] == "test-namespace"
+        assert call_args.kwargs["plural"] == "schedules"
+        assert call_args.kwargs["name"] == "test-schedule"
 
         # Verify status fields
-        patch_body = call_args[1]["body"]
-        assert patch_body["status"]["lastRunTime"] == "2024-01-01T12:00:00Z"
-        assert patch_body["status"]["nextRunTime"] == "2024-01-01T13:00:00Z"
-
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_cronjob_event_ignores_non_managed_cronjobs(self, mock_api_class: Mock) -> None:
-        """Test that non-managed CronJobs are ignored."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-
-        # Mock CronJob event without ansible-operator label
-        cronjob_event = {
-            "object": {
-                "metadata": {
-                    "labels": {
-                        LABEL_MANAGED_BY: "other-operator",
-                        LABEL_OWNER_UID: "schedule-uid-123",
-                        LABEL_OWNER_NAME: "test-namespace.test-schedule",
-                    }
-                },
-                "status": {
-                    "lastScheduleTime": "2024-01-01T12:00:00Z",
-                },
-            }
-        }
-
-        # Call the handler
-        handle_cronjob_event(cronjob_event)
+        patch_ops = _ops_by_path(call_args.kwargs["body"])
+        assert patch_ops["/status/lastRunTime"] == "2024-01-01T12:00:00Z"
+        assert patch_ops["/status/nextRunTime"] == "2024-01-01T13:00:00Z"
 
-        # Verify no API call was made
-        mock_api.patch_namespaced_custom_object_status.assert_not_called()
+    def test_handle_cronjob_event_ignores_non_managed_cronjobs(self) -> None:
+        """Test that only managed CronJobs are dispatched to the handler."""
+        assert _registered_labels(handle_cronjob_event) == [{LABEL_MANAGED_BY: "ansible-operator"}]
 
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_cronjob_event_handles_missing_labels(self, mock_api_class: Mock) -> None:
+    def test_handle_cronjob_event_handles_missing_labels(
+        self, mock_api: Mock, status_patches: StatusPatchService
+    ) -> None:
         """Test that CronJobs without required labels are ignored."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-
         # Mock CronJob event without owner labels
-        cronjob_event = {
-            "object": {
-                "metadata": {
-                    "labels": {
-                        LABEL_MANAGED_BY: "ansible-operator",
-                    }
-                },
-                "status": {
-                    "lastScheduleTime": "2024-01-01T12:00:00Z",
-                },
-            }
-        }
+        cronjob_event = _cronjob_event(labels={LABEL_MANAGED_BY: "ansible-operator"})
 
         # Call the handler
         handle_cronjob_event(cronjob_event)
+        status_patches.flush(mock_api)
 
         # Verify no API call was made
         mock_api.patch_namespaced_custom_object_status.assert_not_called()
 
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_schedule_job_event_updates_status_fields(self, mock_api_class: Mock) -> None:
+    def test_handle_schedule_job_event_updates_status_fields(
+        self, mock_api: Mock, status_patches: StatusPatchService
+    ) -> None:
         """Test that Job events update Schedule status fields."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-
         # Mock Job event
-        job_event = {
-            "object": {
-                "metadata": {
-                    "name": "test-schedule-1234567890",
-                    "creationTimestamp": "2024-01-01T12:00:00Z",
-                    "labels": {
-                        LABEL_MANAGED_BY: "ansible-operator",
-                        LABEL_OWNER_UID: "schedule-uid-123",
-                        LABEL_OWNER_NAME: "test-namespace.test-schedule",
-                    },
-                    "annotations": {
-                        "ansible.cloud37.dev/revision": "abc123def456",
-                    },
-                },
-                "status": {
-                    "succeeded": 1,
-                },
-            }
-        }
+        job_event = _job_event(
+            status={"succeeded": 1},
+            annotations={"ansible.cloud37.dev/revision": "abc123def456"},
+        )
 
         # Call the handler
         handle_schedule_job_event(job_event)
+        status_patches.flush(mock_api)
 
         # Verify API call
         mock_api.patch_namespaced_custom_object_status.assert_called_once()
         call_args = mock_api.patch_namespaced_custom_object_status.call_args
 
-        assert call_args[1]["group"] == API_GROUP
-        assert call_args[1]["version"] == "v1alpha1"
-        assert call_args[1]["namespace"] == "test-namespace"
-        assert call_args[1]["plural"] == "schedules"
-        assert call_args[1]["name"] == "test-schedule"
+        assert call_args.kwargs["group"] == API_GROUP
+        assert call_args.kwargs["version"] == "v1alpha1"
+        assert call_args.kwargs["namespace"] == "test-namespace"
+        assert call_args.kwargs["plural"] == "schedules"
+        assert call_args.kwargs["name"] == "test-schedule"
 
         # Verify status fields
-        patch_body = call_args[1]["body"]
-        assert patch_body["status"]["lastJobRef"] == "test-namespace/test-schedule-1234567890"
-        assert patch_body["status"]["lastRunTime"] == "2024-01-01T12:00:00Z"
-        assert patch_body["status"]["lastRunRevision"] == "abc123def456"
-
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_schedule_job_event_ignores_connectivity_probe_jobs(
-        self, mock_api_class: Mock
+        patch_ops = _ops_by_path(call_args.kwargs["body"])
+        assert patch_ops["/status/lastJobRef"] == "test-namespace/test-schedule-1234567890"
+        assert patch_ops["/status/lastRunTime"] == "2024-01-01T12:00:00Z"
+        assert patch_ops["/status/lastRunRevision"] == "abc123def456"
+
+    def test_handle_schedule_job_event_ignores_probe_and_non_managed_jobs(self) -> None:
+        """Test that only managed, non-probe Jobs are dispatched to the handler.
+
+        The registration filter is the only probe check; the handler does not repeat it.
+        """
+        assert _registered_labels(handle_schedule_job_event) == [
+            {LABEL_MANAGED_BY: "ansible-operator", "ansible.cloud37.dev/probe-type": kopf.ABSENT}
+        ]
+
+    def test_handle_schedule_job_event_handles_missing_revision(
+        self, mock_api: Mock, status_patches: StatusPatchService
     ) -> None:
-        """Test that connectivity probe Jobs are ignored."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-
-        # Mock Job event for connectivity probe
-        job_event = {
-            "object": {
-                "metadata": {
-                    "name": "test-repo-probe",
-                    "labels": {
-                        LABEL_MANAGED_BY: "ansible-operator",
-                        "ansible.cloud37.dev/probe-type": "connectivity",
-                        LABEL_OWNER_UID: "schedule-uid-123",
-                        LABEL_OWNER_NAME: "test-namespace.test-schedule",
-                    },
-                }
-            }
-        }
-
-        # Call the handler
-        handle_schedule_job_event(job_event)
-
-        # Verify no API call was made
-        mock_api.patch_namespaced_custom_object_status.assert_not_called()
-
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_schedule_job_event_ignores_non_managed_jobs(self, mock_api_class: Mock) -> None:
-        """Test that non-managed Jobs are ignored."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-
-        # Mock Job event without ansible-operator label
-        job_event = {
-            "object": {
-                "metadata": {
-                    "name": "test-schedule-1234567890",
-                    "labels": {
-                        LABEL_MANAGED_BY: "other-operator",
-                        LABEL_OWNER_UID: "schedule-uid-123",
-                        LABEL_OWNER_NAME: "test-namespace.test-schedule",
-                    },
-                }
-            }
-        }
-
-        # Call the handler
-        handle_schedule_job_event(job_event)
-
-        # Verify no API call was made
-        mock_api.patch_namespaced_custom_object_status.assert_not_called()
-
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_schedule_job_event_handles_missing_revision(self, mock_api_class: Mock) -> None:
         """Test that Jobs without revision annotation are handled gracefully."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-
         # Mock Job event without revision annotation
-        job_event = {
-            "object": {
-                "metadata": {
-                    "name": "test-schedule-1234567890",
-                    "creationTimestamp": "2024-01-01T12:00:00Z",
-                    "labels": {
-                        LABEL_MANAGED_BY: "ansible-operator",
-                        LABEL_OWNER_UID: "schedule-uid-123",
-                        LABEL_OWNER_NAME: "test-namespace.test-schedule",
-                    },
-                    "annotations": {},
-                }
-            }
-        }
+        job_event = _job_event(annotations={})
 
         # Call the handler
         handle_schedule_job_event(job_event)
+        status_patches.flush(mock_api)
 
         # Verify API call
         mock_api.patch_namespaced_custom_object_status.assert_called_once()
         call_args = mock_api.patch_namespaced_custom_object_status.call_args
 
         # Verify status fields (revision should be missing)
-        patch_body = call_args[1]["body"]
-        assert patch_body["status"]["lastJobRef"] == "test-namespace/test-schedule-1234567890"
-        assert patch_body["status"]["lastRunTime"] == "2024-01-01T12:00:00Z"
-        assert "lastRunRevision" not in patch_body["status"]
+        patch_ops = _ops_by_path(call_args.kwargs["body"])
+        assert patch_ops["/status/lastJobRef"] == "test-namespace/test-schedule-1234567890"
+        assert patch_ops["/status/lastRunTime"] == "2024-01-01T12:00:00Z"
+        assert "/status/lastRunRevision" not in patch_ops
 
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_cronjob_event_handles_api_exception(self, mock_api_class: Mock) -> None:
+    def test_handle_cronjob_event_handles_api_exception(
+        self, mock_api: Mock, status_patches: StatusPatchService
+    ) -> None:
         """Test that API exceptions are handled gracefully."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-        mock_api.patch_namespaced_custom_object_status.side_effect = Exception("API Error")
+        mock_api.patch_namespaced_custom_object_status.side_effect = ApiException(status=500)
 
         # Mock CronJob event
-        cronjob_event = {
-            "object": {
-                "metadata": {
-                    "labels": {
-                        LABEL_MANAGED_BY: "ansible-operator",
-                        LABEL_OWNER_UID: "schedule-uid-123",
-                        LABEL_OWNER_NAME: "test-namespace.test-schedule",
-                    }
-                },
-                "status": {
-                    "lastScheduleTime": "2024-01-01T12:00:00Z",
-                },
-            }
-        }
+        cronjob_event = _cronjob_event()
 
         # Call the handler - should not raise exception
         handle_cronjob_event(cronjob_event)
+        status_patches.flush(mock_api)
 
-        # Verify API call was attempted
-        mock_api.patch_namespaced_custom_object_status.assert_called_once()
+        # Verify the server error was retried before giving up
+        assert mock_api.patch_namespaced_custom_object_status.call_count == MAX_RETRIES + 1
 
-    @patch("ansible_operator.main.client.CustomObjectsApi")
-    def test_handle_schedule_job_event_handles_api_exception(self, mock_api_class: Mock) -> None:
+    def test_handle_schedule_job_event_handles_api_exception(
+        self, mock_api: Mock, status_patches: StatusPatchService
+    ) -> None:
         """Test that API exceptions are handled gracefully."""
-        mock_api = Mock()
-        mock_api_class.return_value = mock_api
-        mock_api.patch_namespaced_custom_object_status.side_effect = Exception("API Error")
+        mock_api.patch_namespaced_custom_object_status.side_effect = ApiException(status=500)
 
         # Mock Job event
-        job_event = {
-            "object": {
-                "metadata": {
-                    "name": "test-schedule-1234567890",
-                    "creationTimestamp": "2024-01-01T12:00:00Z",
-                    "labels": {
-                        LABEL_MANAGED_BY: "ansible-operator",
-                        LABEL_OWNER_UID: "schedule-uid-123",
-                        LABEL_OWNER_NAME: "test-namespace.test-schedule",
-                    },
-                }
-            }
-        }
+        job_event = _job_event()
 
         # Call the handler - should not raise exception
         handle_schedule_job_event(job_event)
+        status_patches.flush(mock_api)
+
+        # Verify the server error was retried before giving up
+        assert mock_api.patch_namespaced_custom_object_status.call_count == MAX_RETRIES + 1
+
+    def test_handle_cronjob_event_skips_when_unchanged(
+        self, mock_api: Mock, status_patches: StatusPatchService
+    ) -> None:
+        """Test that an event repeating the status already sent queues no patch."""
+        # No CronJob UID, so only the sent-status comparison can skip the repeat
+        cronjob_event = _cronjob_event(
+            status={
+                "lastScheduleTime": "2024-01-01T12:00:00Z",
+                "nextScheduleTime": "2024-01-01T13:00:00Z",
+            }
+        )
+
+        handle_cronjob_event(cronjob_event)
+        status_patches.flush(mock_api)
+        handle_cronjob_event(cronjob_event)
+        status_patches.flush(mock_api)
 
-        # Verify API call was attempted
         mock_api.patch_namespaced_custom_object_status.assert_called_once()
+        # Both events are compared against fresh conditions from the stubbed lookup
+        assert _main._check_concurrent_jobs.call_count == 2
+
+    def test_handle_cronjob_event_resends_after_failed_patch(
+        self, mock_api: Mock, status_patches: StatusPatchService
+    ) -> None:
+        """Test that a status whose patch failed is not treated as already sent."""
+        mock_api.patch_namespaced_custom_object_status.side_effect = [
+            ApiException(status=403),
+            None,
+        ]
+        cronjob_event = _cronjob_event(
+            status={
+                "lastScheduleTime": "2024-01-01T12:00:00Z",
+                "nextScheduleTime": "2024-01-01T13:00:00Z",
+            }
+        )
+
+        handle_cronjob_event(cronjob_event)
+        assert status_patches.flush(mock_api) == 0
+        handle_cronjob_event(cronjob_event)
+        assert status_patches.flush(mock_api) == 1
+
+        assert mock_api.patch_namespaced_custom_object_status.call_count == 2
+        assert _main._check_concurrent_jobs.call_count == 2
+
+    @pytest.mark.parametrize(
+        "next_schedule_time,expected_patches",
+        [
+            pytest.param("2024-01-01T13:00:00Z", 1, id="unchanged"),
+            pytest.param("2024-01-01T14:00:00Z", 2, id="advanced"),
+        ],
+    )
+    def test_handle_cronjob_event_only_patches_when_schedule_times_change(
+        self,
+        mock_api: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+        status_patches: StatusPatchService,
+        next_schedule_time: str,
+        expected_patches: int,
+    ) -> None:
+        """Test that repeated CronJob events with the same schedule times are skipped."""
+        monkeypatch.setattr("ansible_operator.main._CRONJOB_SCHEDULE_TIMES", {})
+
+        def cronjob_event(next_run: str) -> dict[str, Any]:
+            return {
+                "type": "MODIFIED",
+                **_cronjob_event(
+                    uid="cronjob-uid-123",
+                    status={
+                        "lastScheduleTime": "2024-01-01T12:00:00Z",
+                        "nextScheduleTime": next_run,
+                    },
+                ),
+            }
+
+        handle_cronjob_event(cronjob_event("2024-01-01T13:00:00Z"))
+        status_patches.flush(mock_api)
+        handle_cronjob_event(cronjob_event(next_schedule_time))
+        status_patches.flush(mock_api)
+
+        assert mock_api.patch_namespaced_custom_object_status.call_count == expected_patches
+        # A skipped event does not look up the Schedule's Jobs either
+        assert _main._check_concurrent_jobs.call_count == expected_patches
+
+    def test_handle_cronjob_event_retries_schedule_times_after_failed_patch(
+        self, mock_api: Mock, monkeypatch: pytest.MonkeyPatch, status_patches: StatusPatchService
+    ) -> None:
+        """Test that schedule times whose patch failed are not recorded as copied."""
+        schedule_times: dict[str, Any] = {}
+        monkeypatch.setattr("ansible_operator.main._CRONJOB_SCHEDULE_TIMES", schedule_times)
+        mock_api.patch_namespaced_custom_object_status.side_effect = [
+            ApiException(status=403),
+            None,
+        ]
+        cronjob_event = {"type": "MODIFIED", **_cronjob_event(uid="cronjob-uid-123")}
+
+        handle_cronjob_event(cronjob_event)
+        status_patches.flush(mock_api)
+        assert schedule_times == {}
+
+        handle_cronjob_event(cronjob_event)
+        status_patches.flush(mock_api)
+
+        assert mock_api.patch_namespaced_custom_object_status.call_count == 2
+        assert _main._check_concurrent_jobs.call_count == 2
+        assert schedule_times == {"cronjob-uid-123": ("2024-01-01T12:00:00Z", None)}
+
+    def test_job_events_for_one_schedule_are_coalesced(
+        self, mock_api: Mock, status_patches: StatusPatchService
+    ) -> None:
+        """Test that Job events for the same Schedule within one window produce one patch."""
+        handle_schedule_job_event(_job_event(name="test-schedule-1"))
+        handle_schedule_job_event(
+            _job_event(name="test-schedule-2", created="2024-01-01T13:00:00Z")
+        )
+        mock_api.patch_namespaced_custom_object_status.assert_not_called()
+
+        assert status_patches.flush(mock_api) == 1
+        patch_ops = _ops_by_path(
+            mock_api.patch_namespaced_custom_object_status.call_args.kwargs["body"]
+        )
+        assert patch_ops["/status/lastJobRef"] == "test-namespace/test-schedule-2"
+        assert patch_ops["/status/lastRunTime"] == "2024-01-01T13:00:00Z"
+        assert _main._check_concurrent_jobs.call_count == 2
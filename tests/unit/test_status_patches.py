@@ -0,0 +1,251 @@
+"""Unit tests for the coalescing status patch service."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from unittest.mock import Mock
+
+from kubernetes.client.exceptions import ApiException
+
+from ansible_operator.constants import API_GROUP
+from ansible_operator.services.status_patches import MAX_RETRIES, StatusPatchService
+
+
+class TestStatusPatchService:
+    """Test status patch queueing and flushing."""
+
+    def test_flush_writes_queued_patch(self) -> None:
+        """Test that a queued patch is written with the operator field manager."""
+        service = StatusPatchService()
+        api = Mock()
+
+        service.enqueue("schedules", "test-namespace", "test-schedule", {"nextRunTime": "t1"})
+        written = service.flush(api)
+
+        assert written == 1
+        api.patch_namespaced_custom_object_status.assert_called_once_with(
+            group=API_GROUP,
+            version="v1alpha1",
+            namespace="test-namespace",
+            plural="schedules",
+            name="test-schedule",
+            body=[{"op": "add", "path": "/status/nextRunTime", "value": "t1"}],
+            field_manager="ansible-operator",
+            _content_type="application/json-patch+json",
+        )
+        assert service.pending() == {}
+
+    def test_enqueues_for_same_object_coalesce_into_one_call(self) -> None:
+        """Test that two enqueues within one window produce a single API call."""
+        service = StatusPatchService()
+        api = Mock()
+
+        service.enqueue("schedules", "test-namespace", "test-schedule", {"nextRunTime": "t1"})
+        service.enqueue(
+            "schedules",
+            "test-namespace",
+            "test-schedule",
+            {"nextRunTime": "t2", "lastRunTime": "t0"},
+        )
+        service.flush(api)
+
+        api.patch_namespaced_custom_object_status.assert_called_once()
+        body = api.patch_namespaced_custom_object_status.call_args.kwargs["body"]
+        assert body == [
+            {"op": "add", "path": "/status/nextRunTime", "value": "t2"},
+            {"op": "add", "path": "/status/lastRunTime", "value": "t0"},
+        ]
+
+    def test_different_objects_are_patched_separately(self) -> None:
+        """Test that patches for different objects are not merged."""
+        service = StatusPatchService()
+        api = Mock()
+
+        service.enqueue("schedules", "test-namespace", "schedule-a", {"nextRunTime": "t1"})
+        service.enqueue("schedules", "test-namespace", "schedule-b", {"nextRunTime": "t1"})
+
+        assert service.flush(api) == 2
+        assert api.patch_namespaced_custom_object_status.call_count == 2
+
+    def test_flush_without_pending_patches_skips_api(self) -> None:
+        """Test that an empty flush makes no API calls."""
+        service = StatusPatchService()
+        api = Mock()
+
+        assert service.flush(api) == 0
+        api.patch_namespaced_custom_object_status.assert_not_called()
+
+    def test_flush_continues_after_failed_patch(self) -> None:
+        """Test that one failed write does not block the others."""
+        service = StatusPatchService()
+        api = Mock()
+        api.patch_namespaced_custom_object_status.side_effect = [Exception("API Error"), None]
+
+        service.enqueue("schedules", "test-namespace", "schedule-a", {"nextRunTime": "t1"})
+        service.enqueue("schedules", "test-namespace", "schedule-b", {"nextRunTime": "t1"})
+
+        assert service.flush(api) == 1
+        assert api.patch_namespaced_custom_object_status.call_count == 2
+
+    def test_resource_version_is_sent_as_precondition(self) -> None:
+        """Test that a queued resourceVersion is sent in a merge patch's metadata."""
+        service = StatusPatchService()
+        api = Mock()
+
+        service.enqueue(
+            "schedules",
+            "test-namespace",
+            "test-schedule",
+            {"nextRunTime": "t1"},
+            resource_version="42",
+        )
+        service.flush(api)
+
+        kwargs = api.patch_namespaced_custom_object_status.call_args.kwargs
+        assert kwargs["body"] == {
+            "metadata": {"resourceVersion": "42"},
+            "status": {"nextRunTime": "t1"},
+        }
+        assert kwargs["_content_type"] == "application/merge-patch+json"
+
+    def test_flush_skips_on_conflict(self) -> None:
+        """Test that a 409 conflict drops the patch without retrying or raising."""
+        service = StatusPatchService()
+        api = Mock()
+        api.patch_namespaced_custom_object_status.side_effect = ApiException(status=409)
+
+        service.enqueue(
+            "schedules",
+            "test-namespace",
+            "test-schedule",
+            {"nextRunTime": "t1"},
+            resource_version="42",
+        )
+
+        assert service.flush(api) == 0
+        assert service.flush(api) == 0
+        api.patch_namespaced_custom_object_status.assert_called_once()
+        assert service.pending() == {}
+
+    def test_conditional_and_unconditional_patches_are_flushed_separately(self) -> None:
+        """Test that mixing both kinds for one object keeps each precondition intact."""
+        service = StatusPatchService()
+        api = Mock()
+        api.patch_namespaced_custom_object_status.side_effect = [ApiException(status=409), None]
+
+        service.enqueue(
+            "schedules",
+            "test-namespace",
+            "test-schedule",
+            {"lastJobRef": "test-namespace/job-1"},
+        )
+        service.enqueue(
+            "schedules",
+            "test-namespace",
+            "test-schedule",
+            {"nextRunTime": "t1"},
+            resource_version="42",
+        )
+        service.enqueue(
+            "schedules",
+            "test-namespace",
+            "test-schedule",
+            {"lastRunTime": "t0"},
+        )
+
+        # The conditional patch conflicts; the unconditional fields are still written
+        assert service.flush(api) == 1
+        conditional, unconditional = (
+            call.kwargs for call in api.patch_namespaced_custom_object_status.call_args_list
+        )
+        assert conditional["body"] == {
+            "metadata": {"resourceVersion": "42"},
+            "status": {"nextRunTime": "t1"},
+        }
+        assert unconditional["body"] == [
+            {"op": "add", "path": "/status/lastJobRef", "value": "test-namespace/job-1"},
+            {"op": "add", "path": "/status/lastRunTime", "value": "t0"},
+        ]
+        assert unconditional["_content_type"] == "application/json-patch+json"
+
+    def test_on_success_runs_only_after_written_patch(self) -> None:
+        """Test that success callbacks run for written patches and not for failed ones."""
+        service = StatusPatchService(retry_backoff=0)
+        api = Mock()
+        api.patch_namespaced_custom_object_status.side_effect = [None, ApiException(status=403)]
+        written, failed = Mock(), Mock()
+
+        service.enqueue(
+            "schedules", "test-namespace", "schedule-a", {"nextRunTime": "t1"}, on_success=written
+        )
+        service.enqueue(
+            "schedules", "test-namespace", "schedule-b", {"nextRunTime": "t1"}, on_success=failed
+        )
+        service.flush(api)
+
+        written.assert_called_once_with()
+        failed.assert_not_called()
+
+    def test_flush_retries_rate_limited_patch(self) -> None:
+        """Test that a 429 is retried until the retry budget is used up."""
+        service = StatusPatchService(retry_backoff=0)
+        api = Mock()
+        api.patch_namespaced_custom_object_status.side_effect = ApiException(status=429)
+
+        service.enqueue("schedules", "test-namespace", "test-schedule", {"nextRunTime": "t1"})
+
+        assert service.flush(api) == 0
+        assert api.patch_namespaced_custom_object_status.call_count == MAX_RETRIES + 1
+
+    def test_flush_recovers_from_transient_server_error(self) -> None:
+        """Test that a patch succeeding after a 503 counts as written."""
+        service = StatusPatchService(retry_backoff=0)
+        api = Mock()
+        api.patch_namespaced_custom_object_status.side_effect = [ApiException(status=503), None]
+
+        service.enqueue("schedules", "test-namespace", "test-schedule", {"nextRunTime": "t1"})
+
+        assert service.flush(api) == 1
+        assert api.patch_namespaced_custom_object_status.call_count == 2
+
+    def test_flush_does_not_retry_client_errors(self) -> None:
+        """Test that a 403 is not retried."""
+        service = StatusPatchService(retry_backoff=0)
+        api = Mock()
+        api.patch_namespaced_custom_object_status.side_effect = ApiException(status=403)
+
+        service.enqueue("schedules", "test-namespace", "test-schedule", {"nextRunTime": "t1"})
+
+        assert service.flush(api) == 0
+        api.patch_namespaced_custom_object_status.assert_called_once()
+
+    def test_flush_falls_back_to_merge_patch_without_status(self) -> None:
+        """Test that a JSON Patch rejected because .status is missing is sent as a merge patch."""
+        service = StatusPatchService(retry_backoff=0)
+        api = Mock()
+        api.patch_namespaced_custom_object_status.side_effect = [ApiException(status=422), None]
+
+        service.enqueue("schedules", "test-namespace", "test-schedule", {"nextRunTime": "t1"})
+
+        assert service.flush(api) == 1
+        kwargs = api.patch_namespaced_custom_object_status.call_args.kwargs
+        assert kwargs["body"] == {"status": {"nextRunTime": "t1"}}
+        assert kwargs["_content_type"] == "application/merge-patch+json"
+
+    def test_run_flushes_pending_patches_on_cancel(self) -> None:
+        """Test that the background flusher writes queued patches before stopping."""
+        service = StatusPatchService(flush_interval=3600)
+        api = Mock()
+        service.enqueue("schedules", "test-namespace", "test-schedule", {"nextRunTime": "t1"})
+
+        async def run_and_cancel() -> None:
+            task = asyncio.create_task(service.run(lambda: api))
+            await asyncio.sleep(0)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run_and_cancel())
+
+        api.patch_namespaced_custom_object_status.assert_called_once()